@@ -15,6 +15,8 @@ class ActionProvider(ABC):
         print(f"ActionProvider init")
         self.name = name
         self.is_running = False
+        # sim seconds per get_action for providers that step the sim themselves, None when env.step does
+        self.sim_dt: Optional[float] = None
         self._thread = None
     
     @abstractmethod
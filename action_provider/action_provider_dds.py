@@ -3,7 +3,7 @@
 from action_provider.action_base import ActionProvider
 from typing import Optional
 import torch
-from dds.dds_master import dds_manager
+from tools.sim_context import get_sim_context
 class DDSActionProvider(ActionProvider):
     """Action provider based on DDS"""
     
@@ -28,14 +28,16 @@ class DDSActionProvider(ActionProvider):
         print(f"enable_gripper: {self.enable_gripper}")
         print(f"enable_dex3: {self.enable_dex3}")
         try:
+            # the DDS objects registered by create_dds_objects, looked up through the sim context
+            context = get_sim_context()
             if self.enable_robot == "g129":
-                self.robot_dds = dds_manager.get_object("g129")
+                self.robot_dds = context.get_dds_object("g129")
             if self.enable_gripper:
-                self.gripper_dds = dds_manager.get_object("dex1")
+                self.gripper_dds = context.get_dds_object("dex1")
             elif self.enable_dex3:
-                self.dex3_dds = dds_manager.get_object("dex3")
+                self.dex3_dds = context.get_dds_object("dex3")
             elif self.enable_inspire:
-                self.inspire_dds = dds_manager.get_object("inspire")
+                self.inspire_dds = context.get_dds_object("inspire")
             print(f"[{self.name}] DDS communication initialized")
         except Exception as e:
             print(f"[{self.name}] DDS initialization failed: {e}")
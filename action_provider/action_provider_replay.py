@@ -4,8 +4,13 @@ from action_provider.action_base import ActionProvider
 from typing import Optional
 import torch
 from tools.data_json_load import load_robot_data
-from image_server.shared_memory_utils import MultiImageReader
+from image_server.shared_memory_utils import MultiImageReader, split_concatenated
+from tools.camera_settings import CAMERA_ROLES
 from tools.episode_writer import EpisodeWriter
+from tools.scene_checkpoint import SceneCheckpointManager, state_to_device
+from tools.kinematic_replay import KinematicReplay
+from tools.generation_profile import load_generation_profile, GenerationStep
+import os
 import json
 from typing import List, Optional
 import numpy as np
@@ -22,6 +27,18 @@ class FileActionProviderReplay(ActionProvider):
         self.enable_inspire = args_cli.enable_inspire_dds
         self.generate_data = args_cli.generate_data
         self.generate_data_dir = args_cli.generate_data_dir
+        self.use_kinematic_replay = getattr(args_cli, "kinematic_replay", False)
+        self.kinematic_replay = None
+        self.replay_env_ids = torch.tensor([0], device=env.device)
+        # the first frame of the current episode, restored when the episode starts
+        self.scene_checkpoints = SceneCheckpointManager(env.scene, max_checkpoints=1)
+        self.replay_start_time = None
+        self.domain_randomizer = None
+        dr_config = getattr(args_cli, "domain_randomization", None)
+        if dr_config:
+            # imported here: the randomizer needs Kit (pxr, omni.usd), replay without it does not
+            from tools.domain_randomization import DomainRandomizer, load_randomization_config
+            self.domain_randomizer = DomainRandomizer(load_randomization_config(dr_config), base_seed=args_cli.dr_seed)
         self.action_index = 10**1000
         self.total_step_num =0
         self.start_loop = True
@@ -30,6 +47,7 @@ class FileActionProviderReplay(ActionProvider):
         self.joint_to_index = {name: i for i, name in enumerate(self.all_joint_names)}
         self._setup_joint_mapping()
         self.multi_image_reader=None
+        self._last_images = ({}, {})
         self.recorder=None
         if self.generate_data:
             try:
@@ -40,26 +58,46 @@ class FileActionProviderReplay(ActionProvider):
                 print(f"[{self.name}] Image data saving will be disabled")
                 self.multi_image_reader = None
             
-            self.recorder = EpisodeWriter(task_dir = self.generate_data_dir, frequency = 30, rerun_log = True)
+            self.generation_step = GenerationStep(env, load_generation_profile(getattr(args_cli, "generation_profile", "images")))
+            self.recorder = EpisodeWriter(task_dir = self.generate_data_dir, frequency = 30, rerun_log = args_cli.rerun_log,
+                                          image_storage = args_cli.image_storage)
         print(f"FileActionProviderReplay init ok")
     def load_data(self, file_path):
         """Setup DDS communication"""
         self.robot_action, self.hand_action, self.sim_state_list,self.task_name_list,self.sim_state_json_list = load_robot_data(file_path)
+        # move the per-frame states to the sim device once instead of on every reset_to
+        self.sim_state_list = [state_to_device(sim_state, self.env.device) for sim_state in self.sim_state_list]
+        self.scene_checkpoints.save("episode_start", state=self.sim_state_list[0], is_relative=True)
+        self.kinematic_replay = None
+        if self.use_kinematic_replay:
+            self.kinematic_replay = KinematicReplay(self.env, self.sim_state_list, self.replay_env_ids, is_relative=True)
+            if not self.kinematic_replay.supported:
+                print(f"[{self.name}] kinematic replay does not support this episode, using reset_to")
+                self.kinematic_replay = None
         
         self.total_step_num = len(self.robot_action)
         self.total_hand_step_num = len(self.hand_action)
         if self.total_hand_step_num != self.total_hand_step_num:
             raise ValueError("total_hand_step_num is NaN. Please check your data or initialization.")
+        domain_randomization = None
+        if self.domain_randomizer is not None:
+            # the seed is derived from the source episode, so regenerating the dataset samples the same values
+            domain_randomization = self.domain_randomizer.randomize(key=os.path.basename(os.path.dirname(file_path)))
+            print(f"[{self.name}] domain randomization seed {domain_randomization['seed']}")
         if self.generate_data:
             # tem_sim_state  = self.sim_state_to_json(self.sim_state_json_list[0])
-            self.recorder.create_episode()
+            self.recorder.create_episode(task_name=self.task_name_list[0], domain_randomization=domain_randomization)
             self.saved_data = False
         
         self.start_loop = False
         
         return self.sim_state_list[0],self.task_name_list[0]
+    def restore_episode_start(self) -> bool:
+        """Write the first frame of the loaded episode to the replay env, False if no episode is loaded"""
+        return self.scene_checkpoints.restore("episode_start", self.replay_env_ids)
     def start_replay(self):
         self.action_index=0
+        self.replay_start_time = time.perf_counter()
     def get_start_loop(self):
         return self.start_loop
     def _setup_joint_mapping(self):
@@ -185,18 +223,24 @@ class FileActionProviderReplay(ActionProvider):
                 elif self.enable_inspire:
                     hand_cmd_data = self.hand_action[self.action_index]
                 
-                env.scene.reset_to(self.sim_state_list[self.action_index], torch.tensor([0], device=env.device), is_relative=True)
+                if self.kinematic_replay is not None:
+                    self.kinematic_replay.apply(self.action_index)
+                else:
+                    env.scene.reset_to(self.sim_state_list[self.action_index], self.replay_env_ids, is_relative=True)
                 
                 if self.generate_data:
-                    for sensor in env.scene.sensors.values():
-                        sensor.update(0.02, force_recompute=False)
-                    env.sim.render()
-                    env.observation_manager.compute()
+                    self.generation_step.run()
                     self.save_date(env,arm_cmd_data,hand_cmd_data,self.sim_state_json_list[self.action_index])
                 else:
                     env.sim.render()
                 self.action_index += 1
             else:
+                if self.action_index == self.total_step_num and self.replay_start_time is not None:
+                    elapsed = time.perf_counter() - self.replay_start_time
+                    mode = "kinematic" if self.kinematic_replay is not None else "reset_to"
+                    print(f"[{self.name}] replayed {self.total_step_num} frames in {elapsed:.2f}s "
+                          f"({self.total_step_num / max(elapsed, 1e-6):.1f} FPS, {mode})")
+                    self.replay_start_time = None
                 self.action_index = 10**1000
                 if self.generate_data: 
                     if not self.saved_data:
@@ -271,20 +315,21 @@ class FileActionProviderReplay(ActionProvider):
 
         return left_arm_joint_pose,right_arm_joint_pose,left_hand_joint_pose,right_hand_joint_pose
 
-    def get_images(self,image_count=3):
-        concatenated_image = self.multi_image_reader.read_concatenated_image()
-        height, total_width, channels = concatenated_image.shape
-        single_width = total_width // image_count
-        if total_width % image_count != 0:
-            raise ValueError("Total width is not divisible by image_count. Cannot split cleanly.")
+    def get_images(self):
+        """Split the latest color and depth images of the shared memory by camera
 
-        images = {}
-        names = ['head', 'left', 'right']
-        for i, name in enumerate(names[:image_count]):
-            x_start = i * single_width
-            x_end = x_start + single_width
-            images[name] = concatenated_image[:, x_start:x_end, :]
-        return images
+        Returns:
+            (color images, depth images) keyed by camera name, the previous frame if there is no new one
+        """
+        frame = self.multi_image_reader.read_frame()
+        if frame is not None:
+            images = dict(zip(frame["names"], split_concatenated(frame["color"], frame["widths"])))
+            depths = {}
+            if frame["depth"] is not None:
+                depth_widths = [width for name, width in zip(frame["names"], frame["widths"]) if name in frame["depth_names"]]
+                depths = dict(zip(frame["depth_names"], split_concatenated(frame["depth"], depth_widths)))
+            self._last_images = (images, depths)
+        return self._last_images
     def save_date(self,env,arm_action,hand_action,sim_state=None):
         def ensure_list(data):
             """Ensure data is list type, if not, convert to list"""
@@ -298,7 +343,7 @@ class FileActionProviderReplay(ActionProvider):
                 return [data]
         
         left_arm_state,right_arm_state,left_ee_state,right_ee_state = self.get_state(env)
-        images = self.get_images()
+        images, depth_images = self.get_images()
         colors = {}
         depths = {}
         left_arm_action = arm_action[:7].tolist()
@@ -312,9 +357,11 @@ class FileActionProviderReplay(ActionProvider):
         elif self.enable_inspire:
             right_hand_action = hand_action[:6].tolist()
             left_hand_action = hand_action[6:].tolist()
-        colors[f"color_{0}"] = images["head"]
-        colors[f"color_{1}"] = images["left"]
-        colors[f"color_{2}"] = images["right"]
+        for i, name in enumerate(CAMERA_ROLES):
+            if name in images:
+                colors[f"color_{i}"] = images[name]
+            if name in depth_images:
+                depths[f"depth_{i}"] = depth_images[name]
         states = {
             "left_arm": {                                                                    
                 "qpos":   ensure_list(left_arm_state),    
@@ -3,15 +3,16 @@
 from action_provider.action_base import ActionProvider
 from typing import Optional
 import torch
-from dds.dds_master import dds_manager
+from tools.sim_context import get_sim_context
 import os
 import onnxruntime as ort
 from dds.sharedmemorymanager import SharedMemoryManager
 import time
 import threading
-from isaaclab.utils.buffers import CircularBuffer,DelayBuffer
-import os
-import ast
+from isaaclab.utils.buffers import DelayBuffer
+from dds.commands_dds import RunCommandHold, DEFAULT_RUN_COMMAND_TIMEOUT
+from action_provider.wholebody_observation import WholeBodyObservation
+from tools.generation_profile import GenerationProfile, GenerationStep, CAMERA_OBSERVATION_TERMS, observation_term_names
 project_root = os.environ.get("PROJECT_ROOT")
 class DDSRLActionProvider(ActionProvider):
     """Action provider based on DDS"""
@@ -30,9 +31,14 @@ class DDSRLActionProvider(ActionProvider):
         self.gripper_dds = None
         self.dex3_dds = None
         self.inspire_dds = None
-        self.run_command = None
+        self.run_command_dds = None
         self._setup_dds()
         self._setup_joint_mapping()
+        # hold the last run command, fall back to standing when the publisher goes quiet
+        self.run_command_hold = RunCommandHold(
+            self.run_command_dds, timeout=getattr(args_cli, "run_command_timeout", DEFAULT_RUN_COMMAND_TIMEOUT))
+        self.command = torch.tensor([self.run_command_hold.command], device=self.env.device, dtype=torch.float32)
+        self._setup_rates(args_cli)
         self.policy = self.load_policy(self.policy_path)
         
         
@@ -42,16 +48,18 @@ class DDSRLActionProvider(ActionProvider):
         print(f"enable_gripper: {self.enable_gripper}")
         print(f"enable_dex3: {self.enable_dex3}")
         try:
+            # the DDS objects registered by create_dds_objects, looked up through the sim context
+            context = get_sim_context()
             if self.enable_robot == "g129":
-                self.robot_dds = dds_manager.get_object("g129")
+                self.robot_dds = context.get_dds_object("g129")
             if self.enable_gripper:
-                self.gripper_dds = dds_manager.get_object("dex1")
+                self.gripper_dds = context.get_dds_object("dex1")
             elif self.enable_dex3:
-                self.dex3_dds = dds_manager.get_object("dex3")
+                self.dex3_dds = context.get_dds_object("dex3")
             elif self.enable_inspire:
-                self.inspire_dds = dds_manager.get_object("inspire")
+                self.inspire_dds = context.get_dds_object("inspire")
             if self.wh:
-                self.run_command_dds = dds_manager.get_object("run_command")
+                self.run_command_dds = context.get_dds_object("run_command")
             print(f"[{self.name}] DDS communication initialized")
         except Exception as e:
             print(f"[{self.name}] DDS initialization failed: {e}")
@@ -232,16 +240,16 @@ class DDSRLActionProvider(ActionProvider):
         self.arm_action = []
         self.obs_scales = {"ang_vel":1.0, "projected_gravity":1.0, "commands":1.0, 
                            "joint_pos":1.0, "joint_vel":1.0, "actions":1.0}
-        self.ang_vel = self.env.scene["robot"].data.root_ang_vel_b                      
-        self.projected_gravity = self.env.scene["robot"].data.projected_gravity_b       
-        self.joint_pos = self.env.scene["robot"].data.joint_pos
-        self.joint_vel = self.env.scene["robot"].data.joint_vel
-        self.actor_obs_buffer = CircularBuffer(
-            max_len=10, batch_size=1, device=self.env.device
-        )
         self.num_envs =1
         self.clip_obs = 100
-        self.num_actions_all = self.env.scene["robot"].data.default_joint_pos[:,self.old_action_indices].shape[1]  
+        self.num_actions_all = len(self.old_action_indices)
+        self.old_action_indices_tensor = torch.tensor(self.old_action_indices, dtype=torch.long, device=self.env.device)
+        # the actions term of the observation: the last actions pushed into the action buffer
+        self.last_actions = torch.zeros(self.num_envs, self.num_actions_all, device=self.env.device)
+        self.actor_obs = WholeBodyObservation(
+            self.env.scene["robot"].data, self.all_obs_indices, self.num_actions_all, history_length=10,
+            obs_scales=self.obs_scales, clip_obs=self.clip_obs, num_envs=self.num_envs, device=self.env.device,
+        )
         self.action_buffer = DelayBuffer(
             5, self.num_envs, device=self.env.device
         )
@@ -251,6 +259,54 @@ class DDSRLActionProvider(ActionProvider):
         self.clip_actions = 100
         self.action_scale = 0.25
         self.sim_step_counter = 0
+    def _setup_rates(self, args_cli):
+        """Physics substeps per policy step and the render rate
+
+        The policy runs once per get_action; physics_substeps physics steps of physics_dt follow it, so the
+        policy runs at 1 / (physics_substeps * physics_dt) in sim time. The frame is rendered and the full
+        observation (camera terms included) computed at render_hz in sim time; on the other policy steps only
+        the observation terms that do not read the cameras run (robot state shared memory for DDS).
+        """
+        self.physics_dt = self.env.physics_dt
+        self.physics_substeps = getattr(args_cli, "physics_substeps", None) or getattr(getattr(self.env, "cfg", None), "decimation", 4)
+        self.policy_dt = self.physics_dt * self.physics_substeps
+        self.sim_dt = self.policy_dt
+        render_hz = getattr(args_cli, "render_hz", None)
+        # None renders every policy step, 0 never renders (no camera consumer)
+        self.render_period = None if render_hz is None else (float("inf") if render_hz <= 0 else 1.0 / render_hz)
+        self.sim_time = 0.0
+        self._next_render_time = float("inf") if render_hz is not None and render_hz <= 0 else 0.0
+        state_terms = [name for name in observation_term_names(self.env) if name not in CAMERA_OBSERVATION_TERMS]
+        self.state_step = GenerationStep(self.env, GenerationProfile(
+            name="wholebody_state", sensors=[], observation_terms=state_terms, render=False))
+
+        # achieved rates, reported every report_interval seconds of wall time
+        self.report_interval = getattr(args_cli, "stats_interval", 10.0)
+        self._rate_start = time.perf_counter()
+        self._rate_counts = [0, 0, 0]  # policy steps, physics steps, renders
+        render_text = "every policy step" if render_hz is None else (f"{render_hz:g} Hz" if render_hz > 0 else "off")
+        print(f"[{self.name}] policy {1.0 / self.policy_dt:g} Hz ({self.physics_substeps} x {self.physics_dt:g}s physics steps), "
+              f"render {render_text}")
+
+    def _render_due(self) -> bool:
+        if self.render_period is None:
+            return True
+        if self.sim_time + 1e-9 < self._next_render_time:
+            return False
+        # skip missed frames instead of rendering them back to back
+        self._next_render_time = max(self._next_render_time + self.render_period, self.sim_time)
+        return True
+
+    def _report_rates(self, now: float):
+        elapsed = now - self._rate_start
+        if elapsed < self.report_interval:
+            return
+        policy_steps, physics_steps, renders = self._rate_counts
+        print(f"[{self.name}] policy {policy_steps / elapsed:.1f} Hz, physics {physics_steps / elapsed:.1f} Hz, "
+              f"render {renders / elapsed:.1f} Hz (real time factor {policy_steps * self.policy_dt / elapsed:.2f})")
+        self._rate_start = now
+        self._rate_counts = [0, 0, 0]
+
     def load_policy(self,path):
         ext = os.path.splitext(path)[1].lower()
         if ext==".onnx":
@@ -269,66 +325,23 @@ class DDSRLActionProvider(ActionProvider):
             return torch.tensor(ort_outs[0], device=self.env.device)
         return run_inference
     def compute_current_observations(self):
-        command = [0,0,0,0.8]  
-        run_command = self.run_command_dds.get_run_command()
-        if run_command and 'run_command' in run_command:
-            run_command_data = run_command['run_command']
-            
-            if isinstance(run_command_data, str):
-                try:
-                    run_command_list = ast.literal_eval(run_command_data)
-                    if isinstance(run_command_list, list) and len(run_command_list) >= 4:
-                        command[0] = float(run_command_list[0])
-                        command[1] = float(run_command_list[1])
-                        command[2] = float(run_command_list[2])
-                        command[3] = float(run_command_list[3])
-                except (ValueError, SyntaxError) as e:
-                    print(f"[WARNING] cannot parse run_command string: {run_command_data}, error: {e}")
-            else:
-                try:
-                    command[0] = float(run_command_data[0])
-                    command[1] = float(run_command_data[1])
-                    command[2] = float(run_command_data[2])
-                    command[3] = float(run_command_data[3])
-                except (IndexError, TypeError) as e:
-                    print(f"[WARNING] cannot parse run_command data: {run_command_data}, error: {e}")
-            
-            self.run_command_dds.write_run_command([0.0,0,0,0.8])
-      
-        # command = [0.5,0.0,0.7,0.8]
-        command = torch.tensor(command, device=self.env.device, dtype=torch.float32)
-        
-        if command.dim() == 1:
-            command = command.unsqueeze(0)  # [4] -> [1, 4]
-        self.ang_vel = self.env.scene["robot"].data.root_ang_vel_b                      
-        self.projected_gravity = self.env.scene["robot"].data.projected_gravity_b       
-        self.joint_pos = self.env.scene["robot"].data.joint_pos
-        self.joint_vel = self.env.scene["robot"].data.joint_vel
-        action = self.action_buffer._circular_buffer.buffer[:, -1, :]     
-        current_actor_obs = torch.cat(
-        [
-            self.ang_vel * self.obs_scales["ang_vel"],
-            self.projected_gravity * self.obs_scales["projected_gravity"],
-            command * self.obs_scales["commands"],
-            (self.joint_pos[:, self.all_obs_indices] - self.default_action_positions[:, self.all_obs_indices]) * self.obs_scales["joint_pos"],
-            (self.joint_vel[:, self.all_obs_indices] - self.default_action_velocities[:, self.all_obs_indices]) * self.obs_scales["joint_vel"],
-            action * self.obs_scales["actions"],  # [29] -> [1, 29]
-        ],
-        dim=-1,
-    )
-        return current_actor_obs
+        # the slot holds parsed floats, the device tensor is only updated when the command changes
+        command_values, changed = self.run_command_hold.update()
+        if changed:
+            self.command.copy_(torch.tensor([command_values], dtype=torch.float32))
+        # written in place into the preallocated observation, already clipped
+        return self.actor_obs.compute(self.command, self.last_actions)
     def compute_observations(self):
 
         current_actor_obs = self.compute_current_observations()
-
-        self.actor_obs_buffer.append(current_actor_obs)
-        actor_obs = self.actor_obs_buffer.buffer.reshape(self.num_envs, -1)
-        actor_obs = torch.clip(actor_obs, -self.clip_obs, self.clip_obs)
-        return actor_obs
+        # flattened history [1, 10 * obs_dim], a view of the history ring
+        return self.actor_obs.append(current_actor_obs)
     
     def run_policy(self):
         current_actor_obs = self.compute_observations()
-        action = self.policy(current_actor_obs)
+        # no autograd graph for TorchScript policies, the action is copied into the preallocated buffers
+        with torch.inference_mode():
+            action = self.policy(current_actor_obs)
         return action
     def get_action(self, env) -> Optional[torch.Tensor]:
         """Get action from DDS"""
@@ -347,7 +360,8 @@ class DDSRLActionProvider(ActionProvider):
                         for joint_name, arm_idx in self.arm_joint_mapping.items():
                             if joint_name in self.joint_to_index:
                                 full_action[self.joint_to_index[joint_name]] = positions[arm_idx+15]
-            delayed_actions = self.action_buffer.compute(full_action[self.old_action_indices].unsqueeze(0))
+            torch.index_select(full_action, 0, self.old_action_indices_tensor, out=self.last_actions[0])
+            delayed_actions = self.action_buffer.compute(self.last_actions)
 
             cliped_actions = torch.clip(delayed_actions[:,self.action_to_indices], -self.clip_actions, self.clip_actions).to(self.env.device)
             full_action[self.action_to_indices] = cliped_actions * self.action_scale + self.default_action_positions[:, self.action_to_indices]
@@ -393,14 +407,24 @@ class DDSRLActionProvider(ActionProvider):
                                 if joint_name in self.joint_to_index:
                                     inspire_value = inspire_cmds_positions[special_idx[0]]
                                     full_action[self.joint_to_index[joint_name]] = inspire_value * special_idx[1]
-            for _ in range(4):
+            for _ in range(self.physics_substeps):
                 self.env.scene["robot"].set_joint_position_target(full_action) 
                 self.env.scene.write_data_to_sim()                           
                 self.env.sim.step(render=False)                              
-                self.env.scene.update(dt=self.env.physics_dt)                    
+                self.env.scene.update(dt=self.physics_dt)                    
+            self.sim_time += self.policy_dt
 
-            self.env.sim.render()
-            self.env.observation_manager.compute()
+            render = self._render_due()
+            if render:
+                self.env.sim.render()
+                self.env.observation_manager.compute()
+            else:
+                self.state_step.run()
+            counts = self._rate_counts
+            counts[0] += 1
+            counts[1] += self.physics_substeps
+            counts[2] += render
+            self._report_rates(time.perf_counter())
             
         except Exception as e:
             print(f"[{self.name}] Get DDS action failed: {e}")
@@ -0,0 +1,127 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Preallocated whole-body actor observation
+The actor observation of the whole-body policy is
+
+    [ang_vel(3), projected_gravity(3), command(4), joint_pos(n), joint_vel(n), actions(m)] x history
+
+Every term is written in place into a fixed slice of one preallocated buffer: the joint terms are gathered
+with a precomputed index tensor into scratch buffers and the defaults are subtracted into their slice, so
+building an observation allocates no tensor memory. The clip is applied in place to the current
+observation, which is the same as clipping the stacked history.
+
+The history is a ring buffer of twice the history length: every observation is written to row p and
+row p + history_length, so the history_length rows after p are always the history in order (oldest
+first) and contiguous, and the flattened history is a view of the ring instead of a roll and a copy.
+Like the isaaclab CircularBuffer it replaces, the first observation after a reset fills the whole history.
+"""
+
+from typing import Dict, Sequence
+
+import torch
+
+# term name -> width, None for the joint terms whose width is the number of observed joints
+OBS_TERMS = (
+    ("ang_vel", 3),
+    ("projected_gravity", 3),
+    ("commands", 4),
+    ("joint_pos", None),
+    ("joint_vel", None),
+    ("actions", None),
+)
+
+
+class WholeBodyObservation:
+    """Builds the whole-body actor observation and its history into preallocated buffers"""
+
+    def __init__(self, robot_data, obs_joint_indices: Sequence[int], num_actions: int, history_length: int = 10,
+                 obs_scales: Dict[str, float] = None, clip_obs: float = 100.0, num_envs: int = 1,
+                 device: str = "cpu"):
+        """
+        Args:
+            robot_data: the articulation data (joint_pos, joint_vel, default_joint_pos, default_joint_vel,
+                root_ang_vel_b, projected_gravity_b)
+            obs_joint_indices: indices of the observed joints in the articulation joint order
+            num_actions: width of the actions term
+            history_length: number of stacked observations
+            obs_scales: scale per term, missing terms are not scaled
+            clip_obs: observations are clipped to [-clip_obs, clip_obs]
+            num_envs: number of environments
+            device: torch device
+        """
+        self.robot_data = robot_data
+        self.num_envs = num_envs
+        self.history_length = history_length
+        self.clip_obs = clip_obs
+        self.joint_indices = torch.tensor(list(obs_joint_indices), dtype=torch.long, device=device)
+        num_joints = len(self.joint_indices)
+
+        self.slices = {}
+        offset = 0
+        widths = {"joint_pos": num_joints, "joint_vel": num_joints, "actions": num_actions}
+        self.current = torch.zeros(num_envs, sum(width or widths[name] for name, width in OBS_TERMS), device=device)
+        for name, width in OBS_TERMS:
+            width = width or widths[name]
+            self.slices[name] = self.current[:, offset:offset + width]
+            offset += width
+        self.obs_dim = offset
+        # only scales other than 1 cost a multiplication
+        self.scales = {name: float(scale) for name, scale in (obs_scales or {}).items() if float(scale) != 1.0}
+
+        self.default_joint_pos = robot_data.default_joint_pos.index_select(1, self.joint_indices).clone()
+        self.default_joint_vel = robot_data.default_joint_vel.index_select(1, self.joint_indices).clone()
+        self._joint_scratch = torch.zeros(num_envs, num_joints, device=device)
+
+        self._ring = torch.zeros(num_envs, 2 * history_length, self.obs_dim, device=device)
+        self._pointer = history_length - 1
+        self._filled = False
+
+    def reset(self):
+        """Forget the history, the next observation fills it"""
+        self._filled = False
+
+    def _joint_term(self, name: str, values: torch.Tensor, defaults: torch.Tensor):
+        torch.index_select(values, 1, self.joint_indices, out=self._joint_scratch)
+        torch.sub(self._joint_scratch, defaults, out=self.slices[name])
+
+    def compute(self, command: torch.Tensor, actions: torch.Tensor) -> torch.Tensor:
+        """Build the current observation
+
+        Args:
+            command: [num_envs, 4] velocity command
+            actions: [num_envs, num_actions] last actions
+
+        Returns:
+            the current observation [num_envs, obs_dim], clipped; the buffer is reused by the next call
+        """
+        data = self.robot_data
+        self.slices["ang_vel"].copy_(data.root_ang_vel_b)
+        self.slices["projected_gravity"].copy_(data.projected_gravity_b)
+        self.slices["commands"].copy_(command)
+        self._joint_term("joint_pos", data.joint_pos, self.default_joint_pos)
+        self._joint_term("joint_vel", data.joint_vel, self.default_joint_vel)
+        self.slices["actions"].copy_(actions)
+        for name, scale in self.scales.items():
+            self.slices[name].mul_(scale)
+        return self.current.clamp_(-self.clip_obs, self.clip_obs)
+
+    def append(self, obs: torch.Tensor) -> torch.Tensor:
+        """Push an observation into the history
+
+        Returns:
+            the flattened history [num_envs, history_length * obs_dim], oldest first
+        """
+        if not self._filled:
+            self._ring.copy_(obs.unsqueeze(1).expand_as(self._ring))
+            self._filled = True
+        else:
+            self._pointer = (self._pointer + 1) % self.history_length
+            self._ring[:, self._pointer].copy_(obs)
+            self._ring[:, self._pointer + self.history_length].copy_(obs)
+        return self.history()
+
+    def history(self) -> torch.Tensor:
+        """The flattened history, a view of the ring for one env (a copy for several)"""
+        start = self._pointer + 1
+        return self._ring[:, start:start + self.history_length].reshape(self.num_envs, -1)
@@ -3,14 +3,45 @@
 """
 Run command DDS communication class
 Specialized in receiving the run command
+
+The run command [x_vel, y_vel, yaw_vel, height] arrives as a string on rt/run_command/cmd (see
+send_commands_keyboard.py / send_commands_8bit.py). It is parsed once in the subscriber callback and
+stored in a fixed float32[4] shared memory slot with a sequence number and a timestamp, so the control
+loop reads it without any parsing. RunCommandHold implements the consumer policy: the last command is
+held until it is older than a timeout, then the default (standing) command is used.
 """
 
-import threading
-from typing import Any, Dict, Optional
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelSubscriber
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+from dds.dds_base import DDSObject, create_subscriber
+from dds.sharedmemorymanager import SharedMemorySlot
+from tools.sim_instance import instance_shm_name
 from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
 
+# [x_vel, y_vel, yaw_vel, height]
+DEFAULT_RUN_COMMAND = (0.0, 0.0, 0.0, 0.8)
+RUN_COMMAND_SIZE = len(DEFAULT_RUN_COMMAND)
+DEFAULT_RUN_COMMAND_TIMEOUT = 0.5
+
+
+def parse_run_command(data: Any) -> Optional[Tuple[float, ...]]:
+    """Parse a run command
+
+    Args:
+        data: "[x_vel, y_vel, yaw_vel, height]" string or a sequence of numbers
+
+    Returns:
+        the first RUN_COMMAND_SIZE values as floats, None if the data is malformed
+    """
+    try:
+        if isinstance(data, str):
+            data = data.strip().strip("[]()").split(",")
+        if len(data) < RUN_COMMAND_SIZE:
+            return None
+        return tuple(float(value) for value in data[:RUN_COMMAND_SIZE])
+    except (TypeError, ValueError):
+        return None
+
 
 class RunCommandDDS(DDSObject):
     """Run command DDS node (singleton pattern)"""
@@ -24,15 +55,15 @@ class RunCommandDDS(DDSObject):
         
         self._initialized = True
         self.node_name = node_name
-        # setup the shared memory
+        # setup the shared memory, the command is a fixed slot and not a JSON payload
         self.setup_shared_memory(
-            output_shm_name="isaac_run_command_cmd", 
             input_shm_name="isaac_run_command_state",
-            output_size=512, 
             input_size=3072,
-            outputshm_flag=True,
+            outputshm_flag=False,
             inputshm_flag=True,
         )
+        self.output_shm = SharedMemorySlot(instance_shm_name("isaac_run_command_slot"), f"{RUN_COMMAND_SIZE}f")
+        print(f"[{self.node_name}] Output shared memory: {self.output_shm.get_name()}")
         print(f"[{self.node_name}] Run command DDS node initialized")
 
     
@@ -43,7 +74,7 @@ class RunCommandDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the run command subscriber"""
         try:
-            self.subscriber = ChannelSubscriber("rt/run_command/cmd", String_)
+            self.subscriber = create_subscriber("rt/run_command/cmd", String_)
             self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
             
             print(f"[{self.node_name}] Run command subscriber initialized")
@@ -57,43 +88,34 @@ class RunCommandDDS(DDSObject):
         """Process the publish data (this node is mainly used for subscribe, the publish function is optional)"""
         pass
     
-    def dds_subscriber(self, msg: String_,datatype:str=None) -> Dict[str, Any]:
-        """Process the subscribe data"""
-        try:
-            cmd_data = {
-                "run_command": msg.data
-            }
-            self.output_shm.write_data(cmd_data)
-        except Exception as e:
-            print(f"run_command_dds [{self.node_name}] Failed to process the subscribe data: {e}")
-            return {}
+    def dds_subscriber(self, msg: String_,datatype:str=None) -> None:
+        """Process the subscribe data: parse the command once and store it in the slot"""
+        command = parse_run_command(msg.data)
+        if command is None:
+            print(f"run_command_dds [{self.node_name}] cannot parse run_command: {msg.data}")
+            return
+        self.write_run_command(command)
     
-    def get_run_command(self) -> Optional[Dict[str, Any]]:
+    def get_run_command(self) -> Optional[Tuple[int, float, Tuple[float, ...]]]:
         """Get the run command
         
         Returns:
-            Dict: the run command, if no command return None
+            (sequence number, time.monotonic() timestamp, [x_vel, y_vel, yaw_vel, height]),
+            None if no command was received
         """
         if self.output_shm:
-            return self.output_shm.read_data()
+            return self.output_shm.read()
         return None
     
-    def write_run_command(self, flag_category):
-        """Write the run command to the shared memory
+    def write_run_command(self, command: Sequence[float]):
+        """Write the run command to the shared memory slot
         
         Args:
-            positions: the run command, if no command return None
+            command: [x_vel, y_vel, yaw_vel, height]
         """
         try:
-            # prepare the reset pose data
-            cmd_data = {
-                "run_command":flag_category
-            }
-            
-            # write the reset pose data to the shared memory
             if self.output_shm:
-                self.output_shm.write_data(cmd_data)
-                
+                self.output_shm.write(command[:RUN_COMMAND_SIZE])
         except Exception as e:
             print(f"run_command_dds [{self.node_name}] Failed to write the run command: {e}")
     
@@ -124,4 +146,48 @@ class RunCommandDDS(DDSObject):
         state_data = self.input_shm.read_data()
         if state_data is None:
             return None
-        return state_data
\ No newline at end of file
+        return state_data
+
+
+class RunCommandHold:
+    """Hold-last-command policy of a run command consumer
+
+    A new command (new sequence number) replaces the held one. The held command is used until it is
+    older than the timeout, e.g. when the command publisher stopped, then the default command is used.
+    """
+
+    def __init__(self, run_command_dds: RunCommandDDS, timeout: float = DEFAULT_RUN_COMMAND_TIMEOUT,
+                 default: Sequence[float] = DEFAULT_RUN_COMMAND):
+        """
+        Args:
+            run_command_dds: the run command node
+            timeout: seconds a command is held, 0 or None to hold it until the next one
+            default: the command before the first and after a timed out command
+        """
+        self.run_command_dds = run_command_dds
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self.default = tuple(float(value) for value in default)
+        self.command = self.default
+        self.sequence = 0
+        self.stamp = 0.0
+        self.timeouts = 0
+
+    def update(self, now: float = None) -> Tuple[Tuple[float, ...], bool]:
+        """Read the slot and apply the policy
+
+        Args:
+            now: the current time.monotonic(), read if None
+
+        Returns:
+            (the command to use, True if it differs from the previous update)
+        """
+        previous = self.command
+        slot = self.run_command_dds.get_run_command() if self.run_command_dds else None
+        if slot is not None and slot[0] != self.sequence:
+            self.sequence, self.stamp, self.command = slot
+        # a new command can be stale too, e.g. left in the slot by a publisher that stopped
+        if self.timeout is not None and self.command is not self.default:
+            if (time.monotonic() if now is None else now) - self.stamp > self.timeout:
+                self.command = self.default
+                self.timeouts += 1
+        return self.command, self.command != previous
@@ -1,8 +1,144 @@
 # Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
 # License: Apache License, Version 2.0
+import os
+import threading
 from abc import ABC, abstractmethod
 from dds.sharedmemorymanager import SharedMemoryManager
-from typing import Any
+from tools.sim_instance import instance_shm_name
+from typing import Any, Callable, Dict, List, Optional
+
+# Channel backend of the DDS objects, selected through the environment like the sim instance:
+#   "dds"       unitree_sdk2py ChannelPublisher/ChannelSubscriber (default)
+#   "loopback"  in-process channels, messages are serialized and deserialized with the same IDL types
+#               and handed to the subscribers of the topic in the same process (tests and benchmarks)
+CHANNEL_BACKEND_ENV = "SIM_DDS_CHANNEL"
+CHANNEL_BACKENDS = ("dds", "loopback")
+
+
+def set_channel_backend(backend: str):
+    """Select the channel backend for this process and its children"""
+    if backend not in CHANNEL_BACKENDS:
+        raise ValueError(f"unknown DDS channel backend: {backend}, use one of {CHANNEL_BACKENDS}")
+    os.environ[CHANNEL_BACKEND_ENV] = backend
+
+
+def get_channel_backend() -> str:
+    return os.environ.get(CHANNEL_BACKEND_ENV, "dds")
+
+
+class LoopbackBus:
+    """Topic registry of the loopback channels of one process"""
+
+    _lock = threading.Lock()
+    _subscribers: Dict[str, List["LoopbackChannelSubscriber"]] = {}
+
+    @classmethod
+    def attach(cls, subscriber: "LoopbackChannelSubscriber"):
+        with cls._lock:
+            cls._subscribers.setdefault(subscriber.topic, []).append(subscriber)
+
+    @classmethod
+    def detach(cls, subscriber: "LoopbackChannelSubscriber"):
+        with cls._lock:
+            subscribers = cls._subscribers.get(subscriber.topic, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+
+    @classmethod
+    def subscribers(cls, topic: str) -> List["LoopbackChannelSubscriber"]:
+        with cls._lock:
+            return list(cls._subscribers.get(topic, ()))
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._subscribers = {}
+
+
+class LoopbackChannelPublisher:
+    """In-process publisher with the interface of unitree_sdk2py ChannelPublisher"""
+
+    def __init__(self, topic: str, msg_type: Any, serialize: bool = True):
+        """
+        Args:
+            topic: the topic name
+            msg_type: the IDL message type
+            serialize: round-trip every message through the IDL serialization like DDS does
+        """
+        self.topic = topic
+        self.msg_type = msg_type
+        self.serialize = serialize
+        self.write_count = 0
+        self.bytes_written = 0
+
+    def Init(self):
+        pass
+
+    def Write(self, msg: Any, timeout: Optional[float] = None) -> bool:
+        if self.serialize:
+            data = msg.serialize()
+            self.bytes_written += len(data)
+        for subscriber in LoopbackBus.subscribers(self.topic):
+            subscriber._receive(self.msg_type.deserialize(data) if self.serialize else msg)
+        self.write_count += 1
+        return True
+
+    def Close(self):
+        pass
+
+
+class LoopbackChannelSubscriber:
+    """In-process subscriber with the interface of unitree_sdk2py ChannelSubscriber
+
+    The handler runs on the publishing thread, inside Write().
+    """
+
+    def __init__(self, topic: str, msg_type: Any):
+        self.topic = topic
+        self.msg_type = msg_type
+        self.handler: Optional[Callable[[Any], None]] = None
+        self.last_msg = None
+
+    def Init(self, handler: Optional[Callable[[Any], None]] = None, queueLen: int = 0):
+        self.handler = handler
+        LoopbackBus.attach(self)
+
+    def _receive(self, msg: Any):
+        self.last_msg = msg
+        if self.handler is not None:
+            self.handler(msg)
+
+    def Read(self, timeout: Optional[float] = None) -> Any:
+        """The last received message, None if nothing was received"""
+        return self.last_msg
+
+    def Close(self):
+        LoopbackBus.detach(self)
+
+
+def init_channel_factory(domain_id: int):
+    """Initialize the channel backend (ChannelFactoryInitialize for DDS, nothing for loopback)"""
+    if get_channel_backend() == "loopback":
+        return
+    from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+    ChannelFactoryInitialize(domain_id)
+
+
+def create_publisher(topic: str, msg_type: Any):
+    """Create a publisher of the selected channel backend, Init() is left to the caller"""
+    if get_channel_backend() == "loopback":
+        return LoopbackChannelPublisher(topic, msg_type)
+    from unitree_sdk2py.core.channel import ChannelPublisher
+    return ChannelPublisher(topic, msg_type)
+
+
+def create_subscriber(topic: str, msg_type: Any):
+    """Create a subscriber of the selected channel backend, Init(handler, queue_len) is left to the caller"""
+    if get_channel_backend() == "loopback":
+        return LoopbackChannelSubscriber(topic, msg_type)
+    from unitree_sdk2py.core.channel import ChannelSubscriber
+    return ChannelSubscriber(topic, msg_type)
+
 class DDSObject(ABC):
     def __init__(self):
         self.publishing = False
@@ -32,7 +168,13 @@ class DDSObject(ABC):
             output_shm_name: output shared memory name
             input_size: input shared memory size
             output_size: output shared memory size
+
+        The names are namespaced with the sim instance index (see tools/sim_instance.py).
         """
+        if input_shm_name:
+            input_shm_name = instance_shm_name(input_shm_name)
+        if output_shm_name:
+            output_shm_name = instance_shm_name(output_shm_name)
         if inputshm_flag:
             if input_shm_name:
                 self.input_shm = SharedMemoryManager(input_shm_name, input_size)
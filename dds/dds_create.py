@@ -1,8 +1,9 @@
 # Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
 # License: Apache License, Version 2.0
-from dds.dds_master import dds_manager
+from tools.sim_context import get_sim_context
 
 def create_dds_objects(args_cli,env):
+    dds_manager = get_sim_context().dds_manager
     publish_names = []
     subscribe_names = []
     if args_cli.robot_type=="g129":
@@ -43,12 +44,23 @@ def create_dds_objects(args_cli,env):
     sim_state_dds = SimStateDDS(env,args_cli.task)
     dds_manager.register_object("sim_state", sim_state_dds)
     publish_names.append("sim_state")
+    from dds.sim_clock_dds import SimClockDDS
+    sim_clock_dds = SimClockDDS()
+    dds_manager.register_object("sim_clock", sim_clock_dds)
+    publish_names.append("sim_clock")
+    subscribe_names.append("sim_clock")
+    if getattr(args_cli, "reward_telemetry_hz", 0) > 0:
+        from dds.reward_telemetry_dds import RewardTelemetryDDS
+        reward_telemetry_dds = RewardTelemetryDDS()
+        dds_manager.register_object("reward_telemetry", reward_telemetry_dds)
+        publish_names.append("reward_telemetry")
 
     dds_manager.start_publishing(publish_names)
     dds_manager.start_subscribing(subscribe_names)
     return reset_pose_dds,sim_state_dds,dds_manager
 
 def create_dds_objects_replay(args_cli,env):
+    dds_manager = get_sim_context().dds_manager
     publish_names = []
     subscribe_names = []
     if args_cli.robot_type=="g129":
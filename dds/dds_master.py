@@ -3,8 +3,8 @@
 import time
 import threading
 from typing import Dict, List, Optional
-from unitree_sdk2py.core.channel import ChannelFactoryInitialize
-from dds.dds_base import DDSObject
+from dds.dds_base import DDSObject, init_channel_factory, get_channel_backend
+from tools.sim_instance import dds_domain_id
 
 
 
@@ -34,8 +34,8 @@ class DDSManager:
         self.subscribe_thread: Optional[threading.Thread] = None
         
 
+        # DDS is initialized when the first object is registered, so importing this module has no side effects
         self.dds_initialized = False
-        self._init_dds()
         print("[DDSManager] DDSManager initialized")
     
     def _parse_object_name(self, name: str) -> tuple[str, str]:
@@ -52,9 +52,10 @@ class DDSManager:
             return True
         
         try:
-            ChannelFactoryInitialize(1)
+            domain_id = dds_domain_id()
+            init_channel_factory(domain_id)
             self.dds_initialized = True
-            print("[DDSManager] DDS system initialized")
+            print(f"[DDSManager] DDS system initialized on domain {domain_id} ({get_channel_backend()} channels)")
             return True
         except Exception as e:
             print(f"[DDSManager] DDS system initialization failed: {e}")
@@ -66,6 +67,9 @@ class DDSManager:
             print(f"[DDSManager] object '{name}' already exists")
             return False
         
+        if not self._init_dds():
+            return False
+        
         try:
             category, obj_name = self._parse_object_name(name)
             
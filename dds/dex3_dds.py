@@ -7,8 +7,7 @@ Handle the state publishing and command receiving of the hand (left and right)
 
 import threading
 from typing import Any, Dict, Optional, Tuple
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
 from unitree_sdk2py.idl.unitree_hg.msg.dds_ import HandState_, HandCmd_
 from unitree_sdk2py.idl.default import unitree_hg_msg_dds__HandState_, unitree_hg_msg_dds__HandCmd_
 
@@ -56,11 +55,11 @@ class Dex3DDS(DDSObject):
         """Setup the publisher of the hand"""
         try:
             # left hand state publisher
-            self.left_state_publisher = ChannelPublisher("rt/dex3/left/state", HandState_)
+            self.left_state_publisher = create_publisher("rt/dex3/left/state", HandState_)
             self.left_state_publisher.Init()
             
             # right hand state publisher
-            self.right_state_publisher = ChannelPublisher("rt/dex3/right/state", HandState_)
+            self.right_state_publisher = create_publisher("rt/dex3/right/state", HandState_)
             self.right_state_publisher.Init()
             
             print(f"[{self.node_name}] Hand state publisher initialized")
@@ -73,13 +72,13 @@ class Dex3DDS(DDSObject):
         """Setup the subscriber of the hand"""
         try:
             # left hand command subscriber
-            self.left_cmd_subscriber = ChannelSubscriber("rt/dex3/left/cmd", HandCmd_)
+            self.left_cmd_subscriber = create_subscriber("rt/dex3/left/cmd", HandCmd_)
             self.left_cmd_subscriber.Init(
                 lambda msg: self.dds_subscriber(msg, "left"), 1
             )
             
             # right hand command subscriber
-            self.right_cmd_subscriber = ChannelSubscriber("rt/dex3/right/cmd", HandCmd_)
+            self.right_cmd_subscriber = create_subscriber("rt/dex3/right/cmd", HandCmd_)
             self.right_cmd_subscriber.Init(
                 lambda msg: self.dds_subscriber(msg, "right"), 1
             )
@@ -8,18 +8,18 @@ Handle the state publishing and command receiving of the G1 robot
 import numpy as np
 from typing import Any, Dict, Optional
 # from dds.dds_base import BaseDDSNode, node_manager
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
 from unitree_sdk2py.idl.unitree_hg.msg.dds_ import LowState_, LowCmd_
 from unitree_sdk2py.idl.default import unitree_hg_msg_dds__LowCmd_, unitree_hg_msg_dds__LowState_
 from unitree_sdk2py.utils.crc import CRC
+from tools.sim_clock import sim_clock
 
 
 class G1RobotDDS(DDSObject):
     """G1 robot DDS communication class - singleton pattern
     
     Features:
-    - Publish the state of the G1 robot to DDS (rt/lowstate)
+    - Publish the state of the G1 robot to DDS (rt/lowstate), tick is the sim time in milliseconds
     - Receive the control command of the G1 robot (rt/lowcmd)
     """
     
@@ -48,7 +48,7 @@ class G1RobotDDS(DDSObject):
     def setup_publisher(self) -> bool:
         """Setup the publisher of the G1 robot"""
         try:
-            self.publisher = ChannelPublisher("rt/lowstate", LowState_)
+            self.publisher = create_publisher("rt/lowstate", LowState_)
             self.publisher.Init()
             print(f"[{self.node_name}] State publisher initialized (rt/lowstate)")
             return True
@@ -59,8 +59,8 @@ class G1RobotDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the subscriber of the G1 robot"""
         try:
-            print(f"[{self.node_name}] Create ChannelSubscriber...")
-            self.subscriber = ChannelSubscriber("rt/lowcmd", LowCmd_)
+            print(f"[{self.node_name}] Create command subscriber...")
+            self.subscriber = create_subscriber("rt/lowcmd", LowCmd_)
             self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
             return True
         except Exception as e:
@@ -110,8 +110,10 @@ class G1RobotDDS(DDSObject):
                 # 角速度 (陀螺仪)
                 imu_state.gyroscope[:] = imu_array[10:13]
 
-            # 更新时间戳和 CRC
-            self.low_state.tick += 1
+            # 更新时间戳和 CRC: tick is the sim time of the state in milliseconds
+            sim_time = data.get("sim_time")
+            tick = int(sim_time * 1000.0) if sim_time is not None else sim_clock.sim_time_ms()
+            self.low_state.tick = tick & 0xFFFFFFFF
             self.low_state.crc = self.crc.Crc(self.low_state)
 
             # 发布 DDS 消息
@@ -189,7 +191,9 @@ class G1RobotDDS(DDSObject):
                 "joint_positions": joint_positions.tolist() if hasattr(joint_positions, 'tolist') else joint_positions,
                 "joint_velocities": joint_velocities.tolist() if hasattr(joint_velocities, 'tolist') else joint_velocities,
                 "joint_torques": joint_torques.tolist() if hasattr(joint_torques, 'tolist') else joint_torques,
-                "imu_data": imu_data.tolist() if hasattr(imu_data, 'tolist') else imu_data
+                "imu_data": imu_data.tolist() if hasattr(imu_data, 'tolist') else imu_data,
+                # the sim step and time the state belongs to
+                **sim_clock.stamp(),
             }
             self.input_shm.write_data(state_data)
         except Exception as e:
@@ -7,8 +7,7 @@ Handle the state publishing and command receiving of the gripper
 
 import threading
 from typing import Any, Dict, Optional
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
 from unitree_sdk2py.idl.unitree_go.msg.dds_ import MotorCmds_, MotorStates_
 from unitree_sdk2py.idl.default import unitree_go_msg_dds__MotorCmd_, unitree_go_msg_dds__MotorState_
 
@@ -52,9 +51,9 @@ class GripperDDS(DDSObject):
     def setup_publisher(self) -> bool:
         """Setup the publisher of the gripper"""
         try:
-            self.left_gripper_state_publisher = ChannelPublisher("rt/dex1/left/state", MotorStates_)
+            self.left_gripper_state_publisher = create_publisher("rt/dex1/left/state", MotorStates_)
             self.left_gripper_state_publisher.Init()
-            self.right_gripper_state_publisher = ChannelPublisher("rt/dex1/right/state", MotorStates_)
+            self.right_gripper_state_publisher = create_publisher("rt/dex1/right/state", MotorStates_)
             self.right_gripper_state_publisher.Init()
             self.publisher=True
             print(f"[{self.node_name}] Gripper state publisher initialized")
@@ -66,9 +65,9 @@ class GripperDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the subscriber of the gripper"""
         try:
-            self.left_gripper_cmd_subscriber = ChannelSubscriber("rt/dex1/left/cmd", MotorCmds_)
+            self.left_gripper_cmd_subscriber = create_subscriber("rt/dex1/left/cmd", MotorCmds_)
             self.left_gripper_cmd_subscriber.Init(lambda msg: self.dds_subscriber(msg, "left"), 1)
-            self.right_gripper_cmd_subscriber = ChannelSubscriber("rt/dex1/right/cmd", MotorCmds_)
+            self.right_gripper_cmd_subscriber = create_subscriber("rt/dex1/right/cmd", MotorCmds_)
             self.right_gripper_cmd_subscriber.Init(lambda msg: self.dds_subscriber(msg, "right"), 1)
             self.subscriber = True
             print(f"[{self.node_name}] Gripper command subscriber initialized")
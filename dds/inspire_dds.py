@@ -7,8 +7,7 @@ Handle the state publishing and command receiving of the gripper
 
 import threading
 from typing import Any, Dict, Optional
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
 from unitree_sdk2py.idl.unitree_go.msg.dds_ import MotorCmds_, MotorStates_
 from unitree_sdk2py.idl.default import unitree_go_msg_dds__MotorCmd_, unitree_go_msg_dds__MotorState_
 import numpy as np
@@ -53,7 +52,7 @@ class InspireDDS(DDSObject):
     def setup_publisher(self) -> bool:
         """Setup the publisher of the gripper"""
         try:
-            self.publisher = ChannelPublisher("rt/inspire/state", MotorStates_)
+            self.publisher = create_publisher("rt/inspire/state", MotorStates_)
             self.publisher.Init()
             
             print(f"[{self.node_name}] Inspire Hand state publisher initialized")
@@ -65,7 +64,7 @@ class InspireDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the subscriber of the gripper"""
         try:
-            self.subscriber = ChannelSubscriber("rt/inspire/cmd", MotorCmds_)
+            self.subscriber = create_subscriber("rt/inspire/cmd", MotorCmds_)
             self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
             
             print(f"[{self.node_name}] Inspire Hand command subscriber initialized")
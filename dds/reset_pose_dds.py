@@ -7,8 +7,7 @@ Specialized in receiving the reset pose command
 
 import threading
 from typing import Any, Dict, Optional
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelSubscriber
+from dds.dds_base import DDSObject, create_subscriber
 from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
 
 
@@ -42,7 +41,7 @@ class ResetPoseCmdDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the reset pose command subscriber"""
         try:
-            self.subscriber = ChannelSubscriber("rt/reset_pose/cmd", String_)
+            self.subscriber = create_subscriber("rt/reset_pose/cmd", String_)
             self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
             
             print(f"[{self.node_name}] Reset pose command subscriber initialized")
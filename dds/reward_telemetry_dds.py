@@ -0,0 +1,86 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Reward telemetry DDS communication class
+Publishes the sampled reward/termination telemetry (tools/reward_telemetry.py) as JSON on "rt/sim_reward"
+"""
+
+import json
+from typing import Any, Dict
+from dds.dds_base import DDSObject, create_publisher
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+from unitree_sdk2py.idl.default import std_msgs_msg_dds__String_
+
+
+class RewardTelemetryDDS(DDSObject):
+    """Reward telemetry DDS node (publish only)"""
+
+    def __init__(self, node_name: str = "reward_telemetry_dds"):
+        """Initialize the reward telemetry DDS node"""
+        # avoid duplicate initialization
+        if hasattr(self, '_initialized') and self._initialized:
+            return
+        super().__init__()
+        self.node_name = node_name
+        self._initialized = True
+        self.telemetry_msg = std_msgs_msg_dds__String_()
+        self._last_seq = None
+
+        # setup the shared memory
+        self.setup_shared_memory(
+            input_shm_name="isaac_reward_telemetry",  # read telemetry data for publishing
+            input_size=4096,
+            outputshm_flag=False
+        )
+
+        print(f"[{self.node_name}] Reward telemetry DDS node initialized")
+
+    def setup_publisher(self) -> bool:
+        """Setup the publisher of the reward telemetry"""
+        try:
+            self.publisher = create_publisher("rt/sim_reward", String_)
+            self.publisher.Init()
+
+            print(f"[{self.node_name}] Reward telemetry publisher initialized")
+            return True
+        except Exception as e:
+            print(f"reward_telemetry_dds [{self.node_name}] Reward telemetry publisher initialization failed: {e}")
+            return False
+
+    def setup_subscriber(self) -> bool:
+        """The reward telemetry is publish only"""
+        return True
+
+    def dds_publisher(self) -> Any:
+        """Publish the latest telemetry message once"""
+        try:
+            data = self.input_shm.read_data()
+            if data is None:
+                return
+            # the shared memory keeps the last message, only publish each sequence number once
+            seq = data.get("seq")
+            if seq == self._last_seq:
+                return
+            self._last_seq = seq
+            data.pop("_timestamp", None)
+            self.telemetry_msg.data = json.dumps(data)
+            self.publisher.Write(self.telemetry_msg)
+        except Exception as e:
+            print(f"reward_telemetry_dds [{self.node_name}] Error processing publish data: {e}")
+            return None
+
+    def dds_subscriber(self, msg: String_, datatype: str = None) -> Dict[str, Any]:
+        """The reward telemetry is publish only"""
+        pass
+
+    def write_telemetry(self, data: Dict[str, Any]):
+        """Write one telemetry message to shared memory to trigger publishing
+
+        Args:
+            data: a sample or episode summary from RewardTelemetry
+        """
+        try:
+            if self.input_shm:
+                self.input_shm.write_data(data)
+        except Exception as e:
+            print(f"reward_telemetry_dds [{self.node_name}] Error writing telemetry data: {e}")
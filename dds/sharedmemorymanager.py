@@ -1,7 +1,8 @@
 import json
+import struct
 import time
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from multiprocessing import shared_memory
 
 
@@ -105,3 +106,103 @@ class SharedMemoryManager:
     def __del__(self):
         """Destructor"""
         self.cleanup()
+
+
+class SharedMemorySlot:
+    """Fixed-layout record in shared memory, written and read without serialization
+
+    Layout: uint64 sequence | float64 timestamp | payload packed with a struct format (e.g. "4f").
+    The writer makes the sequence odd while it writes and even when it is done (seqlock), the reader
+    retries while a write is in progress, so no lock is shared between processes. The published
+    sequence number counts the writes: 0 means the slot was never written.
+    """
+
+    _HEADER = struct.Struct("<Qd")
+    _STAMP = struct.Struct("<d")
+
+    def __init__(self, name: str = None, payload_format: str = "4f"):
+        """
+        Args:
+            name: shared memory name, if None, create new one
+            payload_format: struct format of the payload, little-endian is implied
+        """
+        self.payload = struct.Struct("<" + payload_format.lstrip("<=!>@"))
+        self.size = self._HEADER.size + self.payload.size
+        self.lock = threading.Lock()  # serializes writers of this process
+
+        if name:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name)
+                self.created = False
+                if self.shm.size < self.size:
+                    raise ValueError(f"shared memory {name} is smaller than the slot ({self.shm.size} < {self.size})")
+            except FileNotFoundError:
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.size)
+                self.created = True
+        else:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.size)
+            self.created = True
+        self.shm_name = self.shm.name
+        if self.created:
+            self.shm.buf[:self.size] = bytes(self.size)
+
+    def _sequence(self) -> int:
+        return int.from_bytes(self.shm.buf[0:8], "little")
+
+    def write(self, values, timestamp: float = None) -> int:
+        """Write the payload
+
+        Args:
+            values: the payload values, in the order of the struct format
+            timestamp: stamp of the values, default time.monotonic()
+
+        Returns:
+            int: the sequence number of this write
+        """
+        with self.lock:
+            sequence = self._sequence() | 1
+            self.shm.buf[0:8] = sequence.to_bytes(8, "little")
+            # timestamp and payload are written while the sequence is odd,
+            # the even sequence is stored on its own as the last write
+            self._STAMP.pack_into(self.shm.buf, 8, time.monotonic() if timestamp is None else timestamp)
+            self.payload.pack_into(self.shm.buf, self._HEADER.size, *values)
+            self.shm.buf[0:8] = (sequence + 1).to_bytes(8, "little")
+            return (sequence + 1) // 2
+
+    def read(self, retries: int = 100) -> Optional[Tuple[int, float, tuple]]:
+        """Read the payload
+
+        Returns:
+            (sequence number, timestamp, payload values), None if the slot was never written
+            or a consistent read did not succeed within the retries
+        """
+        for _ in range(retries):
+            before = self._sequence()
+            if before & 1:
+                continue
+            if before == 0:
+                return None
+            (timestamp,) = self._STAMP.unpack_from(self.shm.buf, 8)
+            values = self.payload.unpack_from(self.shm.buf, self._HEADER.size)
+            if self._sequence() == before:
+                return before // 2, timestamp, values
+        return None
+
+    def get_name(self) -> str:
+        """Get shared memory name"""
+        return self.shm_name
+
+    def cleanup(self):
+        """Clean up shared memory"""
+        if hasattr(self, 'shm') and self.shm:
+            self.shm.close()
+            if self.created:
+                try:
+                    self.shm.unlink()
+                except:
+                    pass
+            self.shm = None
+
+    def __del__(self):
+        """Destructor"""
+        self.cleanup()
@@ -0,0 +1,132 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Sim clock DDS communication class
+Publishes the sim clock (tools/sim_clock.py) as JSON {"step": N, "sim_time": t} on "rt/sim_clock" from
+write_clock, right after every control step, and receives the step numbers external controllers stamp their commands with on
+"rt/sim_clock/cmd" (the step number as text, e.g. "42").
+
+Lockstep (--lockstep): the controller only runs step N once a command stamped N arrived. An external
+controller reads the state of step N - 1 (rt/sim_clock, rt/lowstate with tick = sim time in ms), publishes
+its commands and then the stamp N. Topics are not ordered against each other, so the commands must be
+published before the stamp.
+
+The clock is also written to the "isaac_sim_clock" shared memory slot, readable by the other processes of the
+sim instance. Clocks written to the slot by another process are published by the polling publish thread.
+"""
+
+import json
+import threading
+from typing import Any, Optional
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
+from dds.sharedmemorymanager import SharedMemorySlot
+from tools.sim_instance import instance_shm_name
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+from unitree_sdk2py.idl.default import std_msgs_msg_dds__String_
+
+
+class SimClockDDS(DDSObject):
+    """Sim clock DDS node"""
+
+    def __init__(self, node_name: str = "sim_clock_dds"):
+        """Initialize the sim clock DDS node"""
+        # avoid duplicate initialization
+        if hasattr(self, '_initialized') and self._initialized:
+            return
+        super().__init__()
+        self.node_name = node_name
+        self._initialized = True
+        self.clock_msg = std_msgs_msg_dds__String_()
+        self.publisher = None
+        self._last_seq = 0
+        # serializes write_clock and the publish thread, so each clock is published once
+        self._publish_lock = threading.Lock()
+
+        # step and sim time of the last finished step, also readable by other processes of the instance
+        self.input_shm = SharedMemorySlot(instance_shm_name("isaac_sim_clock"), "Qd")
+        print(f"[{self.node_name}] Input shared memory: {self.input_shm.get_name()}")
+
+        # the last command stamp received, waited on by the lockstep controller
+        self.command_step = -1
+        self._command_cond = threading.Condition()
+
+        print(f"[{self.node_name}] Sim clock DDS node initialized")
+
+    def setup_publisher(self) -> bool:
+        """Setup the publisher of the sim clock"""
+        try:
+            self.publisher = create_publisher("rt/sim_clock", String_)
+            self.publisher.Init()
+
+            print(f"[{self.node_name}] Sim clock publisher initialized")
+            return True
+        except Exception as e:
+            print(f"sim_clock_dds [{self.node_name}] Sim clock publisher initialization failed: {e}")
+            return False
+
+    def setup_subscriber(self) -> bool:
+        """Setup the subscriber of the command stamps"""
+        try:
+            self.subscriber = create_subscriber("rt/sim_clock/cmd", String_)
+            self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
+
+            print(f"[{self.node_name}] Command stamp subscriber initialized")
+            return True
+        except Exception as e:
+            print(f"sim_clock_dds [{self.node_name}] Command stamp subscriber initialization failed: {e}")
+            return False
+
+    def _publish(self, step: int, sim_time: float):
+        if self.publisher is None:
+            return
+        self.clock_msg.data = json.dumps({"step": step, "sim_time": sim_time})
+        self.publisher.Write(self.clock_msg)
+
+    def dds_publisher(self) -> Any:
+        """Publish a clock written to the shared memory slot by another process
+
+        The clocks of this process are published by write_clock, these are skipped.
+        """
+        try:
+            with self._publish_lock:
+                clock = self.input_shm.read()
+                if clock is None:
+                    return
+                seq, _, (step, sim_time) = clock
+                if seq == self._last_seq:
+                    return
+                self._last_seq = seq
+                self._publish(step, sim_time)
+        except Exception as e:
+            print(f"sim_clock_dds [{self.node_name}] Error processing publish data: {e}")
+            return None
+
+    def dds_subscriber(self, msg: String_, datatype: str = None) -> None:
+        """Store the step a command is stamped with"""
+        try:
+            step = int(msg.data.strip())
+        except (AttributeError, ValueError):
+            print(f"sim_clock_dds [{self.node_name}] cannot parse command stamp: {msg.data}")
+            return
+        with self._command_cond:
+            if step > self.command_step:
+                self.command_step = step
+                self._command_cond.notify_all()
+
+    def write_clock(self, step: int, sim_time: float):
+        """Publish the clock of a finished step and write it to the shared memory slot"""
+        try:
+            with self._publish_lock:
+                self._last_seq = self.input_shm.write((step, sim_time))
+                self._publish(step, sim_time)
+        except Exception as e:
+            print(f"sim_clock_dds [{self.node_name}] Error writing the sim clock: {e}")
+
+    def wait_for_step(self, step: int, timeout: Optional[float] = None) -> bool:
+        """Wait until a command stamped with step (or a later step) arrived
+
+        Returns:
+            bool: False on timeout
+        """
+        with self._command_cond:
+            return self._command_cond.wait_for(lambda: self.command_step >= step, timeout)
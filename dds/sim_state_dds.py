@@ -8,8 +8,7 @@ Specialized in publishing and receiving sim state data
 import threading
 import torch
 from typing import Any, Dict, Optional
-from dds.dds_base import DDSObject
-from unitree_sdk2py.core.channel import ChannelPublisher, ChannelSubscriber
+from dds.dds_base import DDSObject, create_publisher, create_subscriber
 from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
 from unitree_sdk2py.idl.default import std_msgs_msg_dds__String_
 
@@ -43,7 +42,7 @@ class SimStateDDS(DDSObject):
     def setup_publisher(self) -> bool:
         """Setup the publisher of the sim state"""
         try:
-            self.publisher = ChannelPublisher("rt/sim_state", String_)
+            self.publisher = create_publisher("rt/sim_state", String_)
             self.publisher.Init()
             
             print(f"[{self.node_name}] Sim state publisher initialized")
@@ -55,7 +54,7 @@ class SimStateDDS(DDSObject):
     def setup_subscriber(self) -> bool:
         """Setup the subscriber of the sim state"""
         try:
-            self.subscriber = ChannelSubscriber("rt/sim_state_cmd", String_)
+            self.subscriber = create_subscriber("rt/sim_state_cmd", String_)
             self.subscriber.Init(lambda msg: self.dds_subscriber(msg, ""), 1)
             
             print(f"[{self.node_name}] Sim state subscriber initialized")
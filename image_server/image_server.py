@@ -2,6 +2,14 @@
 # License: Apache License, Version 2.0  
 """
 A ZMQ-based image server that reads multi-image data from shared memory and publishes it
+
+The concatenated color images are sent as one JPEG per message on the image port. When depth is enabled for
+any camera (tools/camera_settings.py), the concatenated uint16 depth images (millimetres) are sent as one
+16-bit PNG per message on the depth port (image port + 1000), in the same order as the color images.
+
+The frames are paced at fps frames per second of sim time (the shared memory header stamps), so a sim running
+slower or faster than real time streams the same frames per sim second. Frames stamped with a sim time that
+does not advance (no controller stepping the sim clock) are sent as they come.
 """
 
 import cv2
@@ -9,21 +17,34 @@ import zmq
 import time
 import threading
 from image_server.shared_memory_utils import MultiImageReader
+from tools.sim_instance import image_port, DEPTH_PORT_OFFSET
 
 
 class ImageServer:
-    def __init__(self, fps=30, port=5555, Unit_Test=False):
+    def __init__(self, fps=30, port=None, Unit_Test=False, auto_start=True, jpeg_quality=95, depth_port=None):
         """
         Multi-image server - read multi-image data from shared memory and publish it
+        fps: frames per second of sim time, 0 or None to send every new frame
+        port: ZMQ publish port, default is the port of the current sim instance (5555 for instance 0)
+        auto_start: start the publishing thread, False to drive send_frame() from the caller (benchmarks)
+        jpeg_quality: JPEG quality of the color stream
+        depth_port: ZMQ publish port of the depth stream, default port + 1000
         """
         print("[Image Server] Initializing multi-image server from shared memory")
         
         self.fps = fps
-        self.port = port
+        self.frame_interval_ms = 1000.0 / fps if fps else 0.0
+        self.last_sent_ms = None
+        self.next_frame_ms = 0.0
+        self.port = port if port is not None else image_port()
         self.Unit_Test = Unit_Test
         self.running = False
         self.publish_thread = None
         self.frame_count = 0
+        self.depth_port = depth_port if depth_port is not None else self.port + DEPTH_PORT_OFFSET
+        self.encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), int(jpeg_quality)]
+        # fast 16-bit PNG, depth compresses well even at the lowest level
+        self.depth_encode_params = [int(cv2.IMWRITE_PNG_COMPRESSION), 1]
 
         # Initialize multi-image shared memory reader
         self.multi_image_reader = MultiImageReader()
@@ -32,6 +53,8 @@ class ImageServer:
         self.context = zmq.Context()
         self.socket = self.context.socket(zmq.PUB)
         self.socket.bind(f"tcp://*:{self.port}")
+        # the depth socket is bound when the first depth frame arrives
+        self.depth_socket = None
 
         if self.Unit_Test:
             self._init_performance_metrics()
@@ -39,7 +62,8 @@ class ImageServer:
         print(f"[Image Server] Multi-image server initialized on port {self.port}")
         
         # start the publishing thread
-        self.start_publishing()
+        if auto_start:
+            self.start_publishing()
 
     def _init_performance_metrics(self):
         self.frame_count = 0
@@ -59,41 +83,61 @@ class ImageServer:
             real_time_fps = len(self.frame_times) / self.time_window if self.frame_times else 0
             print(f"[Image Server] Real-time FPS: {real_time_fps:.2f}, Total frames sent: {self.frame_count}, Elapsed time: {elapsed_time:.2f} sec")
 
+    def send_frame(self) -> bool:
+        """Read the concatenated images from shared memory, encode and send them once
+
+        Returns:
+            bool: False if there is no image data or encoding failed
+        """
+        # read the concatenated images from shared memory
+        frame = self.multi_image_reader.read_frame()
+        if frame is None:
+            return False
+        timestamp = frame["timestamp"]
+        if self.frame_interval_ms and self.last_sent_ms is not None and timestamp > self.last_sent_ms:
+            if timestamp < self.next_frame_ms:
+                # too early in sim time for the next frame
+                return False
+            self.next_frame_ms += self.frame_interval_ms
+            if self.next_frame_ms <= timestamp:
+                self.next_frame_ms = timestamp + self.frame_interval_ms
+        else:
+            self.next_frame_ms = timestamp + self.frame_interval_ms
+        self.last_sent_ms = timestamp
+
+        # encode the images
+        ret, buffer = cv2.imencode('.jpg', frame["color"], self.encode_params)
+        if not ret:
+            print("[Image Server] Frame imencode is failed.")
+            return False
+
+        # send the message
+        self.socket.send(buffer.tobytes())
+        if frame["depth"] is not None:
+            self._send_depth(frame["depth"])
+        self.frame_count += 1
+        return True
+
+    def _send_depth(self, depth):
+        if self.depth_socket is None:
+            self.depth_socket = self.context.socket(zmq.PUB)
+            self.depth_socket.bind(f"tcp://*:{self.depth_port}")
+            print(f"[Image Server] Depth stream published on port {self.depth_port}")
+        ret, buffer = cv2.imencode('.png', depth, self.depth_encode_params)
+        if not ret:
+            print("[Image Server] Depth imencode is failed.")
+            return
+        self.depth_socket.send(buffer.tobytes())
+
     def send_process(self):
         """Read the concatenated images from shared memory and send them"""
         print("[Image Server] Starting send_process from shared memory...")
         
         try:
             while True:
-                # read the concatenated images from shared memory
-                concatenated_image = self.multi_image_reader.read_concatenated_image()
-                
-                if concatenated_image is None:
+                if not self.send_frame():
                     # if there is no image data, wait a moment and try again
                     time.sleep(0.01)
-                    continue
-                
-                # show the concatenated images
-                # cv2.imshow('Concatenated Images (Head + Left + Right)', concatenated_image)
-                # key = cv2.waitKey(1) & 0xFF
-                # if key == ord('q') or key == 27:  # 'q' 或 ESC 键退出
-                #     print("[Image Server] User pressed quit key")
-                #     break
-                
-                # encode the images
-                ret, buffer = cv2.imencode('.jpg', concatenated_image)
-                if not ret:
-                    print("[Image Server] Frame imencode is failed.")
-                    continue
-
-                jpg_bytes = buffer.tobytes()
-
-                # build the message
-                message = jpg_bytes
-
-                # send the message
-                self.socket.send(message)
-                self.frame_count += 1
 
         except KeyboardInterrupt:
             print("[Image Server] Interrupted by user.")
@@ -121,13 +165,19 @@ class ImageServer:
     def _close(self):
         """Close the server"""
         self.stop_publishing()
-        cv2.destroyAllWindows()
+        try:
+            cv2.destroyAllWindows()
+        except cv2.error:
+            # headless OpenCV builds (e.g. CI boxes running tools/bench_pipeline.py) have no window support
+            pass
         
         # close the shared memory reader
         if hasattr(self, 'multi_image_reader'):
             self.multi_image_reader.close()
             
         # close the network connection
+        if self.depth_socket is not None:
+            self.depth_socket.close()
         self.socket.close()
         self.context.term()
         print("[Image Server] Multi-image server closed")
@@ -4,6 +4,12 @@
 A simplified multi-image shared memory tool module
 When writing, concatenate three images (head, left, right) horizontally and write them
 When reading, split the concatenated image into three independent images
+
+The header timestamp and sim_step are the sim time (milliseconds) and step of the frame (tools/sim_clock.py),
+new frames are detected by the frame id.
+
+Depth images (uint16, millimetres) of the cameras with depth enabled are concatenated the same way and
+written after the color data. The shared memory size and the image widths follow tools/camera_settings.py.
 """
 
 import ctypes
@@ -13,52 +19,85 @@ import cv2
 from multiprocessing import shared_memory
 from typing import Optional, Dict, List
 import struct
+from tools.sim_instance import instance_shm_name
+from tools.camera_settings import CAMERA_ROLES, image_shm_size
+from tools.sim_clock import sim_clock
 
 # shared memory configuration
-SHM_NAME = "isaac_multi_image_shm"
-SHM_SIZE = 640 * 480 * 3 * 3 + 1024  # the size of the concatenated images + the header information buffer
+SHM_NAME = "isaac_multi_image_shm"  # base name, namespaced per sim instance
+MAX_IMAGES = len(CAMERA_ROLES)
 
 # define the simplified header structure
 class SimpleImageHeader(ctypes.Structure):
     """Simplified image header structure"""
     _fields_ = [
-        ('timestamp', ctypes.c_uint64),    # timestamp
+        ('timestamp', ctypes.c_uint64),    # sim time in milliseconds
         ('height', ctypes.c_uint32),       # image height
         ('width', ctypes.c_uint32),        # total width after concatenation
         ('channels', ctypes.c_uint32),     # number of channels
         ('single_width', ctypes.c_uint32), # single image width
         ('image_count', ctypes.c_uint32),  # number of images
         ('data_size', ctypes.c_uint32),    # data size
+        ('widths', ctypes.c_uint32 * MAX_IMAGES),  # width of every color image
+        ('depth_mask', ctypes.c_uint32),   # bit i set: image i has a depth image
+        ('depth_width', ctypes.c_uint32),  # total width of the concatenated depth images
+        ('depth_offset', ctypes.c_uint32), # offset of the depth data from the start of the shared memory
+        ('depth_size', ctypes.c_uint32),   # depth data size
+        ('frame_id', ctypes.c_uint64),     # incremented for every written frame
+        ('sim_step', ctypes.c_uint64),     # sim step of the frame
     ]
 
 
+def split_concatenated(concatenated: np.ndarray, widths) -> List[np.ndarray]:
+    """Split a horizontally concatenated image into images of the given widths"""
+    images = []
+    start = 0
+    for width in widths:
+        images.append(concatenated[:, start:start + width])
+        start += width
+    return images
+
+
 class MultiImageWriter:
     """A simplified multi-image shared memory writer"""
     
-    def __init__(self, shm_name: str = SHM_NAME, shm_size: int = SHM_SIZE):
+    def __init__(self, shm_name: str = None, shm_size: int = None):
         """Initialize the multi-image shared memory writer
         
         Args:
-            shm_name: the name of the shared memory
-            shm_size: the size of the shared memory
+            shm_name: the name of the shared memory, default SHM_NAME of the current sim instance
+            shm_size: the size of the shared memory, default the size of the camera settings
         """
+        if shm_name is None:
+            shm_name = instance_shm_name(SHM_NAME)
+        if shm_size is None:
+            shm_size = image_shm_size()
         self.shm_name = shm_name
         self.shm_size = shm_size
         
         try:
             # try to open the existing shared memory
             self.shm = shared_memory.SharedMemory(name=shm_name)
+            if self.shm.size < shm_size:
+                # left over from a run with a larger resolution or without depth
+                self.shm.close()
+                self.shm.unlink()
+                self.shm = shared_memory.SharedMemory(create=True, size=shm_size, name=shm_name)
         except FileNotFoundError:
             # if not exist, create a new shared memory
             self.shm = shared_memory.SharedMemory(create=True, size=shm_size, name=shm_name)
         
-        print(f"[MultiImageWriter] Shared memory initialized: {shm_name}")
+        # continue the frame ids of a previous writer, so readers attached to the segment see new frames
+        header_size = ctypes.sizeof(SimpleImageHeader)
+        self.frame_id = SimpleImageHeader.from_buffer_copy(bytes(self.shm.buf[:header_size])).frame_id
+        print(f"[MultiImageWriter] Shared memory initialized: {shm_name} ({shm_size} bytes)")
 
-    def write_images(self, images: Dict[str, np.ndarray]) -> bool:
+    def write_images(self, images: Dict[str, np.ndarray], depths: Optional[Dict[str, np.ndarray]] = None) -> bool:
         """Write multiple images to the shared memory (concatenate and write)
         
         Args:
             images: the image dictionary, the key is the image name ('head', 'left', 'right'), the value is the image array
+            depths: uint16 depth images of the same names, optional
             
         Returns:
             bool: whether the writing is successful
@@ -69,9 +108,11 @@ class MultiImageWriter:
         try:
             # get the images in order: head, left, right
             frames_to_concat = []
-            image_order = ['head', 'left', 'right']
+            depth_frames = []
+            widths = []
+            depth_mask = 0
             
-            for image_name in image_order:
+            for image_name in CAMERA_ROLES:
                 if image_name in images:
                     image = images[image_name]
                     if not image.flags['C_CONTIGUOUS']:
@@ -81,7 +122,11 @@ class MultiImageWriter:
                     if image.shape[2] == 3:  # ensure it is a 3-channel image
                         image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
                     
+                    if depths is not None and image_name in depths:
+                        depth_mask |= 1 << len(frames_to_concat)
+                        depth_frames.append(depths[image_name])
                     frames_to_concat.append(image)
+                    widths.append(image.shape[1])
             
             if not frames_to_concat:
                 return False
@@ -94,29 +139,45 @@ class MultiImageWriter:
             
             # get the image information
             height, total_width, channels = concatenated_image.shape
-            single_width = total_width // len(frames_to_concat)
             data_size = height * total_width * channels
             
             # prepare the header information
+            header_size = ctypes.sizeof(SimpleImageHeader)
             header = SimpleImageHeader()
-            header.timestamp = int(time.time() * 1000)  # millisecond timestamp
+            header.timestamp = sim_clock.sim_time_ms()
+            header.sim_step = sim_clock.step
+            header.frame_id = self.frame_id + 1
             header.height = height
             header.width = total_width
             header.channels = channels
-            header.single_width = single_width
+            header.single_width = widths[0]
             header.image_count = len(frames_to_concat)
             header.data_size = data_size
+            for i, width in enumerate(widths):
+                header.widths[i] = width
             
-            # write the header
-            header_size = ctypes.sizeof(SimpleImageHeader)
-            header_bytes = ctypes.string_at(ctypes.byref(header), header_size)
-            header_view = memoryview(self.shm.buf)
-            header_view[:header_size] = header_bytes
+            depth_bytes = b""
+            if depth_frames:
+                concatenated_depth = cv2.hconcat(depth_frames) if len(depth_frames) > 1 else np.ascontiguousarray(depth_frames[0])
+                depth_bytes = concatenated_depth.astype(np.uint16, copy=False).tobytes()
+                header.depth_mask = depth_mask
+                header.depth_width = concatenated_depth.shape[1]
+                header.depth_offset = header_size + data_size
+                header.depth_size = len(depth_bytes)
+            if header_size + data_size + len(depth_bytes) > self.shm.size:
+                print(f"[MultiImageWriter] Images ({data_size + len(depth_bytes)} bytes) do not fit into {self.shm_name} ({self.shm.size} bytes)")
+                return False
             
             # write the image data
-            image_bytes = concatenated_image.tobytes()
             data_view = memoryview(self.shm.buf)
-            data_view[header_size:header_size + len(image_bytes)] = image_bytes
+            data_view[header_size:header_size + data_size] = concatenated_image.tobytes()
+            if depth_bytes:
+                data_view[header.depth_offset:header.depth_offset + header.depth_size] = depth_bytes
+            
+            # write the header last, readers use the frame id to detect new data
+            header_bytes = ctypes.string_at(ctypes.byref(header), header_size)
+            data_view[:header_size] = header_bytes
+            self.frame_id = header.frame_id
             return True
             
         except Exception as e:
@@ -124,24 +185,37 @@ class MultiImageWriter:
             print(f"Images: {list(images.keys())}")
             return False
 
-    def close(self):
-        """Close the shared memory"""
+    def close(self, unlink: bool = False):
+        """Close the shared memory
+
+        Args:
+            unlink: also remove the segment; by default it is kept for the readers attached to it
+                and for the next writer of the instance
+        """
         if hasattr(self, 'shm') and self.shm is not None:
             self.shm.close()
+            if unlink:
+                try:
+                    self.shm.unlink()
+                except FileNotFoundError:
+                    pass
+            self.shm = None
             print(f"[MultiImageWriter] Shared memory closed: {self.shm_name}")
 
 
 class MultiImageReader:
     """A simplified multi-image shared memory reader"""
     
-    def __init__(self, shm_name: str = SHM_NAME):
+    def __init__(self, shm_name: str = None):
         """Initialize the multi-image shared memory reader
         
         Args:
-            shm_name: the name of the shared memory
+            shm_name: the name of the shared memory, default SHM_NAME of the current sim instance
         """
+        if shm_name is None:
+            shm_name = instance_shm_name(SHM_NAME)
         self.shm_name = shm_name
-        self.last_timestamp = 0
+        self.last_frame_id = 0
         self.buffer = {}
         
         try:
@@ -152,64 +226,91 @@ class MultiImageReader:
             print(f"[MultiImageReader] Shared memory {shm_name} not found")
             self.shm = None
 
-    def read_images(self) -> Optional[Dict[str, np.ndarray]]:
-        """Read multiple images from the shared memory (read the concatenated images and split them)
-        
+    def _read_new_header(self) -> Optional[SimpleImageHeader]:
+        """the header if the shared memory has data newer than the last read, otherwise None"""
+        header_size = ctypes.sizeof(SimpleImageHeader)
+        header = SimpleImageHeader.from_buffer_copy(bytes(self.shm.buf[:header_size]))
+        if header.frame_id == self.last_frame_id:
+            return None
+        return header
+
+    def _read_color(self, header: SimpleImageHeader) -> Optional[np.ndarray]:
+        start_offset = ctypes.sizeof(SimpleImageHeader)
+        image_data = bytes(self.shm.buf[start_offset:start_offset + header.data_size])
+        concatenated_image = np.frombuffer(image_data, dtype=np.uint8)
+
+        # ensure the data size is correct
+        expected_size = header.height * header.width * header.channels
+        if concatenated_image.size != expected_size:
+            print(f"[MultiImageReader] Data size mismatch: expected {expected_size}, got {concatenated_image.size}")
+            return None
+        return concatenated_image.reshape(header.height, header.width, header.channels)
+
+    def _read_depth(self, header: SimpleImageHeader) -> Optional[np.ndarray]:
+        if not header.depth_mask:
+            return None
+        depth_data = bytes(self.shm.buf[header.depth_offset:header.depth_offset + header.depth_size])
+        concatenated_depth = np.frombuffer(depth_data, dtype=np.uint16)
+        if concatenated_depth.size != header.height * header.depth_width:
+            print(f"[MultiImageReader] Depth size mismatch: expected {header.height * header.depth_width}, got {concatenated_depth.size}")
+            return None
+        return concatenated_depth.reshape(header.height, header.depth_width)
+
+    @staticmethod
+    def _widths(header: SimpleImageHeader) -> List[int]:
+        widths = list(header.widths[:header.image_count])
+        if not any(widths):
+            # written without per-image widths
+            widths = [header.single_width] * header.image_count
+        return widths
+
+    def read_frame(self) -> Optional[dict]:
+        """Read the new color and depth images at once
+
         Returns:
-            Dict[str, np.ndarray]: the image dictionary, the key is the image name, the value is the image array; if the reading fails, return None
+            None if there is no new data, otherwise {"color": concatenated BGR image, "depth": concatenated uint16
+            depth or None, "names": image names, "widths": image widths, "depth_names": names of the depth images,
+            "timestamp": sim time in milliseconds, "sim_step": sim step, "frame_id": frame id}
         """
         if self.shm is None:
             return None
-            
         try:
-            # read the header data
-            header_size = ctypes.sizeof(SimpleImageHeader)
-            header_data = bytes(self.shm.buf[:header_size])
-            header = SimpleImageHeader.from_buffer_copy(header_data)
-            
-            # check if there is new data
-            if header.timestamp <= self.last_timestamp:
-                return self.buffer
-                
-            # read the concatenated image data
-            start_offset = header_size
-            end_offset = start_offset + header.data_size
-            image_data = bytes(self.shm.buf[start_offset:end_offset])
-            
-            # convert to numpy array
-            concatenated_image = np.frombuffer(image_data, dtype=np.uint8)
-            
-            # ensure the data size is correct
-            expected_size = header.height * header.width * header.channels
-            if concatenated_image.size != expected_size:
-                print(f"[MultiImageReader] Data size mismatch: expected {expected_size}, got {concatenated_image.size}")
+            header = self._read_new_header()
+            if header is None:
                 return None
-                
-            # reshape the array
-            concatenated_image = concatenated_image.reshape(header.height, header.width, header.channels)
-            
-            # split the images
-            images = {}
-            image_names = ['head', 'left', 'right']
-            single_width = header.single_width
-            
-            for i in range(header.image_count):
-                if i < len(image_names):
-                    start_col = i * single_width
-                    end_col = start_col + single_width
-                    
-                    # split the single image
-                    single_image = concatenated_image[:, start_col:end_col, :]
-                    images[image_names[i]] = single_image
-            
-            # update the buffer and timestamp
-            self.buffer = images
-            self.last_timestamp = header.timestamp
-            return images
-            
+            color = self._read_color(header)
+            if color is None:
+                return None
+            names = list(CAMERA_ROLES[:header.image_count])
+            self.last_frame_id = header.frame_id
+            return {
+                "color": color,
+                "depth": self._read_depth(header),
+                "names": names,
+                "widths": self._widths(header),
+                "depth_names": [name for i, name in enumerate(names) if header.depth_mask & (1 << i)],
+                "timestamp": header.timestamp,
+                "frame_id": header.frame_id,
+                "sim_step": header.sim_step,
+            }
         except Exception as e:
-            print(f"[MultiImageReader] Error reading from shared memory: {e}")
+            print(f"[MultiImageReader] Error reading frame from shared memory: {e}")
+            return None
+
+    def read_images(self) -> Optional[Dict[str, np.ndarray]]:
+        """Read multiple images from the shared memory (read the concatenated images and split them)
+        
+        Returns:
+            Dict[str, np.ndarray]: the image dictionary, the key is the image name, the value is the image array; if the reading fails, return None
+        """
+        if self.shm is None:
             return None
+        frame = self.read_frame()
+        if frame is None:
+            # no new data, return the last images
+            return self.buffer
+        self.buffer = dict(zip(frame["names"], split_concatenated(frame["color"], frame["widths"])))
+        return self.buffer
 
     def read_concatenated_image(self) -> Optional[np.ndarray]:
         """Read the concatenated image (without splitting)
@@ -217,44 +318,8 @@ class MultiImageReader:
         Returns:
             np.ndarray: the concatenated image array; if the reading fails, return None
         """
-        if self.shm is None:
-            return None
-            
-        try:
-            # read the header data
-            header_size = ctypes.sizeof(SimpleImageHeader)
-            header_data = bytes(self.shm.buf[:header_size])
-            header = SimpleImageHeader.from_buffer_copy(header_data)
-            
-            # check if there is new data
-            if header.timestamp <= self.last_timestamp:
-                return None
-            
-            # read the concatenated image data
-            start_offset = header_size
-            end_offset = start_offset + header.data_size
-            image_data = bytes(self.shm.buf[start_offset:end_offset])
-            
-            # convert to numpy array
-            concatenated_image = np.frombuffer(image_data, dtype=np.uint8)
-            
-            # ensure the data size is correct
-            expected_size = header.height * header.width * header.channels
-            if concatenated_image.size != expected_size:
-                print(f"[MultiImageReader] Data size mismatch: expected {expected_size}, got {concatenated_image.size}")
-                return None
-                
-            # reshape the array
-            concatenated_image = concatenated_image.reshape(header.height, header.width, header.channels)
-            
-            # update the timestamp
-            self.last_timestamp = header.timestamp
-            # print(f"concatenated_image: {concatenated_image.shape}")
-            return concatenated_image
-            
-        except Exception as e:
-            print(f"[MultiImageReader] Error reading concatenated image from shared memory: {e}")
-            return None
+        frame = self.read_frame()
+        return None if frame is None else frame["color"]
 
     def close(self):
         """Close the shared memory"""
@@ -267,7 +332,7 @@ class MultiImageReader:
 class SharedMemoryWriter:
     """Backward compatible single image writer"""
     
-    def __init__(self, shm_name: str = SHM_NAME, shm_size: int = SHM_SIZE):
+    def __init__(self, shm_name: str = None, shm_size: int = None):
         self.multi_writer = MultiImageWriter(shm_name, shm_size)
     
     def write_image(self, image: np.ndarray) -> bool:
@@ -281,7 +346,7 @@ class SharedMemoryWriter:
 class SharedMemoryReader:
     """Backward compatible single image reader"""
     
-    def __init__(self, shm_name: str = SHM_NAME):
+    def __init__(self, shm_name: str = None):
         self.multi_reader = MultiImageReader(shm_name)
     
     def read_image(self) -> Optional[np.ndarray]:
@@ -5,10 +5,11 @@ A layered robot control system
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 import torch
 from dataclasses import dataclass
 from action_provider.action_base import ActionProvider
+from tools.sim_clock import sim_clock
 
 
 @dataclass
@@ -17,11 +18,17 @@ class ControlConfig:
     step_hz: int = 500  # the frequency of the low-level execution
     replay_mode: bool = False
     use_rl_action_mode: bool = False
+    # None: pace the steps at step_hz wall clock; > 0: run sim time at this multiple of wall time; 0: unbounded
+    real_time_factor: Optional[float] = None
 
 
 class RobotController:
     """robot controller
     """
+
+    # seconds one lockstep wait blocks before step() returns to the main loop, and between waiting reports
+    LOCKSTEP_POLL = 0.1
+    LOCKSTEP_REPORT = 5.0
     
     def __init__(self, env, config: ControlConfig):
         self.env = env
@@ -30,9 +37,16 @@ class RobotController:
         self.is_running = False
         
         
-        # minimal frequency control
+        # minimal frequency control, the interval follows the real time factor once the sim dt is known
         self._step_interval = 1.0 / config.step_hz
         self._last_step_time = 0.0
+        self.sim_dt = getattr(env, "step_dt", self._step_interval)
+        self.sim_clock = sim_clock
+        self._update_step_interval()
+        # clock_publisher(step, sim_time) is called after every step, lockstep_wait(step, timeout) gates the steps
+        self.clock_publisher: Optional[Callable[[int, float], None]] = None
+        self.lockstep_wait: Optional[Callable[[int, float], bool]] = None
+        self._lockstep_wait_since = None
         
         all_joint_names = env.scene["robot"].data.joint_names
         self._last_action = torch.zeros(len(all_joint_names), device=env.device)
@@ -53,8 +67,56 @@ class RobotController:
         # cache the function reference (reduce the lookup overhead)
         self._perf_counter = time.perf_counter
         self._time_sleep = time.sleep
+        self._rtf_window = (self._perf_counter(), self.sim_clock.sim_time)
         
         print(f"  - control frequency: {config.step_hz}Hz")
+        print(f"  - real time factor: {self._describe_real_time_factor()}")
+
+    def _describe_real_time_factor(self) -> str:
+        factor = self.config.real_time_factor
+        if factor is None:
+            return f"paced at {self.config.step_hz}Hz"
+        return "unbounded" if factor == 0 else f"{factor:g}"
+
+    def set_clock_publisher(self, publisher: Callable[[int, float], None]):
+        """publish the sim clock after every step (and once on start)"""
+        self.clock_publisher = publisher
+
+    def set_lockstep(self, wait: Optional[Callable[[int, float], bool]]):
+        """only run step N after wait(N, timeout) returned True, None to disable
+
+        The steps are not paced in lockstep, the sim runs as fast as the commands arrive.
+        """
+        self.lockstep_wait = wait
+        print(f"[SimpleController] lockstep {'enabled' if wait else 'disabled'}")
+
+    def _publish_clock(self):
+        if self.clock_publisher:
+            self.clock_publisher(self.sim_clock.step, self.sim_clock.sim_time)
+
+    def _lockstep_ready(self) -> bool:
+        """wait a short time for the command of the next step, the caller retries while it is missing"""
+        next_step = self.sim_clock.step + 1
+        if self.lockstep_wait(next_step, self.LOCKSTEP_POLL):
+            self._lockstep_wait_since = None
+            return True
+        now = self._perf_counter()
+        if self._lockstep_wait_since is None:
+            self._lockstep_wait_since = now
+        elif now - self._lockstep_wait_since >= self.LOCKSTEP_REPORT:
+            print(f"[SimpleController] lockstep: waiting for a command stamped {next_step} on rt/sim_clock/cmd")
+            self._lockstep_wait_since = now
+        return False
+
+    def _update_step_interval(self):
+        """wall time per step: 1 / step_hz, or the sim dt scaled by the real time factor (0 for unbounded)"""
+        factor = self.config.real_time_factor
+        if factor is None:
+            self._step_interval = 1.0 / self.config.step_hz
+        elif factor == 0:
+            self._step_interval = 0.0
+        else:
+            self._step_interval = self.sim_dt / factor
     
     def set_action_provider(self, provider: ActionProvider):
         """set the action provider"""
@@ -63,7 +125,11 @@ class RobotController:
             self.action_provider.cleanup()
         
         self.action_provider = provider
-        print(f"[SimpleController] set the action provider: {provider.name}")
+        # providers that step the sim themselves advance it by their own dt per step
+        if provider.sim_dt:
+            self.sim_dt = provider.sim_dt
+            self._update_step_interval()
+        print(f"[SimpleController] set the action provider: {provider.name} (sim dt {self.sim_dt:g}s per step)")
     
     def start(self):
         """start the controller"""
@@ -73,10 +139,13 @@ class RobotController:
         self.is_running = True
         self._start_time = time.time()
         self._last_step_time = self._perf_counter()
+        self._rtf_window = (self._last_step_time, self.sim_clock.sim_time)
         
         # start the action provider
         if self.action_provider:
             self.action_provider.start()
+        # the initial state, lockstep controllers wait for it before stamping step 1
+        self._publish_clock()
         
         print("[SimpleController] the controller is started")
     
@@ -96,10 +165,14 @@ class RobotController:
         """minimal control step - zero thread competition"""
         if not self.is_running:
             return
+        if self.lockstep_wait and not self._lockstep_ready():
+            return
         
         # use the cached function reference
         perf_counter = self._perf_counter
         step_start = perf_counter()
+        # the clock holds the sim time of the state this step produces
+        self.sim_clock.advance(self.sim_dt)
         
         # 1. minimal action acquisition (synchronous, zero thread competition, pre-calculated strategy)
         action_start = perf_counter()
@@ -127,11 +200,12 @@ class RobotController:
         env_time = perf_counter() - env_start
         
         self.step_count += 1
+        self._publish_clock()
         
         # 3. minimal frequency control (no rendering overhead, use the pre-calculated threshold)
         sleep_start = perf_counter()
         current_time = perf_counter()
-        if self._last_step_time > 0:
+        if self._last_step_time > 0 and self._step_interval > 0 and not self.lockstep_wait:
             elapsed = current_time - self._last_step_time
             sleep_needed = self._step_interval - elapsed
             if sleep_needed > self._sleep_threshold:  # use the pre-calculated threshold
@@ -143,8 +217,16 @@ class RobotController:
         self._profile_counter += 1
         if self._profile_counter >= self._profile_interval:
             total_time = perf_counter() - step_start
-            print(f"[Performance] A:{action_time*1000:.1f}ms, E:{env_time*1000:.1f}ms, S:{sleep_time*1000:.1f}ms, T:{total_time*1000:.1f}ms")
+            print(f"[Performance] A:{action_time*1000:.1f}ms, E:{env_time*1000:.1f}ms, S:{sleep_time*1000:.1f}ms, T:{total_time*1000:.1f}ms, "
+                  f"RTF:{self.measured_real_time_factor():.2f}")
             self._profile_counter = 0
+    def measured_real_time_factor(self) -> float:
+        """sim seconds per wall second since the previous call (or the start)"""
+        now = self._perf_counter()
+        wall_start, sim_start = self._rtf_window
+        self._rtf_window = (now, self.sim_clock.sim_time)
+        elapsed = now - wall_start
+        return (self.sim_clock.sim_time - sim_start) / elapsed if elapsed > 0 else 0.0
     def cleanup(self):
         """clean up the resources"""
         self.stop()
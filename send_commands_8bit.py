@@ -6,6 +6,7 @@ publish reset category command to rt/reset_pose/cmd
 import time
 from unitree_sdk2py.core.channel import ChannelPublisher, ChannelFactoryInitialize
 from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+from tools.sim_instance import dds_domain_id  # set SIM_INSTANCE_ID to talk to another sim instance
 
 import threading
 import math
@@ -362,7 +363,7 @@ def publish_reset_category(category: int,publisher):
 
 if __name__ == "__main__":
     # initialize DDS
-    ChannelFactoryInitialize(1)
+    ChannelFactoryInitialize(dds_domain_id())
     publisher = ChannelPublisher("rt/run_command/cmd", String_)
     publisher.Init()
     gamepad_controller = GamepadController()
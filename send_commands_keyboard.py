@@ -6,6 +6,7 @@
 import time
 from unitree_sdk2py.core.channel import ChannelPublisher, ChannelFactoryInitialize
 from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+from tools.sim_instance import dds_domain_id  # set SIM_INSTANCE_ID to talk to another sim instance
 
 import threading
 import math
@@ -260,7 +261,7 @@ if __name__ == "__main__":
             
         # initialize DDS
         print("initializing DDS communication...")
-        ChannelFactoryInitialize(1)
+        ChannelFactoryInitialize(dds_domain_id())
         publisher = ChannelPublisher("rt/run_command/cmd", String_)
         publisher.Init()
         print("DDS communication initialized")
@@ -20,8 +20,10 @@ from pathlib import Path
 # Isaac Lab AppLauncher
 from isaaclab.app import AppLauncher
 
-from image_server.image_server import ImageServer
-from dds.dds_create import create_dds_objects,create_dds_objects_replay
+from tools.sim_instance import set_instance, describe_instance, dds_domain_id
+from tools.sim_context import SimContext, set_sim_context
+from tools.camera_settings import set_camera_settings, describe_camera_settings
+from tools.sim_clock import parse_real_time_factor, sim_clock
 # add command line arguments
 parser = argparse.ArgumentParser(description="Unitree Simulation")
 parser.add_argument("--task", type=str, default="Isaac-PickPlace-G129-Head-Waist-Fix", help="task name")
@@ -35,15 +37,22 @@ parser.add_argument("--enable_dex1_dds", action="store_true", help="enable gripp
 parser.add_argument("--enable_dex3_dds", action="store_true", help="enable dexterous hand DDS")
 parser.add_argument("--enable_inspire_dds", action="store_true", help="enable inspire hand DDS")
 parser.add_argument("--stats_interval", type=float, default=10.0, help="statistics print interval (seconds)")
+parser.add_argument("--reward_telemetry_hz", type=float, default=10.0, help="reward/termination sampling rate published on rt/sim_reward (0 disables)")
+parser.add_argument("--success_reward", type=float, default=1.0, help="sampled reward at or above which an episode counts as successful")
 
 parser.add_argument("--file_path", type=str, default="/home/unitree/newDisk/sim-data/Placewoodenblock", help="file path (when action_source=file)")
 parser.add_argument("--generate_data_dir", type=str, default="./data", help="save data dir")
 parser.add_argument("--generate_data", action="store_true", default=False, help="generate data")
 parser.add_argument("--rerun_log", action="store_true", default=False, help="rerun log")
+parser.add_argument("--generation_profile", type=str, default="images", help="sensors and observation terms computed per frame during --generate_data: images, full or a JSON profile file")
+parser.add_argument("--image_storage", type=str, default="jpeg", choices=["jpeg", "video"], help="generated image storage: one jpeg per frame or one video file per camera")
 parser.add_argument("--replay_data",  action="store_true", default=False, help="replay data")
+parser.add_argument("--kinematic_replay", action="store_true", default=False, help="replay by writing only the changed joint positions and object poses of each frame (no velocities, no full reset_to)")
 
 parser.add_argument("--modify_light",  action="store_true", default=False, help="modify light")
 parser.add_argument("--modify_camera",  action="store_true", default=False,    help="modify camera")
+parser.add_argument("--domain_randomization", type=str, default=None, help="JSON file of light/camera/material distributions sampled per replayed episode")
+parser.add_argument("--dr_seed", type=int, default=0, help="base seed of the per-episode domain randomization seeds")
 
 # performance analysis parameters
 parser.add_argument("--step_hz", type=int, default=500, help="control frequency")
@@ -52,11 +61,35 @@ parser.add_argument("--profile_interval", type=int, default=500, help="performan
 
 parser.add_argument("--model_path", type=str, default="assets/model/policy.onnx", help="model path")
 parser.add_argument("--enable_wholebody_dds", action="store_true", default=False, help="enable wh dds")
+parser.add_argument("--real_time_factor", type=parse_real_time_factor, default=None, help="sim seconds per wall second, e.g. 1.0 or 0.5, max for unbounded (default: pace the control steps at --step_hz)")
+parser.add_argument("--lockstep", action="store_true", default=False, help="run step N only after a command stamped N arrived on rt/sim_clock/cmd (deterministic closed-loop evaluation)")
+parser.add_argument("--policy_hz", type=float, default=None, help="wall clock rate of the whole-body policy steps (default: --step_hz)")
+parser.add_argument("--physics_substeps", type=int, default=None, help="physics steps per whole-body policy step (default: the task decimation)")
+parser.add_argument("--render_hz", type=float, default=None, help="sim time render rate of whole-body tasks, the camera observation is only computed on rendered steps (default: every policy step, 0: never)")
+parser.add_argument("--run_command_timeout", type=float, default=0.5, help="seconds the last run command is held before falling back to standing (0 holds it until the next command)")
+
+# multi-instance parameters
+parser.add_argument("--instance_id", type=int, default=0, help="sim instance id, namespaces shm segments, image port and DDS domain")
+parser.add_argument("--dds_domain_id", type=int, default=None, help="DDS domain id (default: 1 + instance_id)")
+parser.add_argument("--image_port", type=int, default=None, help="image server ZMQ port (default: 5555 + instance_id)")
+
+# camera stream parameters
+parser.add_argument("--camera_resolution", type=str, default="640x480", help="streamed camera resolution WIDTHxHEIGHT, per camera overrides like 320x240,head=640x480")
+parser.add_argument("--camera_depth", type=str, default="none", help="cameras whose 16-bit depth is streamed and recorded: none, all or e.g. head,left")
 
 # add AppLauncher parameters
 AppLauncher.add_app_launcher_args(parser)
 args_cli = parser.parse_args()
 
+# select the sim instance before any shm segment or DDS participant is created
+set_instance(args_cli.instance_id, args_cli.dds_domain_id, args_cli.image_port)
+print(f"[sim_main] {describe_instance()}")
+# the camera configs, image shared memory and episode writer follow these settings
+set_camera_settings(args_cli.camera_resolution, args_cli.camera_depth)
+print(f"[sim_main] cameras: {describe_camera_settings()}")
+from image_server.image_server import ImageServer
+from dds.dds_create import create_dds_objects,create_dds_objects_replay
+
 
 if args_cli.enable_dex3_dds and args_cli.enable_dex1_dds and args_cli.enable_inspire_dds:
     print("Error: enable_dex3_dds and enable_dex1_dds and enable_inspire_dds cannot be enabled at the same time")
@@ -74,7 +107,9 @@ from layeredcontrol.robot_control_system import (
 )
 
 from dds.reset_pose_dds import *
+_tasks_import_start = time.perf_counter()
 import tasks
+print(f"[tasks] registered {len(tasks.g1_tasks.G1_TASKS)} tasks in {(time.perf_counter() - _tasks_import_start) * 1000:.1f} ms")
 from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
 
 from tools.augmentation_utils import (
@@ -86,7 +121,9 @@ from tools.data_json_load import sim_state_to_json
 from dds.sim_state_dds import *
 from action_provider.create_action_provider import create_action_provider
 from tools.get_stiffness import get_robot_stiffness_from_env
-from tools.get_reward import get_step_reward_value,get_current_rewards
+from tools.reward_telemetry import RewardTelemetry
+from tools.scene_checkpoint import SceneCheckpointManager
+from tools.asset_cache import resolve_scene_assets, get_asset_cache_dir
 
 def setup_signal_handlers(controller,dds_manager=None):
     """set signal handlers"""
@@ -134,10 +171,20 @@ def main():
     print(f"Action source: {args_cli.action_source}")
     print("=" * 60)
 
+    # the sim context owns the image shared memory and DDS objects the observation terms publish to,
+    # they are created on first use while the environment steps
+    sim_context = SimContext()
+    set_sim_context(sim_context)
+
     # parse environment configuration
     try:
+        task_load_start = time.perf_counter()
         env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=1)
         env_cfg.env_name = args_cli.task
+        resolved_assets = resolve_scene_assets(env_cfg.scene)
+        if resolved_assets:
+            print(f"[asset_cache] {resolved_assets} scene assets resolved to the local cache {get_asset_cache_dir()}")
+        print(f"[tasks] loaded {args_cli.task} config in {time.perf_counter() - task_load_start:.2f} s")
     except Exception as e:
         print(f"Failed to parse environment configuration: {e}")
         return
@@ -192,12 +239,17 @@ def main():
         )
     env.sim.reset()
     env.reset()
+    # the scene state after the reset, restored by "reset all" instead of resetting every asset to its defaults
+    scene_checkpoints = SceneCheckpointManager(env.scene, max_checkpoints=2)
+    if not args_cli.replay_data:
+        scene_checkpoints.save("initial", is_relative=True)
     
     # create simplified control configuration
     try:    
         control_config = ControlConfig(
             step_hz=args_cli.step_hz,
-            replay_mode=args_cli.replay_data
+            replay_mode=args_cli.replay_data,
+            real_time_factor=args_cli.real_time_factor,
         )
     except Exception as e:
         print(f"Failed to create control configuration: {e}")
@@ -216,6 +268,12 @@ def main():
         print("========= create dds =========")
         try:
             reset_pose_dds,sim_state_dds,dds_manager = create_dds_objects(args_cli,env)
+            reward_telemetry_dds = dds_manager.get_object("reward_telemetry")
+            reward_telemetry = RewardTelemetry(
+                rate_hz=args_cli.reward_telemetry_hz,
+                success_reward=args_cli.success_reward,
+                publisher=reward_telemetry_dds.write_telemetry if reward_telemetry_dds is not None else None,
+            )
         except Exception as e:
             print(f"Failed to create dds: {e}")
             return
@@ -244,6 +302,8 @@ def main():
             args_cli.action_source = "dds_wholebody"
             args_cli.enable_wholebody_dds = True
             control_config.use_rl_action_mode = True
+            if args_cli.policy_hz:
+                control_config.step_hz = args_cli.policy_hz
         action_provider = create_action_provider(env,args_cli)
         if action_provider is None:
             print("action provider creation failed, exiting")
@@ -256,6 +316,15 @@ def main():
     print("========= create controller =========")
     controller = RobotController(env, control_config)
     controller.set_action_provider(action_provider)
+    if not args_cli.replay_data:
+        # publish the sim clock after every step, and gate the steps on command stamps in lockstep
+        sim_clock_dds = dds_manager.get_object("sim_clock")
+        if sim_clock_dds is not None:
+            controller.set_clock_publisher(sim_clock_dds.write_clock)
+            if args_cli.lockstep:
+                controller.set_lockstep(sim_clock_dds.wait_for_step)
+    elif args_cli.lockstep:
+        print("--lockstep is ignored during replay")
     print("========= create controller success =========")
     
     # configure performance analysis
@@ -272,7 +341,7 @@ def main():
         setup_signal_handlers(controller,dds_manager)
     else:
         setup_signal_handlers(controller)
-    print("Note: The DDS in Sim transmits messages on channel 1. Please ensure that other DDS instances use the same channel for message exchange by setting: ChannelFactoryInitialize(1).")
+    print(f"Note: The DDS in Sim transmits messages on channel {dds_domain_id()}. Please ensure that other DDS instances use the same channel for message exchange by setting: ChannelFactoryInitialize({dds_domain_id()}).")
     try:
         # start controller - start asynchronous components
         print("========= start controller =========")
@@ -295,7 +364,7 @@ def main():
                     try:
                         env_state = env.scene.get_state()
                         env_state_json =  sim_state_to_json(env_state)
-                        sim_state = {"init_state":env_state_json,"task_name":args_cli.task}
+                        sim_state = {"init_state":env_state_json,"task_name":args_cli.task, **sim_clock.stamp()}
                     except Exception as e:
                         print(f"Failed to get env state: {e}")
                         raise e
@@ -312,13 +381,8 @@ def main():
                         print(f"Failed to get reset pose command: {e}")
                         raise e
                     # # print(f"reset_pose_cmd: {reset_pose_cmd}")
-                    # Compute current reward values manually if needed for debugging
-                    try:
-                        current_reward = get_step_reward_value(env)
-                        print(f"reward: {current_reward}")
-                    except Exception as e:
-                        print(f"奖励计算失败: {e}")
-                        pass
+                    # sample the reward and termination terms at --reward_telemetry_hz, published on rt/sim_reward
+                    reward_telemetry.update(env, loop_count)
                     
                     if reset_pose_cmd is not None:
                         try:
@@ -326,11 +390,14 @@ def main():
                             # print(f"reset_category: {reset_category}")
                             if (args_cli.enable_wholebody_dds and (reset_category == '1' or reset_category == '2')) or (not args_cli.enable_wholebody_dds and reset_category == '1'):
                                 print("reset object")
+                                reward_telemetry.end_episode("reset_object")
                                 env_cfg.event_manager.trigger("reset_object_self", env)
                                 reset_pose_dds.write_reset_pose_command(-1)
                             elif reset_category == '2' and not args_cli.enable_wholebody_dds:
                                 print("reset all")
-                                env_cfg.event_manager.trigger("reset_all_self", env)
+                                reward_telemetry.end_episode("reset_all")
+                                if not scene_checkpoints.restore("initial"):
+                                    env_cfg.event_manager.trigger("reset_all_self", env)
                                 reset_pose_dds.write_reset_pose_command(-1)
                         except Exception as e:
                             print(f"Failed to write reset pose command: {e}")
@@ -346,7 +413,9 @@ def main():
                             print(f"Failed to load data: {e}")
                             raise e
                         try:
-                            env.reset_to(sim_state, torch.tensor([0], device=env.device), is_relative=True)
+                            # the first frame of the episode was checkpointed by load_data
+                            if not action_provider.restore_episode_start():
+                                env.reset_to(sim_state, torch.tensor([0], device=env.device), is_relative=True)
                             env.sim.reset()
                             time.sleep(1)
                             action_provider.start_replay()
@@ -416,6 +485,8 @@ def main():
         controller.cleanup()
         
         env.close()
+        sim_context.close()
+        set_sim_context(None)
         print("cleanup completed")
 
 
@@ -435,8 +506,11 @@ if __name__ == "__main__":
         print(f"Current main process PID: {current_pid}")
         
         try:
-            # Find all related Python processes
-            result = subprocess.run(['pgrep', '-f', 'sim_main.py'], 
+            # Only clean up processes of this instance: main() puts the sim and
+            # everything it spawns into its own process group, so sibling sim
+            # instances on the same host are left alone.
+            current_pgid = os.getpgrp()
+            result = subprocess.run(['pgrep', '-g', str(current_pgid)], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
                 pids = result.stdout.strip().split('\n')
@@ -456,7 +530,7 @@ if __name__ == "__main__":
                 time.sleep(2)
                 
                 # Check if there are any remaining processes, force kill them
-                result2 = subprocess.run(['pgrep', '-f', 'sim_main.py'], 
+                result2 = subprocess.run(['pgrep', '-g', str(current_pgid)], 
                                        capture_output=True, text=True)
                 if result2.returncode == 0:
                     remaining_pids = result2.stdout.strip().split('\n')
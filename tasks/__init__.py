@@ -22,10 +22,7 @@ __version__ = ISAACLAB_TASKS_METADATA["package"]["version"]
 # Register Gym environments.
 ##
 
-from .utils import import_packages
-
-# The blacklist is used to prevent importing configs from sub-packages
-# TODO(@ashwinvk): Remove pick_place from the blacklist once pinocchio from Isaac Sim is compatibility
-_BLACKLIST_PKGS = ["utils", ".mdp", "pick_place"]
-# Import all configs in this package
-import_packages(__name__, _BLACKLIST_PKGS)
+# Only the task manifests are imported here: the env cfg of a task (and the scene, observation and DDS
+# modules it pulls in) is imported by gym when that task is created.
+# Use utils.import_packages(__name__) to import every sub-package eagerly.
+from . import g1_tasks  # noqa: F401
@@ -8,6 +8,7 @@ include the basic configuration for different types of cameras, support scene-sp
 import isaaclab.sim as sim_utils
 from isaaclab.sensors import CameraCfg
 from isaaclab.utils import configclass
+from tools.camera_settings import get_camera_stream_cfg
 
 
 @configclass
@@ -30,7 +31,8 @@ class CameraBaseCfg:
         clipping_range: tuple = (0.1, 1.0e5),
         pos_offset: tuple = (0, 0.0, 0),
         rot_offset: tuple = (0.5, -0.5, 0.5, -0.5),
-        data_types: list = None
+        data_types: list = None,
+        stream: str = None
     ) -> CameraCfg:
         """get the front camera configuration
         
@@ -46,10 +48,16 @@ class CameraBaseCfg:
             pos_offset: position offset (x, y, z)
             rot_offset: rotation offset quaternion
             data_types: data type list
+            stream: the streamed camera role ("head", "left", "right"), its resolution and depth enablement
+                (tools/camera_settings.py) replace height, width and data_types
             
         Returns:
             CameraCfg: camera configuration
         """
+        if stream is not None:
+            stream_cfg = get_camera_stream_cfg(stream)
+            height, width = stream_cfg.height, stream_cfg.width
+            data_types = ["rgb", "distance_to_image_plane"] if stream_cfg.depth else ["rgb"]
         if data_types is None:
             data_types = ["rgb", "distance_to_image_plane"]
         
@@ -85,7 +93,7 @@ class CameraPresets:
     @classmethod
     def g1_front_camera(cls) -> CameraCfg:
         """front camera configuration"""
-        return CameraBaseCfg.get_camera_config()
+        return CameraBaseCfg.get_camera_config(stream="head")
     @classmethod
     def g1_world_camera(cls) -> CameraCfg:
         """front camera configuration"""
@@ -100,10 +108,8 @@ class CameraPresets:
         """left wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/left_hand_base_link/left_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="left",
             focal_length=12,
             focus_distance=400.0,
             horizontal_aperture=20.0,
@@ -116,10 +122,8 @@ class CameraPresets:
         """right wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/right_hand_base_link/right_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="right",
             focal_length=12,
             focus_distance=400.0,
             horizontal_aperture=20.0,
@@ -132,10 +136,8 @@ class CameraPresets:
         """left wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/left_hand_camera_base_link/left_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="left",
             focal_length=12.0,
             focus_distance=400.0,
             horizontal_aperture=20.0,
@@ -148,10 +150,8 @@ class CameraPresets:
         """right wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/right_hand_camera_base_link/right_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="right",
             focal_length=12.0,
             focus_distance=400.0,
             horizontal_aperture=20.0,
@@ -165,10 +165,8 @@ class CameraPresets:
         """left wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/left_hand_camera_base_link/left_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="left",
             focal_length=12.0,
             focus_distance=400.0,
             horizontal_aperture=20.0,
@@ -181,10 +179,8 @@ class CameraPresets:
         """right wrist camera configuration"""
         return CameraBaseCfg.get_camera_config(
             prim_path="/World/envs/env_.*/Robot/right_hand_camera_base_link/right_wrist_camera",
-            height=480,
-            width=640,
             update_period=0.01,
-            data_types=["rgb", "distance_to_image_plane"],
+            stream="right",
             focal_length=12.0,
             focus_distance=400.0,
             horizontal_aperture=20.0,
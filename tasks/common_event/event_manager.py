@@ -6,6 +6,134 @@ event manager
 import torch
 from isaaclab.managers import SceneEntityCfg
 import isaaclab.envs.mdp as base_mdp
+import isaaclab.utils.math as math_utils
+
+_RANGE_KEYS = ["x", "y", "z", "roll", "pitch", "yaw"]
+
+
+class BatchedObjectReset:
+    """Uniform root state reset of several rigid objects at once
+
+    Samples the pose and velocity offsets of all objects and envs in one tensor op and writes the
+    root states of all objects through one PhysX rigid body view covering their prims: one pose write
+    and one velocity write per reset, whatever the number of objects (reset_root_state_uniform samples
+    and writes per object). The asset data of the objects reads the new states after the next sim step,
+    like after any write to the PhysX views.
+
+    When the shared view cannot be created, each object is written with its own write_root_state_to_sim.
+    """
+
+    def __init__(self, object_names, pose_ranges, velocity_ranges, scene=None):
+        """
+        Args:
+            object_names: names of the rigid objects in env.scene
+            pose_ranges: one {"x": [min, max], ..., "yaw": [min, max]} dict per object
+            velocity_ranges: one dict of the same form per object
+            scene: if given, objects missing from the scene are reported once and skipped,
+                so one misconfigured name does not fail the reset of the others
+        """
+        configs = list(zip(object_names, pose_ranges, velocity_ranges))
+        if scene is not None:
+            scene_names = set(scene.keys())
+            missing = [name for name, _, _ in configs if name not in scene_names]
+            if missing:
+                print(f"[BatchedObjectReset] objects not in the scene, skipped: {missing}")
+            configs = [config for config in configs if config[0] not in missing]
+        self.object_names = [name for name, _, _ in configs]
+        # [num_objects, 12, 2]: 6 pose and 6 velocity ranges per object, missing keys are (0, 0)
+        self._ranges = torch.tensor(
+            [[list(pose_range.get(key, (0.0, 0.0))) for key in _RANGE_KEYS]
+             + [list(velocity_range.get(key, (0.0, 0.0))) for key in _RANGE_KEYS]
+             for _, pose_range, velocity_range in configs],
+            dtype=torch.float32,
+        ).reshape(len(self.object_names), 12, 2)
+        self._ranges_device = {}
+        # rigid body view over the prims of all objects, rows ordered object-major like RigidObjectCollection
+        self._physics_sim_view = None
+        self._view = None
+        self._view_failed = False
+        self._view_poses = None
+        self._view_velocities = None
+
+    def _ranges_on(self, device):
+        key = str(device)
+        if key not in self._ranges_device:
+            self._ranges_device[key] = self._ranges.to(device)
+        return self._ranges_device[key]
+
+    def _object_view(self, assets):
+        """the rigid body view of all objects, created on first use, None if it cannot be created"""
+        if self._view is None and not self._view_failed:
+            try:
+                import omni.physics.tensors.impl.api as physx
+
+                # the prims of each object in the env order of its own view
+                prim_paths = [path for asset in assets for path in asset.root_physx_view.prim_paths]
+                self._physics_sim_view = physx.create_simulation_view("torch")
+                self._physics_sim_view.set_subspace_roots("/")
+                view = self._physics_sim_view.create_rigid_body_view(prim_paths)
+                if view.count != len(prim_paths):
+                    raise RuntimeError(f"the view holds {view.count} of {len(prim_paths)} prims")
+                self._view = view
+                self._view_poses = torch.zeros(view.count, 7, device=assets[0].device)
+                self._view_velocities = torch.zeros(view.count, 6, device=assets[0].device)
+            except Exception as e:
+                print(f"[BatchedObjectReset] no shared rigid body view for {self.object_names}, writing per object: {e}")
+                self._view_failed = True
+        return self._view
+
+    def _write(self, env, env_ids, assets, new_states):
+        view = self._object_view(assets)
+        if view is None:
+            for k, asset in enumerate(assets):
+                asset.write_root_state_to_sim(new_states[:, k], env_ids=env_ids)
+            return
+        # row of env e of object k is k * num_envs + e, the states are moved to the same object-major order
+        object_ids = torch.arange(len(assets), device=env_ids.device)
+        indices = (object_ids.unsqueeze(1) * env.num_envs + env_ids.unsqueeze(0)).flatten()
+        states = new_states.transpose(0, 1).reshape(-1, 13)
+        self._view_poses[indices, 0:3] = states[:, 0:3]
+        # Isaac Lab quaternions are wxyz, PhysX expects xyzw
+        self._view_poses[indices, 3:7] = math_utils.convert_quat(states[:, 3:7], to="xyzw")
+        self._view_velocities[indices] = states[:, 7:13]
+        view.set_transforms(self._view_poses, indices=indices)
+        view.set_velocities(self._view_velocities, indices=indices)
+
+    def __call__(self, env, env_ids=None):
+        """Reset the objects
+
+        Args:
+            env: the environment
+            env_ids: the envs to reset, all envs if None
+
+        Returns:
+            torch.Tensor: the written root states [num_env_ids, num_objects, 13], None if there is no object
+        """
+        if not self.object_names:
+            return None
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        else:
+            env_ids = torch.as_tensor(env_ids, device=env.device)
+        assets = [env.scene[name] for name in self.object_names]
+        num_objects = len(assets)
+        ranges = self._ranges_on(env.device)
+
+        # default states of all objects [N, K, 13] and all offsets [N, K, 12] in one sample
+        root_states = torch.stack([asset.data.default_root_state[env_ids] for asset in assets], dim=1)
+        samples = math_utils.sample_uniform(
+            ranges[..., 0], ranges[..., 1], (len(env_ids), num_objects, 12), device=env.device
+        )
+
+        positions = root_states[..., 0:3] + env.scene.env_origins[env_ids].unsqueeze(1) + samples[..., 0:3]
+        flat_euler = samples[..., 3:6].reshape(-1, 3)
+        orientations_delta = math_utils.quat_from_euler_xyz(flat_euler[:, 0], flat_euler[:, 1], flat_euler[:, 2])
+        orientations = math_utils.quat_mul(root_states[..., 3:7].reshape(-1, 4), orientations_delta)
+        velocities = root_states[..., 7:13] + samples[..., 6:12]
+        new_states = torch.cat([positions, orientations.reshape(-1, num_objects, 4), velocities], dim=-1)
+
+        self._write(env, env_ids, assets, new_states)
+        return new_states
 
 
 class SimpleEvent:
@@ -38,29 +166,34 @@ class MultiObjectEvent:
             ]
         """
         self.reset_configs = reset_configs or []
+        self._reset = None
     
-    def trigger(self, env):
+    def trigger(self, env, env_ids=None):
         """
         触发多物体重置事件
+
+        Args:
+            env: 环境
+            env_ids: 需要重置的环境ID，None表示全部环境
         """
-        env_ids = torch.arange(env.num_envs, device=env.device)
-        results = []
-        
-        for config in self.reset_configs:
-            try:
-                result = base_mdp.reset_root_state_uniform(
-                    env=env,
-                    env_ids=env_ids,
-                    pose_range=config.get("pose_range", {}),
-                    velocity_range=config.get("velocity_range", {}),
-                    asset_cfg=config["asset_cfg"]
-                )
-                results.append(result)
-                print(f"重置物体: {config['asset_cfg'].name}")
-            except Exception as e:
-                print(f"物体 {config['asset_cfg'].name} 重置失败: {e}")
-        
-        return results
+        if not self.reset_configs:
+            return []
+        if self._reset is None:
+            self._reset = BatchedObjectReset(
+                object_names=[config["asset_cfg"].name for config in self.reset_configs],
+                pose_ranges=[config.get("pose_range", {}) for config in self.reset_configs],
+                velocity_ranges=[config.get("velocity_range", {}) for config in self.reset_configs],
+                scene=env.scene,
+            )
+        try:
+            result = self._reset(env, env_ids)
+            if result is None:
+                return []
+            print(f"重置物体: {self._reset.object_names}")
+            return [result]
+        except Exception as e:
+            print(f"物体 {self._reset.object_names} 重置失败: {e}")
+            return []
 
 
 class BatchObjectEvent:
@@ -78,46 +211,41 @@ class BatchObjectEvent:
         self.object_names = object_names or []
         self.pose_ranges = pose_ranges or {}
         self.velocity_ranges = velocity_ranges or {}
+        self._reset = None
     
-    def trigger(self, env):
-        """触发批量重置"""
-        env_ids = torch.arange(env.num_envs, device=env.device)
-        results = []
-        
-        for obj_name in self.object_names:
-            try:
-                # 获取该物体的pose_range配置
-                if isinstance(self.pose_ranges, dict) and obj_name in self.pose_ranges:
-                    pose_range = self.pose_ranges[obj_name]
-                elif isinstance(self.pose_ranges, dict) and "x" in self.pose_ranges:
-                    # 单个配置，所有物体使用相同配置
-                    pose_range = self.pose_ranges
-                else:
-                    pose_range = {}
-                
-                # 获取该物体的velocity_range配置
-                if isinstance(self.velocity_ranges, dict) and obj_name in self.velocity_ranges:
-                    velocity_range = self.velocity_ranges[obj_name]
-                elif isinstance(self.velocity_ranges, dict) and "linear" in self.velocity_ranges:
-                    # 单个配置，所有物体使用相同配置
-                    velocity_range = self.velocity_ranges
-                else:
-                    velocity_range = {}
-                
-                result = base_mdp.reset_root_state_uniform(
-                    env=env,
-                    env_ids=env_ids,
-                    pose_range=pose_range,
-                    velocity_range=velocity_range,
-                    asset_cfg=SceneEntityCfg(obj_name)
-                )
-                results.append(result)
-                print(f"✅ 重置物体: {obj_name}")
-                
-            except Exception as e:
-                print(f"❌ 物体 {obj_name} 重置失败: {e}")
-        
-        return results
+    def _resolve_range(self, ranges, obj_name, single_key):
+        if isinstance(ranges, dict) and obj_name in ranges:
+            return ranges[obj_name]
+        elif isinstance(ranges, dict) and single_key in ranges:
+            # 单个配置，所有物体使用相同配置
+            return ranges
+        return {}
+
+    def trigger(self, env, env_ids=None):
+        """触发批量重置
+
+        Args:
+            env: 环境
+            env_ids: 需要重置的环境ID，None表示全部环境
+        """
+        if not self.object_names:
+            return []
+        if self._reset is None:
+            self._reset = BatchedObjectReset(
+                object_names=self.object_names,
+                pose_ranges=[self._resolve_range(self.pose_ranges, name, "x") for name in self.object_names],
+                velocity_ranges=[self._resolve_range(self.velocity_ranges, name, "linear") for name in self.object_names],
+                scene=env.scene,
+            )
+        try:
+            result = self._reset(env, env_ids)
+            if result is None:
+                return []
+            print(f"✅ 重置物体: {self._reset.object_names}")
+            return [result]
+        except Exception as e:
+            print(f"❌ 物体 {self._reset.object_names} 重置失败: {e}")
+            return []
 
 
 class SimpleEventManager:
@@ -127,9 +255,17 @@ class SimpleEventManager:
     def register(self, name, event):
         self._events[name] = event
 
-    def trigger(self, name, env):
+    def trigger(self, name, env, env_ids=None):
+        """
+        Args:
+            name: 事件名称
+            env: 环境
+            env_ids: 需要重置的环境ID，仅多物体重置事件支持，None表示全部环境
+        """
         event = self._events.get(name)
         if event:
+            if env_ids is not None:
+                return event.trigger(env, env_ids=env_ids)
             return event.trigger(env)
         else:
             print(f"Event {name} not registered")
@@ -12,15 +12,19 @@ import numpy as np
 import sys
 import os
 
-# add the project root directory to the path, so that the shared memory tool can be imported
+# add the project root directory to the path, so that the sim context can be imported
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from image_server.shared_memory_utils import MultiImageWriter
+from tools.sim_context import get_sim_context
+from tools.camera_settings import CAMERA_ROLES, SCENE_CAMERAS, DEPTH_SCALE, DEPTH_MAX, get_camera_settings
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
-# create the global multi-image shared memory writer
-multi_image_writer = MultiImageWriter()
+def _depth_to_uint16(depth: torch.Tensor) -> np.ndarray:
+    """distance_to_image_plane [H, W, 1] in metres -> uint16 millimetres, 0 where the depth is invalid"""
+    depth = torch.nan_to_num(depth[..., 0] * DEPTH_SCALE, nan=0.0, posinf=0.0, neginf=0.0)
+    return depth.clamp_(0, DEPTH_MAX).to(torch.int32).cpu().numpy().astype(np.uint16)
+
 
 def get_camera_image(
     env: ManagerBasedRLEnv,
@@ -28,6 +32,8 @@ def get_camera_image(
     # pass
     """get multiple camera images and write them to shared memory
     
+    The cameras, their resolution and whether their depth is streamed follow tools/camera_settings.py.
+    
     Args:
         env: ManagerBasedRLEnv - reinforcement learning environment instance
     
@@ -36,45 +42,38 @@ def get_camera_image(
     """
     # get the camera images
     images = {}
+    depths = {}
     # env.sim.render()
+    settings = get_camera_settings()
+    scene_keys = env.scene.keys()
     
-    # Head camera (front camera)
-    if "front_camera" in env.scene.keys():
-        head_image = env.scene["front_camera"].data.output["rgb"][0]  # [batch, height, width, 3]
-        images["head"] = head_image.cpu().numpy()
-    
-    # Left camera (left wrist camera)
-    if "left_wrist_camera" in env.scene.keys():
-        left_image = env.scene["left_wrist_camera"].data.output["rgb"][0]
-        images["left"] = left_image.cpu().numpy()
-    
-    # Right camera (right wrist camera)  
-    if "right_wrist_camera" in env.scene.keys():
-        right_image = env.scene["right_wrist_camera"].data.output["rgb"][0]
-        images["right"] = right_image.cpu().numpy()
+    # head (front camera), left and right wrist cameras
+    for role, camera_name in SCENE_CAMERAS.items():
+        if camera_name not in scene_keys:
+            continue
+        output = env.scene[camera_name].data.output
+        images[role] = output["rgb"][0].cpu().numpy()  # [height, width, 3]
+        if settings[role].depth and "distance_to_image_plane" in output:
+            depths[role] = _depth_to_uint16(output["distance_to_image_plane"][0])
     
     # if no camera with the specified name is found, try other common camera names
     if not images:
         # try to find other possible camera names
-        available_cameras = [name for name in env.scene.keys() if "camera" in name.lower()]
+        available_cameras = [name for name in scene_keys if "camera" in name.lower()]
         print(f"[camera_state] No standard cameras found. Available cameras: {available_cameras}")
         
         # if there are available cameras, use the first three as head, left, right
-        for i, camera_name in enumerate(available_cameras[:3]):
-            camera_image = env.scene[camera_name].data.output["rgb"][0]
-            
-            if i == 0:
-                images["head"] = camera_image.cpu().numpy()
-            elif i == 1:
-                images["left"] = camera_image.cpu().numpy()
-            elif i == 2:
-                images["right"] = camera_image.cpu().numpy()
+        for role, camera_name in zip(CAMERA_ROLES, available_cameras[:3]):
+            images[role] = env.scene[camera_name].data.output["rgb"][0].cpu().numpy()
     
     # write the multi-image data to shared memory
     if images:
-        success = multi_image_writer.write_images(images)
+        # the shared memory writer is created by the sim context on first use
+        multi_image_writer = get_sim_context().multi_image_writer
+        if multi_image_writer is not None:
+            success = multi_image_writer.write_images(images, depths or None)
     else:
         print("[camera_state] No camera images found in the environment")
     
-    return torch.zeros((1, 480, 640, 3))
-
+    head = settings["head"]
+    return torch.zeros((1, head.height, head.width, 3))
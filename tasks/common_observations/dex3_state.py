@@ -46,9 +46,10 @@ def _get_dex3_dds_instance():
     
     if not _dds_initialized or _dex3_dds is None:
         try:
-            # dynamically import the DDS module
+            # get the DDS manager from the sim context (created on first use)
             sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dds'))
-            from dds.dds_master import dds_manager
+            from tools.sim_context import get_sim_context
+            dds_manager = get_sim_context().dds_manager
             
             _dex3_dds = dds_manager.get_object("dex3")
             print("[Observations Dex3] DDS communication instance obtained")
@@ -81,7 +81,6 @@ def get_robot_arm_joint_names() -> list[str]:
     ]
 
 # global variable to cache the DDS instance
-from dds.dds_master import dds_manager
 _g1_robot_dds = None
 _dds_initialized = False
 
@@ -91,9 +90,10 @@ def _get_g1_robot_dds_instance():
     
     if not _dds_initialized or _g1_robot_dds is None:
         try:
-            # dynamically import the DDS module
+            # get the DDS manager from the sim context (created on first use)
             sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dds'))
-            from dds.dds_master import dds_manager
+            from tools.sim_context import get_sim_context
+            dds_manager = get_sim_context().dds_manager
             print(f"dds_manager: {dds_manager}")
             _g1_robot_dds = dds_manager.get_object("g129")
             print("[g1_state] G1 robot DDS communication instance obtained")
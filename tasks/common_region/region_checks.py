@@ -0,0 +1,128 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+region checks
+tensorized region tests shared by the reward and termination terms
+
+every check works on positions of shape [num_envs, 3] or [num_envs, num_objects, 3] and returns a bool tensor
+of shape [num_envs] or [num_envs, num_objects], so the terms run for any num_envs without a device -> host sync.
+a bound of None leaves that side of the region open.
+"""
+
+from __future__ import annotations
+
+import torch
+from typing import Optional, Sequence
+
+_INF = float("inf")
+
+# bound tensors are built once per (bounds, device) instead of on every step
+_bounds_cache: dict = {}
+
+
+def _bounds_tensor(lower: Sequence[Optional[float]], upper: Sequence[Optional[float]], device) -> torch.Tensor:
+    key = (tuple(lower), tuple(upper), str(device))
+    bounds = _bounds_cache.get(key)
+    if bounds is None:
+        bounds = torch.tensor(
+            [[-_INF if v is None else v for v in lower], [_INF if v is None else v for v in upper]],
+            dtype=torch.float32,
+            device=device,
+        )
+        _bounds_cache[key] = bounds
+    return bounds
+
+
+def get_object_positions(env, object_names: Sequence[str]) -> torch.Tensor:
+    """stack the world root positions of several scene objects
+
+    Args:
+        env: the environment
+        object_names: names of the rigid objects in env.scene
+
+    Returns:
+        torch.Tensor: [num_envs, num_objects, 3]
+    """
+    return torch.stack([env.scene[name].data.root_pos_w for name in object_names], dim=1)
+
+
+def in_box(
+    pos: torch.Tensor,
+    min_xyz: Sequence[Optional[float]] = (None, None, None),
+    max_xyz: Sequence[Optional[float]] = (None, None, None),
+) -> torch.Tensor:
+    """check that positions lie strictly inside an axis-aligned box
+
+    Args:
+        pos: [..., 3] positions
+        min_xyz: lower bounds (x, y, z), None for unbounded
+        max_xyz: upper bounds (x, y, z), None for unbounded
+
+    Returns:
+        torch.Tensor: bool [...]
+    """
+    bounds = _bounds_tensor(min_xyz, max_xyz, pos.device)
+    return ((pos > bounds[0]) & (pos < bounds[1])).all(dim=-1)
+
+
+def in_xy_box(pos: torch.Tensor, min_x: float, max_x: float, min_y: float, max_y: float) -> torch.Tensor:
+    """check that positions lie strictly inside an x/y rectangle, ignoring the height"""
+    return in_box(pos, (min_x, min_y, None), (max_x, max_y, None))
+
+
+def in_height_band(
+    pos: torch.Tensor,
+    min_height: Optional[float] = None,
+    max_height: Optional[float] = None,
+    min_inclusive: bool = False,
+) -> torch.Tensor:
+    """check that the height of positions lies inside (min_height, max_height)
+
+    Args:
+        pos: [..., 3] positions
+        min_height: lower bound, None for unbounded
+        max_height: upper bound (exclusive), None for unbounded
+        min_inclusive: accept heights equal to min_height
+
+    Returns:
+        torch.Tensor: bool [...]
+    """
+    height = pos[..., 2]
+    inside = torch.ones_like(height, dtype=torch.bool)
+    if min_height is not None:
+        inside = inside & ((height >= min_height) if min_inclusive else (height > min_height))
+    if max_height is not None:
+        inside = inside & (height < max_height)
+    return inside
+
+
+def all_objects(mask: torch.Tensor) -> torch.Tensor:
+    """per-env check that every object satisfies the mask, [num_envs, num_objects] -> [num_envs]"""
+    return mask.all(dim=-1)
+
+
+def any_object(mask: torch.Tensor) -> torch.Tensor:
+    """per-env check that at least one object satisfies the mask, [num_envs, num_objects] -> [num_envs]"""
+    return mask.any(dim=-1)
+
+
+def object_distance(pos_a: torch.Tensor, pos_b: torch.Tensor) -> torch.Tensor:
+    """euclidean distance between two sets of positions, [num_envs, 3] -> [num_envs]"""
+    return torch.linalg.vector_norm(pos_a - pos_b, dim=-1)
+
+
+def staged_reward(default: float, stages: Sequence[tuple[torch.Tensor, float]]) -> torch.Tensor:
+    """build a piecewise reward from bool masks without indexing on the host
+
+    Args:
+        default: reward where no stage applies
+        stages: (mask, value) pairs, later stages override earlier ones
+
+    Returns:
+        torch.Tensor: float [num_envs]
+    """
+    first_mask = stages[0][0]
+    reward = torch.full(first_mask.shape, default, dtype=torch.float, device=first_mask.device)
+    for mask, value in stages:
+        reward = reward.masked_fill(mask, value)
+    return reward
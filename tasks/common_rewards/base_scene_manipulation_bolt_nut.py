@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import object_distance
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -25,7 +27,7 @@ def compute_reward(
     bolt_pos_w = bolt.data.root_com_pos_w
     nut_pos_w = nut.data.root_com_pos_w
 
-    dist = torch.norm(bolt_pos_w - nut_pos_w, dim=1).squeeze()
+    dist = object_distance(bolt_pos_w, nut_pos_w)
 
     rewards = 1 - torch.tanh(dist / std)
 
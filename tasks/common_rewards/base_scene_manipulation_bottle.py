@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import object_distance
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -25,7 +27,7 @@ def compute_reward(
     bottle_pos_w = bottle.data.root_com_pos_w
     cap_pos_w = cap.data.root_com_pos_w
 
-    dist = torch.norm(bottle_pos_w - cap_pos_w, dim=1).squeeze()
+    dist = object_distance(bottle_pos_w, cap_pos_w)
 
     rewards = torch.tanh(dist / std)
 
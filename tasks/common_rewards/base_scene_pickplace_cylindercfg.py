@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import in_box, staged_reward
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -27,35 +29,16 @@ def compute_reward(
     post_min_height: float = 0.81,
     post_max_height: float = 0.9,
 ) -> torch.Tensor:
-   # when the object is not in the set return, reset
-    # Get object entity from the scene
     # 1. get object entity from the scene
     object: RigidObject = env.scene[object_cfg.name]
-    
-    # Extract wheel position relative to environment origin
-    # 2. get object position
-    wheel_x = object.data.root_pos_w[:, 0]         # x position
-    wheel_y = object.data.root_pos_w[:, 1]        # y position
-    wheel_height = object.data.root_pos_w[:, 2]   # z position (height)
-    # print(f"wheel_height: {wheel_height}")
-    # Check conditions for each environment (element-wise operations)
-    done_x = (wheel_x < max_x) & (wheel_x > min_x)
-    done_y = (wheel_y < max_y) & (wheel_y > min_y)
-    done_height = (wheel_height > min_height)
-    done = done_x & done_y & done_height
-
-    # 3. get post position conditions
-    done_post_x = (wheel_x < post_max_x) & (wheel_x > post_min_x)
-    done_post_y = (wheel_y < post_max_y) & (wheel_y > post_min_y)
-    done_post_height = (wheel_height > post_min_height) & (wheel_height < post_max_height)
-    done_post = done_post_x & done_post_y & done_post_height
-
-    # Create reward tensor for all environments
-    reward = torch.zeros(env.num_envs, device=env.device, dtype=torch.float)
-    
-    # Set rewards based on conditions
-    reward[~done] = -1.0  # Not in valid area
-    reward[done_post] = 1.0  # In target post area
-    reward[done & ~done_post] = 0.0  # In valid area but not target
-    
+    object_pos = object.data.root_pos_w
+
+    # 2. check the object position per env
+    # inside the x/y working area and above the minimum height
+    done = in_box(object_pos, (min_x, min_y, min_height), (max_x, max_y, None))
+    # inside the target post area
+    done_post = in_box(object_pos, (post_min_x, post_min_y, post_min_height), (post_max_x, post_max_y, post_max_height))
+
+    # 3. not in valid area: -1, in valid area but not target: 0, in target post area: 1
+    reward = staged_reward(-1.0, [(done, 0.0), (done_post, 1.0)])
     return reward
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import object_distance
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -24,7 +26,7 @@ def task_done(
     bolt_pos_w = bolt.data.root_com_pos_w
     nut_pos_w = nut.data.root_com_pos_w
 
-    dist = torch.norm(bolt_pos_w - nut_pos_w, dim=1).squeeze()
+    dist = object_distance(bolt_pos_w, nut_pos_w)
 
     done = dist <= th
 
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 
 from isaaclab.assets import Articulation, DeformableObject, RigidObject
 from isaaclab.managers import SceneEntityCfg
+
+from tasks.common_region.region_checks import object_distance
 import isaaclab.utils.math as math_utils
 
 if TYPE_CHECKING:
@@ -26,7 +28,7 @@ def task_done(
     bolt_pos_w = bottle.data.root_com_pos_w
     nut_pos_w = cap.data.root_com_pos_w
 
-    dist = torch.norm(bolt_pos_w - nut_pos_w, dim=1).squeeze()
+    dist = object_distance(bolt_pos_w, nut_pos_w)
 
     done = dist >= th
 
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import in_box
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -21,20 +23,11 @@ def reset_object_estimate(
     max_y: float = 0.7,                # maximum y position threshold
     min_height: float = 0.5,
 ) -> torch.Tensor:
-   # when the object is not in the set return, reset
-    # Get object entity from the scene
+    # when the object is not in the set return, reset
     # 1. get object entity from the scene
     object: RigidObject = env.scene[object_cfg.name]
-    
-    # Extract wheel position relative to environment origin
-    # 2. get object position
-    wheel_x = object.data.root_pos_w[:, 0]         # x position
-    wheel_y = object.data.root_pos_w[:, 1]        # y position
-    wheel_height = object.data.root_pos_w[:, 2]   # z position (height)
-    done_x = (wheel_x < max_x) and  (wheel_x > min_x)
-    done_y = (wheel_y < max_y) and (wheel_y > min_y)
-    done_height = (wheel_height > min_height)
-    done = done_x and done_y and done_height
-
-    
-    return not done
+
+    # 2. check the object position per env: inside the x/y working area and above the minimum height
+    done = in_box(object.data.root_pos_w, (min_x, min_y, min_height), (max_x, max_y, None))
+
+    return ~done
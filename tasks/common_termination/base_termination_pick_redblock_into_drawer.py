@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import in_box
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -22,19 +24,10 @@ def reset_object_estimate(
     min_height: float = 0.2,
 ) -> torch.Tensor:
     # when the object is not in the set return, reset
-    # Get object entity from the scene
     # 1. get object entity from the scene
     object: RigidObject = env.scene[object_cfg.name]
-    
-    # Extract wheel position relative to environment origin
-    # 2. get object position
-    wheel_x = object.data.root_pos_w[:, 0]         # x position
-    wheel_y = object.data.root_pos_w[:, 1]        # y position
-    wheel_height = object.data.root_pos_w[:, 2]   # z position (height)
-    done_x = (wheel_x < max_x) and  (wheel_x > min_x)
-    done_y = (wheel_y < max_y) and (wheel_y > min_y)
-    done_height = (wheel_height > min_height)
-    done = done_x and done_y and done_height
-    # print(f"done_x: {done_x}, done_y: {done_y}, done_height: {done_height}, done: {done}")
-    # print(f"wheel_x: {wheel_x}, wheel_y: {wheel_y}, wheel_height: {wheel_height}")
-    return  not done
+
+    # 2. check the object position per env: inside the x/y working area and above the minimum height
+    done = in_box(object.data.root_pos_w, (min_x, min_y, min_height), (max_x, max_y, None))
+
+    return ~done
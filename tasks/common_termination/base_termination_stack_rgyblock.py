@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 
+from tasks.common_region.region_checks import get_object_positions, in_box, all_objects
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -23,42 +25,11 @@ def reset_object_estimate(
     max_y: float = -2.8,                # maximum y position threshold
     min_height: float = 0.5,
 ) -> torch.Tensor:
-   # when the object is not in the set return, reset
-    # Get object entity from the scene
-    # 1. get object entity from the scene
-    red_block: RigidObject = env.scene[red_block_cfg.name]
-    yellow_block: RigidObject = env.scene[yellow_block_cfg.name]
-    green_block: RigidObject = env.scene[green_block_cfg.name]
-    
-    # Extract wheel position relative to environment origin
-    # 2. get object position
-    red_block_x = red_block.data.root_pos_w[:, 0]         # x position
-    red_block_y = red_block.data.root_pos_w[:, 1]        # y position
-    red_block_height = red_block.data.root_pos_w[:, 2]   # z position (height)
-
-    yellow_block_x = yellow_block.data.root_pos_w[:, 0]         # x position
-    yellow_block_y = yellow_block.data.root_pos_w[:, 1]        # y position
-    yellow_block_height = yellow_block.data.root_pos_w[:, 2]   # z position (height)
-
-    green_block_x = green_block.data.root_pos_w[:, 0]         # x position
-    green_block_y = green_block.data.root_pos_w[:, 1]        # y position
-    green_block_height = green_block.data.root_pos_w[:, 2]   # z position (height)
-    
-    red_done_x = (red_block_x < max_x) and  (red_block_x > min_x)
-    red_done_y = (red_block_y < max_y) and (red_block_y > min_y)
-    red_done_height = (red_block_height > min_height)
-    red_done = red_done_x and red_done_y and red_done_height
-
-    yellow_done_x = (yellow_block_x < max_x) and  (yellow_block_x > min_x)
-    yellow_done_y = (yellow_block_y < max_y) and (yellow_block_y > min_y)
-    yellow_done_height = (yellow_block_height > min_height)
-    yellow_done = yellow_done_x and yellow_done_y and yellow_done_height
-
-    green_done_x = (green_block_x < max_x) and  (green_block_x > min_x)
-    green_done_y = (green_block_y < max_y) and (green_block_y > min_y)
-    green_done_height = (green_block_height > min_height)
-    green_done = green_done_x and green_done_y and green_done_height
-
-    done = not (red_done and yellow_done and green_done)
+    # when any block is not in the set return, reset
+    # 1. get the block positions from the scene, [num_envs, 3 blocks, 3]
+    block_pos = get_object_positions(env, [red_block_cfg.name, yellow_block_cfg.name, green_block_cfg.name])
 
+    # 2. check every block per env: inside the x/y working area and above the minimum height
+    blocks_in_area = in_box(block_pos, (min_x, min_y, min_height), (max_x, max_y, None))
+    done = ~all_objects(blocks_in_area)
     return done
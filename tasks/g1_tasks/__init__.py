@@ -1,37 +1,65 @@
-
 # Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
 # License: Apache License, Version 2.0  
 """Unitree G1 robot task module
 contains various task implementations for the G1 robot, such as pick and place, motion control, etc.
+
+Tasks are registered from the static manifest below with string entry points,
+so importing this package does not import any task; gym imports the env cfg module of the selected task only.
 """
 
-# use relative import
-from . import pick_place_cylinder_g1_29dof_dex3
-from . import pick_place_cylinder_g1_29dof_dex1
-from . import pick_place_cylinder_g1_29dof_inspire
-
-from . import pick_place_redblock_g1_29dof_dex1
-from . import pick_place_redblock_g1_29dof_dex3
-from . import stack_rgyblock_g1_29dof_dex1
-from . import stack_rgyblock_g1_29dof_dex3
-from . import stack_rgyblock_g1_29dof_inspire
-from . import pick_redblock_into_drawer_g1_29dof_dex1
-from . import pick_redblock_into_drawer_g1_29dof_dex3
-from . import pick_place_redblock_g1_29dof_inspire
-from . import move_cylinder_g1_29dof_dex1_wholebody
-from . import move_cylinder_g1_29dof_dex3_wholebody
-from . import move_cylinder_g1_29dof_inspire_wholebody
-
-# export all modules
-__all__ = [
-        "pick_place_cylinder_g1_29dof_dex3", "pick_place_cylinder_g1_29dof_dex1", 
-        "pick_place_redblock_g1_29dof_dex1", "pick_place_redblock_g1_29dof_dex3", 
-        "stack_rgyblock_g1_29dof_dex1", "stack_rgyblock_g1_29dof_dex3", 
-        "stack_rgyblock_g1_29dof_inspire",
-        "pick_redblock_into_drawer_g1_29dof_dex1","pick_redblock_into_drawer_g1_29dof_dex3",
-        "pick_place_redblock_g1_29dof_inspire",
-        "pick_place_cylinder_g1_29dof_inspire",
-        "move_cylinder_g1_29dof_dex1_wholebody",
-        "move_cylinder_g1_29dof_dex3_wholebody",
-        "move_cylinder_g1_29dof_inspire_wholebody"
-]
\ No newline at end of file
+import gymnasium as gym
+
+# task id -> "<task package>.<env cfg module>:<env cfg class>", relative to this package
+G1_TASKS = {
+    "Isaac-PickPlace-Cylinder-G129-Dex1-Joint":
+        "pick_place_cylinder_g1_29dof_dex1.pickplace_cylinder_g1_29dof_dex1_joint_env_cfg:PickPlaceG129DEX1BaseFixEnvCfg",
+    "Isaac-PickPlace-Cylinder-G129-Dex3-Joint":
+        "pick_place_cylinder_g1_29dof_dex3.pickplace_cylinder_g1_29dof_dex3_joint_env_cfg:PickPlaceG129DEX3JointEnvCfg",
+    "Isaac-PickPlace-Cylinder-G129-Inspire-Joint":
+        "pick_place_cylinder_g1_29dof_inspire.pickplace_cylinder_g1_29dof_inspire_env_cfg:PickPlaceG129InspireBaseFixEnvCfg",
+    "Isaac-PickPlace-RedBlock-G129-Dex1-Joint":
+        "pick_place_redblock_g1_29dof_dex1.pickplace_redblock_g1_29dof_dex1_joint_env_cfg:PickPlaceG129DEX1BaseFixEnvCfg",
+    "Isaac-PickPlace-RedBlock-G129-Dex3-Joint":
+        "pick_place_redblock_g1_29dof_dex3.pickplace_redblock_g1_29dof_dex3_joint_env_cfg:PickPlaceG129DEX3BaseFixEnvCfg",
+    "Isaac-PickPlace-RedBlock-G129-Inspire-Joint":
+        "pick_place_redblock_g1_29dof_inspire.pickplace_redblock_g1_29dof_inspire_joint_env_cfg:PickPlaceG129InspireHandBaseFixEnvCfg",
+    "Isaac-Stack-RgyBlock-G129-Dex1-Joint":
+        "stack_rgyblock_g1_29dof_dex1.stack_rgyblock_g1_29dof_dex1_joint_env_cfg:StackRgyBlockG129DEX1BaseFixEnvCfg",
+    "Isaac-Stack-RgyBlock-G129-Dex3-Joint":
+        "stack_rgyblock_g1_29dof_dex3.stack_rgyblock_g1_29dof_dex3_joint_env_cfg:StackRgyBlockG129DEX3BaseFixEnvCfg",
+    "Isaac-Stack-RgyBlock-G129-Inspire-Joint":
+        "stack_rgyblock_g1_29dof_inspire.stack_rgyblock_g1_29dof_inspire_joint_env_cfg:StackRgyBlockG129InspireBaseFixEnvCfg",
+    "Isaac-Pick-Redblock-Into-Drawer-G129-Dex1-Joint":
+        "pick_redblock_into_drawer_g1_29dof_dex1.pick_redblock_into_drawer_g1_29dof_dex1_joint_env_cfg:PickRedblockIntoDrawerG129DEX1BaseFixEnvCfg",
+    "Isaac-Pick-Redblock-Into-Drawer-G129-Dex3-Joint":
+        "pick_redblock_into_drawer_g1_29dof_dex3.pick_redblock_into_drawer_g1_29dof_dex3_joint_env_cfg:PickRedblockIntoDrawerG129DEX3JointEnvCfg",
+    "Isaac-Move-Cylinder-G129-Dex1-Wholebody":
+        "move_cylinder_g1_29dof_dex1_wholebody.move_cylinder_g1_29dof_dex1_hw_env_cfg:MoveCylinderG129Dex1WholebodyEnvCfg",
+    "Isaac-Move-Cylinder-G129-Dex3-Wholebody":
+        "move_cylinder_g1_29dof_dex3_wholebody.move_cylinder_g1_29dof_dex3_hw_env_cfg:MoveCylinderG129Dex3WholebodyEnvCfg",
+    "Isaac-Move-Cylinder-G129-Inspire-Wholebody":
+        "move_cylinder_g1_29dof_inspire_wholebody.move_cylinder_g1_29dof_inspire_hw_env_cfg:MoveCylinderG129InspireWholebodyEnvCfg",
+    "Isaac-Manipulation-BoltNut-G129-Inspire-Joint":
+        "manipulation_bolt_nut_g1_29dof_inspire.manipulation_bolt_nut_g1_29dof_inspire_env_cfg:ManipulationG129InspireBaseFixEnvCfg",
+    "Isaac-Manipulation-Bottle-G129-Inspire-Joint":
+        "manipulation_bottle_g1_29dof_inspire.manipulation_bottle_g1_29dof_inspire_env_cfg:ManipulationG129InspireBaseFixEnvCfg",
+}
+
+
+def register_tasks():
+    """register all G1 tasks with gym without importing them"""
+    for task_id, entry_point in G1_TASKS.items():
+        gym.register(
+            id=task_id,
+            entry_point="isaaclab.envs:ManagerBasedRLEnv",
+            kwargs={
+                "env_cfg_entry_point": f"{__name__}.{entry_point}",
+            },
+            disable_env_checker=True,
+        )
+
+
+register_tasks()
+
+# export the task manifest
+__all__ = ["G1_TASKS", "register_tasks"]
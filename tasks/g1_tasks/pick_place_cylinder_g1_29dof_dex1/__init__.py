@@ -1,18 +1,3 @@
-
 # Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
 # License: Apache License, Version 2.0  
-
-import gymnasium as gym
-
-from . import pickplace_cylinder_g1_29dof_dex1_joint_env_cfg
-
-
-gym.register(
-    id="Isaac-PickPlace-Cylinder-G129-Dex1-Joint",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
-    kwargs={
-        "env_cfg_entry_point": pickplace_cylinder_g1_29dof_dex1_joint_env_cfg.PickPlaceG129DEX1BaseFixEnvCfg,
-    },
-    disable_env_checker=True,
-)
-
+"""Isaac-PickPlace-Cylinder-G129-Dex1-Joint task, registered in tasks/g1_tasks/__init__.py"""
@@ -0,0 +1,175 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Tests of tools/scene_checkpoint.py against a mock scene with the get_state/reset_to shape of InteractiveScene
+(no Isaac Sim needed):
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.scene_checkpoint import SceneCheckpointManager, state_to_device
+
+
+class MockScene:
+    """Holds an articulation and a rigid object state like InteractiveScene.get_state()"""
+
+    def __init__(self, num_envs=2, num_joints=3):
+        self.device = "cpu"
+        self.num_envs = num_envs
+        self.env_origins = torch.tensor([[float(i), 0.0, 0.0] for i in range(num_envs)])
+        self.state = {
+            "articulation": {"robot": {
+                "root_pose": torch.zeros(num_envs, 7),
+                "root_velocity": torch.zeros(num_envs, 6),
+                "joint_position": torch.zeros(num_envs, num_joints),
+                "joint_velocity": torch.zeros(num_envs, num_joints),
+            }},
+            "rigid_object": {"object": {
+                "root_pose": torch.zeros(num_envs, 7),
+                "root_velocity": torch.zeros(num_envs, 6),
+            }},
+        }
+        self.get_state_calls = 0
+        self.reset_calls = []
+
+    def _poses(self):
+        return [self.state["articulation"]["robot"]["root_pose"], self.state["rigid_object"]["object"]["root_pose"]]
+
+    def get_state(self, is_relative=False):
+        self.get_state_calls += 1
+        state = state_to_device(self.state, "cpu")
+        state = {group: {name: {key: value.clone() for key, value in asset.items()}
+                         for name, asset in assets.items()} for group, assets in state.items()}
+        if is_relative:
+            for asset in (state["articulation"]["robot"], state["rigid_object"]["object"]):
+                asset["root_pose"][:, :3] -= self.env_origins
+        return state
+
+    def reset_to(self, state, env_ids=None, is_relative=False):
+        self.reset_calls.append((env_ids, is_relative))
+        env_ids = slice(None) if env_ids is None else env_ids
+        for group, assets in state.items():
+            for name, asset in assets.items():
+                for key, value in asset.items():
+                    value = value.clone()
+                    if is_relative and key == "root_pose":
+                        value[:, :3] += self.env_origins[env_ids]
+                    self.state[group][name][key][env_ids] = value
+
+    def set_joint_position(self, value):
+        self.state["articulation"]["robot"]["joint_position"].fill_(value)
+        self.state["rigid_object"]["object"]["root_pose"][:, 0] = 10.0 + value
+
+
+def joint_position(scene):
+    return scene.state["articulation"]["robot"]["joint_position"]
+
+
+def test_slots_are_preallocated_on_first_save():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene, max_checkpoints=3)
+    checkpoints.save("a")
+    slots = checkpoints._slots
+    assert len(slots) == 3
+    buffers = [slot["articulation"]["robot"]["joint_position"] for slot in slots]
+    pointers = [buffer.data_ptr() for buffer in buffers]
+
+    scene.set_joint_position(1.0)
+    checkpoints.save("b")
+    checkpoints.save("a")
+    # saving again copies into the same buffers instead of allocating new ones
+    assert checkpoints._slots is slots
+    assert [slot["articulation"]["robot"]["joint_position"].data_ptr() for slot in slots] == pointers
+    # the saved state does not alias the scene tensors
+    scene.set_joint_position(2.0)
+    assert torch.all(checkpoints.get("a")["articulation"]["robot"]["joint_position"] == 1.0)
+
+
+def test_restore_writes_the_saved_values():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene, max_checkpoints=2)
+    scene.set_joint_position(0.5)
+    checkpoints.save("start", is_relative=True)
+    scene.set_joint_position(3.0)
+
+    assert checkpoints.restore("start")
+    assert torch.all(joint_position(scene) == 0.5)
+    # relative root poses come back at the env origins
+    assert torch.allclose(scene.state["rigid_object"]["object"]["root_pose"][:, 0], torch.tensor([10.5, 10.5]))
+    assert scene.reset_calls[-1] == (None, True)
+
+
+def test_restore_a_subset_of_envs():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene)
+    scene.set_joint_position(1.0)
+    checkpoints.save("start")
+    scene.set_joint_position(4.0)
+
+    checkpoints.restore("start", env_ids=torch.tensor([1]))
+    assert torch.all(joint_position(scene)[0] == 4.0)
+    assert torch.all(joint_position(scene)[1] == 1.0)
+
+
+def test_save_a_given_state():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene)
+    state = scene.get_state()
+    state["articulation"]["robot"]["joint_position"].fill_(7.0)
+    checkpoints.save("loaded", state=state)
+    # a given state does not read the scene
+    assert scene.get_state_calls == 1
+
+    checkpoints.restore("loaded")
+    assert torch.all(joint_position(scene) == 7.0)
+
+
+def test_least_recently_used_checkpoint_is_evicted():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene, max_checkpoints=2)
+    for value, name in enumerate(("a", "b")):
+        scene.set_joint_position(float(value))
+        checkpoints.save(name)
+    # restoring "a" makes "b" the least recently used one
+    checkpoints.restore("a")
+    scene.set_joint_position(2.0)
+    checkpoints.save("c")
+
+    assert checkpoints.names() == ["a", "c"]
+    assert "b" not in checkpoints
+    assert not checkpoints.restore("b")
+    checkpoints.restore("c")
+    assert torch.all(joint_position(scene) == 2.0)
+    checkpoints.restore("a")
+    assert torch.all(joint_position(scene) == 0.0)
+
+
+def test_automatic_names():
+    checkpoints = SceneCheckpointManager(MockScene(), max_checkpoints=2)
+    assert checkpoints.save() == "checkpoint_0"
+    assert checkpoints.save() == "checkpoint_1"
+    assert len(checkpoints) == 2
+
+
+def test_delete_frees_the_slot():
+    scene = MockScene()
+    checkpoints = SceneCheckpointManager(scene, max_checkpoints=2)
+    checkpoints.save("a")
+    checkpoints.save("b")
+    checkpoints.delete("a")
+    assert "a" not in checkpoints
+    assert checkpoints.get("a") is None
+    assert not checkpoints.restore("a")
+
+    # the freed slot is reused, "b" is not evicted
+    checkpoints.save("c")
+    assert checkpoints.names() == ["b", "c"]
+    checkpoints.delete("missing")
+    checkpoints.clear()
+    assert len(checkpoints) == 0
@@ -0,0 +1,248 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Local asset cache
+Scene USDs loaded from ISAAC_NUCLEUS_DIR / ISAACLAB_NUCLEUS_DIR are fetched from a remote server (an S3
+URL by default) on every cold start. This module mirrors remote assets into a local directory and resolves
+the usd_path of scene configs to the local copy when one exists:
+
+    https://host/Assets/Isaac/4.5/Isaac/Environments/Simple_Warehouse/warehouse.usd
+    -> <cache_dir>/host/Assets/Isaac/4.5/Isaac/Environments/Simple_Warehouse/warehouse.usd
+
+The directory layout of the server is kept, so relative references inside a USD (sublayers, materials,
+textures) resolve inside the mirror. Prefetching a USD also fetches the files it depends on, when the USD
+Python bindings are available. Only when the asset and all its dependencies were fetched is a completion
+marker (<local path>.complete) written next to the copy; a path is resolved to the mirror only if its marker
+exists, so a partially prefetched scene keeps loading from the remote server. Local paths
+(e.g. {project_root}/assets/...) are returned unchanged, so resolving never fails.
+
+The cache directory is SIM_ASSET_CACHE_DIR, default ~/.cache/unitree_sim_isaaclab/assets.
+The prefetch CLI is tools/prefetch_assets.py.
+"""
+
+import os
+import tempfile
+import urllib.request
+from typing import Iterable, List, Optional, Set
+from urllib.parse import unquote, urlparse
+
+ASSET_CACHE_DIR_ENV = "SIM_ASSET_CACHE_DIR"
+DEFAULT_ASSET_CACHE_DIR = os.path.expanduser("~/.cache/unitree_sim_isaaclab/assets")
+REMOTE_SCHEMES = ("http", "https", "omniverse", "s3")
+# extensions of USD layers, their dependencies are fetched as well
+LAYER_EXTENSIONS = (".usd", ".usda", ".usdc")
+COMPLETE_SUFFIX = ".complete"
+
+
+def get_asset_cache_dir() -> str:
+    return os.environ.get(ASSET_CACHE_DIR_ENV, DEFAULT_ASSET_CACHE_DIR)
+
+
+def is_remote(path: str) -> bool:
+    return urlparse(path).scheme in REMOTE_SCHEMES
+
+
+def cache_path(url: str, cache_dir: Optional[str] = None) -> str:
+    """The local mirror path of a remote URL"""
+    parsed = urlparse(url)
+    relative = unquote(parsed.path).lstrip("/")
+    return os.path.join(cache_dir or get_asset_cache_dir(), parsed.netloc, *relative.split("/"))
+
+
+def remote_url(local_path: str, template_url: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """The remote URL of a path inside the mirror of template_url's server, None if it is outside"""
+    parsed = urlparse(template_url)
+    root = os.path.join(cache_dir or get_asset_cache_dir(), parsed.netloc)
+    relative = os.path.relpath(os.path.abspath(local_path), root)
+    if relative.startswith(".."):
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}/{relative.replace(os.sep, '/')}"
+
+
+def complete_marker(local_path: str) -> str:
+    """The marker written once a mirrored asset and all its dependencies are in the cache"""
+    return local_path + COMPLETE_SUFFIX
+
+
+def resolve_asset(path: str, cache_dir: Optional[str] = None) -> str:
+    """The local copy of a remote asset if it was prefetched completely, otherwise the path unchanged"""
+    if not path or not is_remote(path):
+        return path
+    local = cache_path(path, cache_dir)
+    return local if os.path.isfile(local) and os.path.isfile(complete_marker(local)) else path
+
+
+def _read_remote(url: str) -> bytes:
+    try:
+        import omni.client
+    except ImportError:
+        omni_client = None
+    else:
+        omni_client = omni.client
+    if omni_client is not None:
+        result, _, content = omni_client.read_file(url)
+        if result != omni_client.Result.OK:
+            raise IOError(f"omni.client failed to read {url}: {result}")
+        return memoryview(content).tobytes()
+    if urlparse(url).scheme not in ("http", "https"):
+        raise IOError(f"cannot fetch {url} without omni.client")
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
+
+def fetch(url: str, cache_dir: Optional[str] = None, force: bool = False) -> str:
+    """Download one remote file into the mirror
+
+    Returns:
+        the local path
+    """
+    local = cache_path(url, cache_dir)
+    if os.path.isfile(local) and not force:
+        return local
+    os.makedirs(os.path.dirname(local), exist_ok=True)
+    data = _read_remote(url)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local), prefix=".fetch_")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, local)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return local
+
+
+def _missing_dependencies(local_layer: str) -> Optional[List[str]]:
+    """the dependencies of a mirrored layer that are not in the mirror yet, None without the USD bindings"""
+    try:
+        from pxr import UsdUtils
+    except ImportError:
+        return None
+    _, _, unresolved = UsdUtils.ComputeAllDependencies(local_layer)
+    return [path for path in unresolved if not is_remote(path)]
+
+
+def _prefetch_root(root_url: str, cache_dir: Optional[str], force: bool, with_dependencies: bool,
+                   report: dict, done: Set[str]) -> bool:
+    """fetch one asset and its dependencies, True if all of them are in the cache"""
+    complete = True
+    pending = [root_url]
+    seen: Set[str] = set()
+    while pending:
+        url = pending.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+        if url in report["failed"]:
+            complete = False
+            continue
+        cached = os.path.isfile(cache_path(url, cache_dir))
+        try:
+            # with force, a file shared by several assets is downloaded once
+            local = fetch(url, cache_dir, force=force and url not in done)
+        except Exception as e:
+            report["failed"][url] = str(e)
+            print(f"[asset_cache] ❌ {url}: {e}")
+            complete = False
+            continue
+        if url not in done:
+            done.add(url)
+            report["cached" if cached and not force else "fetched"].append(url)
+        if not local.lower().endswith(LAYER_EXTENSIONS):
+            continue
+        dependencies = _missing_dependencies(local) if with_dependencies else None
+        if dependencies is None:
+            # the dependencies of the layer were not checked
+            complete = False
+            continue
+        for dependency in dependencies:
+            dependency_url = remote_url(dependency, root_url, cache_dir)
+            if dependency_url is None:
+                print(f"[asset_cache] ❌ {url}: dependency {dependency} is outside the mirror")
+                complete = False
+            else:
+                pending.append(dependency_url)
+    return complete
+
+
+def prefetch(urls: Iterable[str], cache_dir: Optional[str] = None, force: bool = False,
+             with_dependencies: bool = True) -> dict:
+    """Mirror remote assets (and the files their layers depend on) into the cache
+
+    Args:
+        urls: asset paths, local paths are skipped
+        cache_dir: the cache directory, default SIM_ASSET_CACHE_DIR
+        force: download again even if cached
+        with_dependencies: also fetch the sublayers, references and textures of USD layers
+
+    Returns:
+        {"fetched": [...], "cached": [...], "failed": {url: error}, "local": [...],
+         "complete": [...], "incomplete": [...]}, complete/incomplete list the given urls: only the complete
+        ones get a completion marker and are resolved to the cache
+    """
+    report = {"fetched": [], "cached": [], "failed": {}, "local": [], "complete": [], "incomplete": []}
+    done: Set[str] = set()
+    for url in dict.fromkeys(urls):
+        if not is_remote(url):
+            report["local"].append(url)
+            continue
+        marker = complete_marker(cache_path(url, cache_dir))
+        if force and os.path.exists(marker):
+            os.remove(marker)
+        if _prefetch_root(url, cache_dir, force, with_dependencies, report, done):
+            with open(marker, "w", encoding="utf-8"):
+                pass
+            report["complete"].append(url)
+        else:
+            if os.path.exists(marker):
+                os.remove(marker)
+            report["incomplete"].append(url)
+    return report
+
+
+def _iter_cfg_children(cfg):
+    values = getattr(cfg, "__dict__", None)
+    if values is None:
+        return []
+    return list(values.values())
+
+
+def find_usd_cfgs(cfg, max_depth: int = 4) -> list:
+    """Every spawn config with a usd_path below a config object (scene cfg, env cfg, asset cfg)"""
+    found = []
+    visited = set()
+
+    def walk(obj, depth):
+        if obj is None or depth > max_depth or id(obj) in visited:
+            return
+        if isinstance(obj, (str, bytes, int, float, bool, tuple, list, dict)):
+            return
+        visited.add(id(obj))
+        if isinstance(getattr(obj, "usd_path", None), str):
+            found.append(obj)
+        for child in _iter_cfg_children(obj):
+            walk(child, depth + 1)
+
+    walk(cfg, 0)
+    return found
+
+
+def collect_usd_paths(cfg) -> List[str]:
+    """The usd_path of every spawn config below a config object"""
+    return list(dict.fromkeys(spawn.usd_path for spawn in find_usd_cfgs(cfg)))
+
+
+def resolve_scene_assets(cfg, cache_dir: Optional[str] = None) -> int:
+    """Point the usd_path of every spawn config below cfg to its cached copy
+
+    Returns:
+        the number of paths resolved to the cache
+    """
+    resolved = 0
+    for spawn in find_usd_cfgs(cfg):
+        local = resolve_asset(spawn.usd_path, cache_dir)
+        if local != spawn.usd_path:
+            spawn.usd_path = local
+            resolved += 1
+    return resolved
@@ -0,0 +1,640 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Headless benchmark of the sim_main.py control pipeline
+Runs the pipeline stages against a stand-in env instead of Isaac Sim, so hot-path changes can be measured
+on a CPU-only machine (torch, numpy, opencv, pyzmq and onnxruntime are needed; Isaac Sim, Isaac Lab, a GPU
+and unitree_sdk2py are not).
+
+The stand-in env exposes what the pipeline touches: scene["robot"].data joint and root tensors,
+a rigid object, three cameras with data.output["rgb"], scene.get_state()/reset_to(), sim.render()
+and step(), which runs the robot state and camera observation terms like the real task cfgs.
+The DDS objects use the in-process loopback channels of dds/dds_base.py: every message is serialized
+and deserialized with its IDL type and handed to the subscriber handlers, without a DDS stack.
+Without unitree_sdk2py the IDL types are the stand-ins of tools/bench_stand_ins.py (same fields, pickle instead
+of CDR serialization), without Isaac Lab its DelayBuffer is a stand-in too, and without the whole-body policy
+file (--model_path) a TorchScript MLP of the policy's input and output size stands in for it.
+
+Stages:
+    obs_robot_state       robot joint state observation term -> G1 state shared memory
+    obs_camera_image      camera observation term -> image shared memory
+    image_server_send     image shared memory -> JPEG encode -> ZMQ send (ImageServer.send_frame)
+    dds_<name>_publish    state shared memory -> IDL message -> serialize -> reader, per DDS object
+                          (g129, dex3, dex1, inspire, sim_state, reward_telemetry; sim_clock from write_clock)
+    dds_<name>_subscribe  IDL message -> serialize -> subscriber handler -> command shared memory, per DDS object
+                          (g129, dex3, dex1, inspire, run_command, reset_pose, sim_state, sim_clock)
+    obs_wholebody         whole-body actor observation and history (DDSRLActionProvider.compute_observations)
+    action_<source>       ActionProvider.get_action for dds, replay, replay_kinematic and dds_wholebody; the replay
+                          regeneration rate with --kinematic_replay off and on is printed after the stages
+    controller_step       RobotController.step with the DDS action provider and env.step
+
+Every stage reports mean / p50 / p99 latency and throughput, with --allocations also the tensor memory
+allocations per call. With --thresholds (JSON {stage: max mean us}) the script exits with code 1 when a
+stage is slower than its threshold or was not run; --save_thresholds records the current means times --margin
+as a new baseline.
+
+tools/bench_pipeline_baseline.json is the committed baseline, checked on CI with
+    python tools/bench_pipeline.py --thresholds tools/bench_pipeline_baseline.json
+It was recorded on a 1 vCPU x86 box without unitree_sdk2py, Isaac Lab and the policy file, so with all the
+stand-ins above (--iters 1000 --margin 2.0); regenerate it on the CI machine when the hardware or the installed
+dependencies change, the stand-ins do not time like the SDK serialization or the real policy.
+
+Usage:
+    python tools/bench_pipeline.py [--iters 1000] [--stages dds action] [--thresholds bench.json]
+    python tools/bench_pipeline.py --save_thresholds bench.json --margin 2.0
+    python tools/bench_pipeline.py --stages obs_wholebody action_dds_wholebody --allocations
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import importlib
+import statistics
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.sim_instance import set_instance
+from tools.sim_context import get_sim_context
+from tools.camera_settings import SCENE_CAMERAS, get_camera_settings, set_camera_settings
+from tools.bench_stand_ins import install_unitree_sdk_stand_ins, install_isaaclab_buffer_stand_ins
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the whole-body action provider resolves its policy path against the project root, like under sim_main.py
+os.environ.setdefault("PROJECT_ROOT", PROJECT_ROOT)
+
+HAND_JOINT_NAMES = [
+    # dex1
+    "left_hand_Joint1_1", "left_hand_Joint2_1", "right_hand_Joint1_1", "right_hand_Joint2_1",
+    # dex3
+    "left_hand_thumb_0_joint", "left_hand_thumb_1_joint", "left_hand_thumb_2_joint",
+    "left_hand_middle_0_joint", "left_hand_middle_1_joint", "left_hand_index_0_joint", "left_hand_index_1_joint",
+    "right_hand_thumb_0_joint", "right_hand_thumb_1_joint", "right_hand_thumb_2_joint",
+    "right_hand_middle_0_joint", "right_hand_middle_1_joint", "right_hand_index_0_joint", "right_hand_index_1_joint",
+    # inspire
+    "L_pinky_proximal_joint", "L_ring_proximal_joint", "L_middle_proximal_joint", "L_index_proximal_joint",
+    "L_thumb_proximal_pitch_joint", "L_thumb_proximal_yaw_joint",
+    "R_pinky_proximal_joint", "R_ring_proximal_joint", "R_middle_proximal_joint", "R_index_proximal_joint",
+    "R_thumb_proximal_pitch_joint", "R_thumb_proximal_yaw_joint",
+    "L_index_intermediate_joint", "L_middle_intermediate_joint", "L_pinky_intermediate_joint",
+    "L_ring_intermediate_joint", "L_thumb_intermediate_joint", "L_thumb_distal_joint",
+    "R_index_intermediate_joint", "R_middle_intermediate_joint", "R_pinky_intermediate_joint",
+    "R_ring_intermediate_joint", "R_thumb_intermediate_joint", "R_thumb_distal_joint",
+]
+
+# ---------------------------------------------------------------- stand-in env
+
+def _ids(ids):
+    return slice(None) if ids is None else ids
+
+
+class MockAsset:
+    """articulation or rigid object with the data tensors and write methods the pipeline uses"""
+
+    def __init__(self, num_envs, device, joint_names=None):
+        root_state = torch.zeros(num_envs, 13, device=device)
+        root_state[:, 3] = 1.0
+        self.data = SimpleNamespace(root_state_w=root_state, default_root_state=root_state.clone(), body_names=[])
+        if joint_names is not None:
+            num_joints = len(joint_names)
+            self.data.joint_names = list(joint_names)
+            self.data.joint_pos = torch.zeros(num_envs, num_joints, device=device)
+            self.data.joint_vel = torch.zeros(num_envs, num_joints, device=device)
+            self.data.applied_torque = torch.zeros(num_envs, num_joints, device=device)
+            self.data.default_joint_pos = torch.zeros(num_envs, num_joints, device=device)
+            self.data.default_joint_vel = torch.zeros(num_envs, num_joints, device=device)
+            self.data.root_ang_vel_b = torch.zeros(num_envs, 3, device=device)
+            self.data.projected_gravity_b = torch.tensor([[0.0, 0.0, -1.0]], device=device).repeat(num_envs, 1)
+            self.data.joint_pos_target = torch.zeros(num_envs, num_joints, device=device)
+
+    def set_joint_position_target(self, target, joint_ids=None, env_ids=None):
+        self.data.joint_pos_target[:] = target
+
+    def write_root_pose_to_sim(self, root_pose, env_ids=None):
+        self.data.root_state_w[_ids(env_ids), :7] = root_pose
+
+    def write_root_velocity_to_sim(self, root_velocity, env_ids=None):
+        self.data.root_state_w[_ids(env_ids), 7:] = root_velocity
+
+    def write_root_state_to_sim(self, root_state, env_ids=None):
+        self.data.root_state_w[_ids(env_ids)] = root_state
+
+    def write_joint_position_to_sim(self, position, joint_ids=None, env_ids=None):
+        if joint_ids is None:
+            self.data.joint_pos[_ids(env_ids)] = position
+        else:
+            self.data.joint_pos[:, joint_ids] = position
+
+    def write_joint_state_to_sim(self, position, velocity, joint_ids=None, env_ids=None):
+        self.write_joint_position_to_sim(position, joint_ids, env_ids)
+        if joint_ids is None:
+            self.data.joint_vel[_ids(env_ids)] = velocity
+        else:
+            self.data.joint_vel[:, joint_ids] = velocity
+
+
+class MockCamera:
+    def __init__(self, num_envs, device, height, width, depth=False):
+        output = {"rgb": torch.randint(0, 255, (num_envs, height, width, 3), dtype=torch.uint8, device=device)}
+        if depth:
+            output["distance_to_image_plane"] = torch.rand((num_envs, height, width, 1), device=device) * 3.0
+        self.data = SimpleNamespace(output=output)
+
+    def update(self, dt, force_recompute=False):
+        pass
+
+
+class MockScene:
+    def __init__(self, num_envs, device, joint_names):
+        self.device = device
+        self.num_envs = num_envs
+        self.env_origins = torch.zeros(num_envs, 3, device=device)
+        self.articulations = {"robot": MockAsset(num_envs, device, joint_names)}
+        self.rigid_objects = {"object": MockAsset(num_envs, device)}
+        # the cameras follow the camera stream settings like the CameraPresets of the real task cfgs
+        self.sensors = {SCENE_CAMERAS[role]: MockCamera(num_envs, device, cfg.height, cfg.width, cfg.depth)
+                        for role, cfg in get_camera_settings().items()}
+        self._entities = {**self.articulations, **self.rigid_objects, **self.sensors}
+
+    def __getitem__(self, name):
+        return self._entities[name]
+
+    def write_data_to_sim(self):
+        pass
+
+    def update(self, dt):
+        # first order tracking of the joint position targets set by the whole-body provider
+        robot = self.articulations["robot"].data
+        robot.joint_vel[:] = (robot.joint_pos_target - robot.joint_pos) * 0.5 / dt
+        robot.joint_pos += (robot.joint_pos_target - robot.joint_pos) * 0.5
+
+    def keys(self):
+        return self._entities.keys()
+
+    def get_state(self, is_relative=False):
+        state = {"articulation": {}, "rigid_object": {}, "deformable_object": {}}
+        for name, asset in self.articulations.items():
+            root = asset.data.root_state_w.clone()
+            if is_relative:
+                root[:, :3] -= self.env_origins
+            state["articulation"][name] = {
+                "root_pose": root[:, :7], "root_velocity": root[:, 7:],
+                "joint_position": asset.data.joint_pos.clone(), "joint_velocity": asset.data.joint_vel.clone(),
+            }
+        for name, asset in self.rigid_objects.items():
+            root = asset.data.root_state_w.clone()
+            if is_relative:
+                root[:, :3] -= self.env_origins
+            state["rigid_object"][name] = {"root_pose": root[:, :7], "root_velocity": root[:, 7:]}
+        return state
+
+    def reset_to(self, state, env_ids=None, is_relative=False):
+        ids = _ids(env_ids)
+        for group in ("articulation", "rigid_object"):
+            for name, asset_state in state.get(group, {}).items():
+                asset = self._entities[name]
+                root_pose = asset_state["root_pose"].clone()
+                if is_relative:
+                    root_pose[:, :3] += self.env_origins[ids]
+                asset.write_root_pose_to_sim(root_pose, env_ids=env_ids)
+                asset.write_root_velocity_to_sim(asset_state["root_velocity"], env_ids=env_ids)
+                if "joint_position" in asset_state:
+                    asset.write_joint_state_to_sim(asset_state["joint_position"], asset_state["joint_velocity"],
+                                                   env_ids=env_ids)
+
+
+class MockObservationManager:
+    """runs the robot state and camera observation terms on compute()"""
+
+    def __init__(self, env):
+        from tasks.common_observations.g1_29dof_state import get_robot_boy_joint_states
+        from tasks.common_observations.camera_state import get_camera_image
+        self.env = env
+        self.terms = [get_robot_boy_joint_states, get_camera_image]
+        self.active_terms = {"policy": ["robot_joint_state", "camera_image"]}
+        self._group_obs_term_cfgs = {"policy": [SimpleNamespace(func=term, params={}) for term in self.terms]}
+
+    def compute(self):
+        return {"policy": [term(self.env) for term in self.terms]}
+
+
+class MockEnv:
+    """stand-in for ManagerBasedRLEnv with one env on the CPU"""
+
+    def __init__(self, device="cpu"):
+        from tasks.common_observations.g1_29dof_state import get_robot_boy_joint_names
+        self.num_envs = 1
+        self.device = device
+        self.physics_dt = 0.005
+        self.scene = MockScene(self.num_envs, device, get_robot_boy_joint_names() + HAND_JOINT_NAMES)
+        self.sim = SimpleNamespace(render=lambda: None, reset=lambda: None, step=lambda render=False: None)
+        self.observation_manager = MockObservationManager(self)
+
+    def step(self, action):
+        robot = self.scene["robot"].data
+        # first order tracking of the joint targets
+        robot.joint_vel[:] = (action - robot.joint_pos) * 0.5 / self.physics_dt
+        robot.joint_pos += (action - robot.joint_pos) * 0.5
+        return self.observation_manager.compute()
+
+
+# ---------------------------------------------------------------- loopback DDS channels
+
+STATE_TOPICS = [
+    ("rt/lowstate", "unitree_sdk2py.idl.unitree_hg.msg.dds_", "LowState_"),
+    ("rt/dex3/left/state", "unitree_sdk2py.idl.unitree_hg.msg.dds_", "HandState_"),
+    ("rt/dex3/right/state", "unitree_sdk2py.idl.unitree_hg.msg.dds_", "HandState_"),
+    ("rt/dex1/left/state", "unitree_sdk2py.idl.unitree_go.msg.dds_", "MotorStates_"),
+    ("rt/dex1/right/state", "unitree_sdk2py.idl.unitree_go.msg.dds_", "MotorStates_"),
+    ("rt/inspire/state", "unitree_sdk2py.idl.unitree_go.msg.dds_", "MotorStates_"),
+    ("rt/sim_state", "unitree_sdk2py.idl.std_msgs.msg.dds_", "String_"),
+    ("rt/sim_clock", "unitree_sdk2py.idl.std_msgs.msg.dds_", "String_"),
+    ("rt/sim_reward", "unitree_sdk2py.idl.std_msgs.msg.dds_", "String_"),
+]
+
+
+def setup_loopback_channels():
+    """select the in-process loopback channels and attach a reader to every state topic
+
+    Published states are serialized and deserialized with their IDL types like on a real DDS link.
+    """
+    from dds.dds_base import set_channel_backend, LoopbackChannelSubscriber
+    set_channel_backend("loopback")
+    readers = []
+    for topic, module_name, type_name in STATE_TOPICS:
+        reader = LoopbackChannelSubscriber(topic, getattr(importlib.import_module(module_name), type_name))
+        reader.Init()
+        readers.append(reader)
+    from dds.dds_master import dds_manager
+    return dds_manager, readers
+
+
+def create_dds_objects(dds_manager, env):
+    """register every DDS object of dds/dds_create.py and set up their channels"""
+    from dds.g1_robot_dds import G1RobotDDS
+    from dds.dex3_dds import Dex3DDS
+    from dds.gripper_dds import GripperDDS
+    from dds.inspire_dds import InspireDDS
+    from dds.commands_dds import RunCommandDDS
+    from dds.reset_pose_dds import ResetPoseCmdDDS
+    from dds.sim_state_dds import SimStateDDS
+    from dds.sim_clock_dds import SimClockDDS
+    from dds.reward_telemetry_dds import RewardTelemetryDDS
+    objects = {
+        "g129": G1RobotDDS(),
+        "dex3": Dex3DDS(),
+        "dex1": GripperDDS(),
+        "inspire": InspireDDS(),
+        "run_command": RunCommandDDS(),
+        "reset_pose": ResetPoseCmdDDS(),
+        "sim_state": SimStateDDS(env, "bench"),
+        "sim_clock": SimClockDDS(),
+        "reward_telemetry": RewardTelemetryDDS(),
+    }
+    for name, obj in objects.items():
+        dds_manager.register_object(name, obj)
+        obj.setup_publisher()
+        obj.setup_subscriber()
+    return objects
+
+
+def close_dds_objects(objects):
+    """release the state and command shared memory of the DDS objects"""
+    for obj in objects.values():
+        for shm in (getattr(obj, "input_shm", None), getattr(obj, "output_shm", None)):
+            if shm is not None:
+                shm.cleanup()
+
+
+def command_messages():
+    """one command message per subscriber, (object name, topic, message type, message)"""
+    from unitree_sdk2py.idl.default import (unitree_hg_msg_dds__LowCmd_, unitree_hg_msg_dds__HandCmd_,
+                                            unitree_go_msg_dds__MotorCmd_, std_msgs_msg_dds__String_)
+    from unitree_sdk2py.idl.unitree_hg.msg.dds_ import LowCmd_, HandCmd_
+    from unitree_sdk2py.idl.unitree_go.msg.dds_ import MotorCmds_
+    from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+    from unitree_sdk2py.utils.crc import CRC
+    low_cmd = unitree_hg_msg_dds__LowCmd_()
+    for i, motor in enumerate(low_cmd.motor_cmd):
+        motor.q = 0.01 * i
+    low_cmd.crc = CRC().Crc(low_cmd)
+    hand_cmd = unitree_hg_msg_dds__HandCmd_()
+    run_command = std_msgs_msg_dds__String_()
+    run_command.data = "[0.5, 0.0, 0.0, 0.8]"
+    reset_pose = std_msgs_msg_dds__String_()
+    reset_pose.data = "1"
+    sim_state_cmd = std_msgs_msg_dds__String_()
+    sim_state_cmd.data = json.dumps({"command": "get_state"})
+    clock_stamp = std_msgs_msg_dds__String_()
+    clock_stamp.data = "42"
+    return [
+        ("g129", "rt/lowcmd", LowCmd_, low_cmd),
+        ("dex3", "rt/dex3/left/cmd", HandCmd_, hand_cmd),
+        ("dex1", "rt/dex1/left/cmd", MotorCmds_, MotorCmds_(cmds=[unitree_go_msg_dds__MotorCmd_() for _ in range(2)])),
+        ("inspire", "rt/inspire/cmd", MotorCmds_, MotorCmds_(cmds=[unitree_go_msg_dds__MotorCmd_() for _ in range(12)])),
+        ("run_command", "rt/run_command/cmd", String_, run_command),
+        ("reset_pose", "rt/reset_pose/cmd", String_, reset_pose),
+        ("sim_state", "rt/sim_state_cmd", String_, sim_state_cmd),
+        ("sim_clock", "rt/sim_clock/cmd", String_, clock_stamp),
+    ]
+
+
+def write_states(objects, env):
+    """fill the state shared memory of the hand and sim state objects once, the robot state is written by the obs term"""
+    objects["dex3"].write_hand_states([0.1] * 7, [0.0] * 7, [0.0] * 7, [0.1] * 7, [0.0] * 7, [0.0] * 7)
+    objects["dex1"].write_gripper_state([0.01], [0.0], [0.0], [0.01], [0.0], [0.0])
+    objects["inspire"].write_inspire_state([0.5] * 12, [0.0] * 12, [0.0] * 12)
+    sim_state = objects["sim_state"]
+    sim_state.write_sim_state_data({"init_state": sim_state.tensors_to_list(env.scene.get_state(is_relative=True)),
+                                    "task_name": "bench"})
+
+
+def publish_stages(objects):
+    """(stage name, callable) of every publishing DDS object
+
+    The objects that publish a shared memory message only once per new message (reward telemetry) or publish from
+    the write itself (sim clock) get a new message per call.
+    """
+    stages = [(f"dds_{name}_publish", objects[name].dds_publisher)
+              for name in ("g129", "dex3", "dex1", "inspire", "sim_state")]
+    telemetry = objects["reward_telemetry"]
+    telemetry_seq = [0]
+
+    def reward_telemetry_publish():
+        telemetry_seq[0] += 1
+        # a sample of the form tools/reward_telemetry.py publishes
+        telemetry.write_telemetry({"type": "sample", "seq": telemetry_seq[0], "episode": 0, "step": telemetry_seq[0],
+                                   "reward": 0.3, "terms": {"reward": 0.3}, "terminations": [],
+                                   "reward_sum": 2.1, "reward_max": 0.3, "first_success_step": None})
+        telemetry.dds_publisher()
+    stages.append(("dds_reward_telemetry_publish", reward_telemetry_publish))
+
+    sim_clock = objects["sim_clock"]
+    clock_step = [0]
+
+    def sim_clock_publish():
+        clock_step[0] += 1
+        sim_clock.write_clock(clock_step[0], clock_step[0] * 0.005)
+    stages.append(("dds_sim_clock_publish", sim_clock_publish))
+    return stages
+
+
+def stand_in_policy(path, obs_dim, num_actions):
+    """save a TorchScript MLP with the input and output size of the whole-body policy"""
+    torch.manual_seed(0)
+    policy = torch.nn.Sequential(
+        torch.nn.Linear(obs_dim, 512), torch.nn.ELU(), torch.nn.Linear(512, 256), torch.nn.ELU(),
+        torch.nn.Linear(256, 128), torch.nn.ELU(), torch.nn.Linear(128, num_actions),
+    )
+    with torch.no_grad():
+        policy[-1].weight.mul_(0.01)
+    torch.jit.save(torch.jit.script(policy.eval()), path)
+
+
+# ---------------------------------------------------------------- replay data
+
+def write_replay_episode(env, path, frames):
+    """write a data.json with frames of the stand-in scene for the replay action providers"""
+    def to_list(obj):
+        if isinstance(obj, torch.Tensor):
+            return obj.tolist()
+        if isinstance(obj, dict):
+            return {key: to_list(value) for key, value in obj.items()}
+        return obj
+    robot = env.scene["robot"].data
+    data = []
+    for frame in range(frames):
+        robot.joint_pos[:, 15:29] = 0.3 * np.sin(frame * 0.05)
+        env.scene["object"].data.root_state_w[:, 0] = 0.001 * frame
+        data.append({
+            "actions": {
+                "left_arm": {"qpos": [0.1] * 7}, "right_arm": {"qpos": [0.1] * 7},
+                "left_ee": {"qpos": [0.0]}, "right_ee": {"qpos": [0.0]},
+            },
+            "sim_state": {"init_state": to_list(env.scene.get_state(is_relative=True)), "task_name": "bench"},
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"info": {}, "text": {}, "data": data}, f)
+
+
+# ---------------------------------------------------------------- timing
+
+def time_stage(fn, iters, warmup=10):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(iters):
+        start = perf_counter()
+        fn()
+        samples.append(perf_counter() - start)
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return {
+        "iters": iters,
+        "mean_us": mean * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+        "hz": 1.0 / mean if mean > 0 else float("inf"),
+    }
+
+
+def count_allocations(fn, iters=100, warmup=10):
+    """tensor memory allocations per call, counted with the torch profiler (CPU and device allocator)
+
+    An allocation made inside an op is attributed to the op that made it (its self memory usage),
+    allocations outside any op are "[memory]" events; frees are negative and not counted.
+    """
+    from torch.profiler import profile, ProfilerActivity
+    for _ in range(warmup):
+        fn()
+    activities = [ProfilerActivity.CPU] + ([ProfilerActivity.CUDA] if torch.cuda.is_available() else [])
+    with profile(activities=activities, profile_memory=True) as prof:
+        for _ in range(iters):
+            fn()
+    allocations = sum(1 for event in prof.events()
+                      if event.self_cpu_memory_usage > 0 or getattr(event, "self_device_memory_usage", 0) > 0)
+    return allocations / iters
+
+
+def build_stages(env, objects, args, tmp_dir):
+    """(stage name, callable) pairs of all stages"""
+    from tasks.common_observations.g1_29dof_state import get_robot_boy_joint_states
+    from tasks.common_observations.camera_state import get_camera_image
+    stages = [
+        ("obs_robot_state", lambda: get_robot_boy_joint_states(env)),
+        ("obs_camera_image", lambda: get_camera_image(env)),
+    ]
+
+    get_camera_image(env)
+    from image_server.image_server import ImageServer
+    # fps=0: no sim-time pacing, every call sends
+    image_server = ImageServer(fps=0, port=args.image_port, auto_start=False)
+
+    def image_server_send():
+        # the shared memory holds one frame: forget its id so every call reads, encodes and sends it again
+        image_server.multi_image_reader.last_frame_id = None
+        if not image_server.send_frame():
+            raise RuntimeError("image_server_send: no frame sent")
+    stages.append(("image_server_send", image_server_send))
+
+    get_robot_boy_joint_states(env)
+    write_states(objects, env)
+    stages += publish_stages(objects)
+    from dds.dds_base import create_publisher
+    for name, topic, msg_type, msg in command_messages():
+        # serialize -> deserialize -> subscriber handler -> command shared memory
+        publisher = create_publisher(topic, msg_type)
+        publisher.Init()
+        stages.append((f"dds_{name}_subscribe", lambda publisher=publisher, msg=msg: publisher.Write(msg)))
+
+    from action_provider.action_provider_dds import DDSActionProvider
+    from action_provider.action_provider_replay import FileActionProviderReplay
+    provider_args = SimpleNamespace(
+        robot_type="g129", enable_dex1_dds=False, enable_dex3_dds=True, enable_inspire_dds=False,
+        enable_wholebody_dds=False, generate_data=False, generate_data_dir=tmp_dir, rerun_log=False,
+        image_storage="jpeg", kinematic_replay=False, generation_profile="images", model_path=args.model_path,
+    )
+    dds_provider = DDSActionProvider(env, provider_args)
+    stages.append(("action_dds", lambda: dds_provider.get_action(env)))
+
+    episode_path = os.path.join(tmp_dir, "data.json")
+    write_replay_episode(env, episode_path, args.replay_frames)
+    for stage_name, kinematic in (("action_replay", False), ("action_replay_kinematic", True)):
+        replay_provider = FileActionProviderReplay(env, SimpleNamespace(**{**vars(provider_args), "kinematic_replay": kinematic}))
+        replay_provider.load_data(episode_path)
+
+        def replay_step(provider=replay_provider):
+            if provider.action_index >= provider.total_step_num:
+                provider.start_replay()
+            provider.get_action(env)
+        stages.append((stage_name, replay_step))
+
+    from action_provider.action_provider_wh_dds import DDSRLActionProvider
+    wh_args = SimpleNamespace(**{**vars(provider_args), "enable_wholebody_dds": True})
+    policy_path = os.path.join(PROJECT_ROOT, args.model_path)
+    stand_in = not os.path.exists(policy_path)
+    if stand_in:
+        policy_path = os.path.join(tmp_dir, "policy_stand_in.pt")
+        # the provider loads the policy on construction, the sized stand-in replaces this placeholder below
+        torch.jit.save(torch.jit.script(torch.nn.Identity()), policy_path)
+        wh_args.model_path = os.path.relpath(policy_path, os.environ["PROJECT_ROOT"])
+    wh_provider = DDSRLActionProvider(env, wh_args)
+    if stand_in:
+        stand_in_policy(policy_path, wh_provider.compute_observations().shape[1], len(wh_provider.action_to_indices))
+        wh_provider.policy = wh_provider.load_policy(policy_path)
+        wh_provider.actor_obs.reset()
+        print(f"[bench_pipeline] {args.model_path} not found, the whole-body stages run a stand-in MLP policy")
+
+    # get_action reports its errors and returns None either way, a failing step does not count a policy step
+    policy_steps = wh_provider._rate_counts[0]
+    wh_provider.get_action(env)
+    if wh_provider._rate_counts[0] == policy_steps:
+        raise RuntimeError("action_dds_wholebody: get_action failed on the stand-in env")
+    stages.append(("obs_wholebody", wh_provider.compute_observations))
+    stages.append(("action_dds_wholebody", lambda: wh_provider.get_action(env)))
+
+    from layeredcontrol.robot_control_system import RobotController, ControlConfig
+    controller = RobotController(env, ControlConfig(step_hz=1_000_000))
+    controller.set_action_provider(dds_provider)
+    controller.set_profiling(False)
+    controller.is_running = True
+    stages.append(("controller_step", controller.step))
+    return stages, image_server
+
+
+def check_thresholds(results, thresholds):
+    """stages whose mean latency is above their threshold"""
+    regressions = []
+    for name, limit_us in thresholds.items():
+        if name in results and results[name]["mean_us"] > limit_us:
+            regressions.append((name, results[name]["mean_us"], limit_us))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="headless sim_main pipeline benchmark")
+    parser.add_argument("--iters", type=int, default=1000, help="timed iterations per stage")
+    parser.add_argument("--stages", type=str, nargs="*", default=None, help="only run stages whose name starts with one of these prefixes")
+    parser.add_argument("--thresholds", type=str, default=None, help="JSON {stage: max mean us}, exit 1 on regression")
+    parser.add_argument("--save_thresholds", type=str, default=None, help="write the measured means times --margin as thresholds")
+    parser.add_argument("--margin", type=float, default=1.5, help="margin applied by --save_thresholds")
+    parser.add_argument("--replay_frames", type=int, default=200, help="frames of the synthetic replay episode")
+    parser.add_argument("--camera_resolution", type=str, default="640x480", help="camera resolution WIDTHxHEIGHT, per camera overrides like head=640x480")
+    parser.add_argument("--camera_depth", type=str, default="none", help="cameras with streamed depth: none, all or e.g. head,left")
+    parser.add_argument("--instance_id", type=int, default=63, help="sim instance used for the shared memory names")
+    parser.add_argument("--image_port", type=int, default=None, help="ZMQ port of the image server (default: port of the instance)")
+    parser.add_argument("--model_path", type=str, default="assets/model/policy.onnx", help="policy of the wholebody action provider")
+    parser.add_argument("--json", type=str, default=None, help="also write the results to this JSON file")
+    parser.add_argument("--allocations", action="store_true", default=False, help="also count the tensor allocations per call of every stage")
+    args = parser.parse_args()
+
+    # a separate instance keeps the shared memory and port of a running sim untouched
+    set_instance(args.instance_id)
+    set_camera_settings(args.camera_resolution, args.camera_depth)
+    if install_unitree_sdk_stand_ins():
+        print("[bench_pipeline] unitree_sdk2py not installed, the DDS objects use stand-in IDL types")
+    if install_isaaclab_buffer_stand_ins():
+        print("[bench_pipeline] isaaclab not installed, the whole-body provider uses a stand-in DelayBuffer")
+    dds_manager, state_readers = setup_loopback_channels()
+    env = MockEnv()
+    objects = create_dds_objects(dds_manager, env)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stages, image_server = build_stages(env, objects, args, tmp_dir)
+        if args.stages:
+            stages = [(name, fn) for name, fn in stages if any(name.startswith(prefix) for prefix in args.stages)]
+
+        results = {}
+        print(f"{'stage':<28} {'mean (us)':>10} {'p50 (us)':>10} {'p99 (us)':>10} {'rate (Hz)':>11}"
+              + (f" {'allocs':>8}" if args.allocations else ""))
+        for name, fn in stages:
+            result = time_stage(fn, args.iters)
+            line = f"{name:<28} {result['mean_us']:>10.1f} {result['p50_us']:>10.1f} {result['p99_us']:>10.1f} {result['hz']:>11.0f}"
+            if args.allocations:
+                result["allocations"] = count_allocations(fn, min(args.iters, 100))
+                line += f" {result['allocations']:>8.1f}"
+            results[name] = result
+            print(line)
+        image_server._close()
+        # the image shared memory written by the camera observation term
+        get_sim_context().close(unlink=True)
+        close_dds_objects(objects)
+
+    if "action_replay" in results and "action_replay_kinematic" in results:
+        # one get_action per replayed frame: the regeneration rate with --kinematic_replay off and on
+        full_fps = results["action_replay"]["hz"]
+        kinematic_fps = results["action_replay_kinematic"]["hz"]
+        print(f"[bench_pipeline] replay regeneration: {full_fps:.0f} frames/s with --kinematic_replay off, "
+              f"{kinematic_fps:.0f} frames/s on ({kinematic_fps / full_fps:.1f}x)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+    if args.save_thresholds:
+        with open(args.save_thresholds, "w", encoding="utf-8") as f:
+            json.dump({name: round(result["mean_us"] * args.margin, 1) for name, result in results.items()}, f, indent=4)
+        print(f"[bench_pipeline] thresholds written to {args.save_thresholds}")
+    if args.thresholds:
+        with open(args.thresholds, "r", encoding="utf-8") as f:
+            thresholds = json.load(f)
+        regressions = check_thresholds(results, thresholds)
+        for name, mean_us, limit_us in regressions:
+            print(f"[bench_pipeline] REGRESSION {name}: {mean_us:.1f}us > {limit_us:.1f}us")
+        # a stage of the baseline that was not run (e.g. a failed import) is not silently passed
+        missing = [name for name in thresholds if name not in results
+                   and (not args.stages or any(name.startswith(prefix) for prefix in args.stages))]
+        for name in missing:
+            print(f"[bench_pipeline] MISSING {name}: stage of the thresholds was not run")
+        if regressions or missing:
+            sys.exit(1)
+        print("[bench_pipeline] all stages within thresholds")
+
+
+if __name__ == "__main__":
+    main()
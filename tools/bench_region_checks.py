@@ -0,0 +1,249 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Benchmark of the reward and termination terms
+Imports every term of tasks/common_rewards and tasks/common_termination and runs it on a mock env at several
+num_envs. The mock env holds one rigid object per SceneEntityCfg default of the term, whose
+data.root_pos_w / data.root_com_pos_w are random [num_envs, 3] tensors around the region of the term
+(its min_x/max_x/min_y/max_y/min_height defaults), so both sides of every region check are exercised.
+
+Every term must return one value per env; the benchmark fails on a term that does not.
+The region terms are also run with the logic they had before the region checks were tensorized, as a reference:
+the termination terms tested each object with Python and/not, which only works for one env, so the reference
+loops over the envs and objects; the reward terms tested each object and condition separately and wrote the
+reward with boolean indexing. The reference must give the same result as the term.
+Isaac Lab is not needed: without it the isaaclab names the term modules import (SceneEntityCfg and the
+asset classes used as annotations) are replaced by minimal stand-ins.
+
+Usage:
+    python tools/bench_region_checks.py [--device cuda] [--num_envs 1 64 1024] [--iters 200] [--reference_iters 20]
+"""
+
+import os
+import sys
+import time
+import types
+import inspect
+import argparse
+import importlib
+import dataclasses
+from types import SimpleNamespace
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# module -> term functions
+TERMS = {
+    "tasks.common_rewards.base_scene_manipulation_bolt_nut": ["compute_reward"],
+    "tasks.common_rewards.base_scene_manipulation_bottle": ["compute_reward"],
+    "tasks.common_rewards.base_scene_pickplace_cylindercfg": ["compute_reward"],
+    "tasks.common_rewards.base_termination_pick_place_redblock": ["compute_reward"],
+    "tasks.common_rewards.base_termination_stack_rgyblock": ["compute_reward"],
+    "tasks.common_termination.base_termination_manipulation_bolt_nut": ["task_done"],
+    "tasks.common_termination.base_termination_manipulation_bottle": ["task_done"],
+    "tasks.common_termination.base_termination_pick_place_cylinder": ["reset_object_estimate"],
+    "tasks.common_termination.base_termination_pick_place_redblock": ["reset_object_estimate"],
+    "tasks.common_termination.base_termination_pick_redblock_into_drawer": ["reset_object_estimate"],
+    "tasks.common_termination.base_termination_stack_rgyblock": ["reset_object_estimate"],
+}
+
+
+def install_isaaclab_stand_ins():
+    """Make the isaaclab imports of the term modules resolve when Isaac Lab is not installed"""
+    try:
+        import isaaclab.managers  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    @dataclasses.dataclass
+    class SceneEntityCfg:
+        name: str
+
+    modules = {name: types.ModuleType(name) for name in
+               ("isaaclab", "isaaclab.assets", "isaaclab.managers", "isaaclab.utils", "isaaclab.utils.math")}
+    for name in ("Articulation", "DeformableObject", "RigidObject"):
+        setattr(modules["isaaclab.assets"], name, type(name, (), {}))
+    modules["isaaclab.managers"].SceneEntityCfg = SceneEntityCfg
+    for name, module in modules.items():
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(modules[parent], child, module)
+    sys.modules.update(modules)
+    return True
+
+
+def term_defaults(fn):
+    """default arguments of a term"""
+    return {name: param.default for name, param in inspect.signature(fn).parameters.items()}
+
+
+def term_objects(fn):
+    """names of the scene objects a term reads, from its SceneEntityCfg defaults"""
+    return [param.default.name for param in inspect.signature(fn).parameters.values()
+            if hasattr(param.default, "name")]
+
+
+def sample_bounds(fn):
+    """sampling box around the working area of a term, a small cube for the distance terms"""
+    defaults = term_defaults(fn)
+    if "min_x" not in defaults:
+        return (-0.05, -0.05, -0.05), (0.05, 0.05, 0.05)
+    margin_x = 0.2 * (defaults["max_x"] - defaults["min_x"])
+    margin_y = 0.2 * (defaults["max_y"] - defaults["min_y"])
+    return ((defaults["min_x"] - margin_x, defaults["min_y"] - margin_y, defaults["min_height"] - 0.3),
+            (defaults["max_x"] + margin_x, defaults["max_y"] + margin_y, defaults["min_height"] + 0.5))
+
+
+def reference_area_termination(fn):
+    """pre-port termination: Python and/not per object and condition, one env at a time"""
+    d = term_defaults(fn)
+    names = term_objects(fn)
+
+    def reference(env):
+        done = torch.zeros(env.num_envs, dtype=torch.bool, device=env.device)
+        for env_id in range(env.num_envs):
+            all_done = True
+            for name in names:
+                x, y, height = env.scene[name].data.root_pos_w[env_id]
+                done_x = (x < d["max_x"]) and (x > d["min_x"])
+                done_y = (y < d["max_y"]) and (y > d["min_y"])
+                done_height = (height > d["min_height"])
+                all_done = all_done and done_x and done_y and done_height
+            done[env_id] = not all_done
+        return done
+    return reference
+
+
+def reference_post_reward(fn):
+    """pre-port pick-place reward: one mask per condition, reward written with boolean indexing"""
+    d = term_defaults(fn)
+    name = term_objects(fn)[0]
+
+    def reference(env):
+        pos = env.scene[name].data.root_pos_w
+        x, y, height = pos[:, 0], pos[:, 1], pos[:, 2]
+        done = (x < d["max_x"]) & (x > d["min_x"]) & (y < d["max_y"]) & (y > d["min_y"]) & (height > d["min_height"])
+        done_post = (x < d["post_max_x"]) & (x > d["post_min_x"]) & (y < d["post_max_y"]) & (y > d["post_min_y"]) \
+            & (height > d["post_min_height"]) & (height < d["post_max_height"])
+        reward = torch.zeros(env.num_envs, device=env.device, dtype=torch.float)
+        reward[~done] = -1.0
+        reward[done_post] = 1.0
+        reward[done & ~done_post] = 0.0
+        return reward
+    return reference
+
+
+def reference_stack_reward(fn):
+    """pre-port stack reward: per-block masks, reward written with boolean indexing"""
+    d = term_defaults(fn)
+    blocks = dict(zip(("red", "yellow", "green"), term_objects(fn)))
+    order = [blocks[color] for color in d["stack_type"].split("_")]
+
+    def reference(env):
+        all_in_area = torch.ones(env.num_envs, dtype=torch.bool, device=env.device)
+        for name in blocks.values():
+            x, y, height = env.scene[name].data.root_pos_w.unbind(dim=1)
+            all_in_area = all_in_area & (x < d["max_x"]) & (x > d["min_x"]) & (y < d["max_y"]) & (y > d["min_y"]) \
+                & (height > d["min_height"])
+        reward = torch.zeros(env.num_envs, device=env.device, dtype=torch.float)
+        reward[~all_in_area] = -1.0
+        ok = all_in_area
+        for level, (name, value) in enumerate(zip(order, (0.3, 0.6, 1.0))):
+            x, y, height = env.scene[name].data.root_pos_w.unbind(dim=1)
+            ok = ok & (x < d["post_max_x"]) & (x > d["post_min_x"]) & (y < d["post_max_y"]) & (y > d["post_min_y"]) \
+                & (height >= d["post_min_height"] + level * d["block_height"]) \
+                & (height < d["post_max_height"] + level * d["block_height"])
+            reward[ok] = value
+        return reward
+    return reference
+
+
+# module.function -> builder of its pre-port reference (the distance terms were already tensorized)
+REFERENCES = {
+    "tasks.common_rewards.base_scene_pickplace_cylindercfg.compute_reward": reference_post_reward,
+    "tasks.common_rewards.base_termination_pick_place_redblock.compute_reward": reference_post_reward,
+    "tasks.common_rewards.base_termination_stack_rgyblock.compute_reward": reference_stack_reward,
+    "tasks.common_termination.base_termination_pick_place_cylinder.reset_object_estimate": reference_area_termination,
+    "tasks.common_termination.base_termination_pick_place_redblock.reset_object_estimate": reference_area_termination,
+    "tasks.common_termination.base_termination_pick_redblock_into_drawer.reset_object_estimate": reference_area_termination,
+    "tasks.common_termination.base_termination_stack_rgyblock.reset_object_estimate": reference_area_termination,
+}
+
+
+def mock_env(fn, num_envs, device):
+    """env whose scene holds the objects of the term at random positions"""
+    low, high = (torch.tensor(bound, device=device) for bound in sample_bounds(fn))
+    scene = {}
+    for name in term_objects(fn):
+        pos = low + (high - low) * torch.rand(num_envs, 3, device=device)
+        scene[name] = SimpleNamespace(data=SimpleNamespace(root_pos_w=pos, root_com_pos_w=pos))
+    return SimpleNamespace(scene=scene, num_envs=num_envs, device=device)
+
+
+def time_term(fn, env, iters, device):
+    fn(env)  # warm up
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(iters):
+        fn(env)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iters * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reward and termination term benchmark")
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--num_envs", type=int, nargs="+", default=[1, 64, 1024])
+    parser.add_argument("--iters", type=int, default=200)
+    parser.add_argument("--reference_iters", type=int, default=20, help="iterations of the pre-port references")
+    args = parser.parse_args()
+
+    if install_isaaclab_stand_ins():
+        print("[bench_region_checks] isaaclab not installed, using stand-ins for its imports")
+    terms = []
+    for module, names in TERMS.items():
+        for name in names:
+            fn = getattr(importlib.import_module(module), name)
+            label = f"{module.rsplit('.', 2)[1].replace('common_', '')}/{module.rsplit('.', 1)[1].replace('base_', '')}.{name}"
+            reference = REFERENCES.get(f"{module}.{name}")
+            terms.append((label, fn, reference(fn) if reference is not None else None))
+
+    print(f"[bench_region_checks] device: {args.device}, iters: {args.iters} (pre-port: {args.reference_iters}), "
+          f"torch {torch.__version__}")
+    width = max(len(label) for label, _, _ in terms) + len(" (pre-port)")
+    print(f"{'term':<{width}} " + " ".join(f"{f'{n} envs (us)':>15}" for n in args.num_envs) + f" {'speedup':>8}")
+    failed = []
+    mismatched = []
+    for label, fn, reference in terms:
+        line = f"{label:<{width}}"
+        reference_line = f"{label + ' (pre-port)':<{width}}"
+        term_us = reference_us = 0.0
+        for num_envs in args.num_envs:
+            env = mock_env(fn, num_envs, args.device)
+            result = fn(env)
+            if tuple(result.shape) != (num_envs,):
+                failed.append((label, num_envs, tuple(result.shape)))
+            term_us = time_term(fn, env, args.iters, args.device)
+            line += f" {term_us:>15.1f}"
+            if reference is not None:
+                if not torch.equal(result, reference(env)):
+                    mismatched.append((label, num_envs))
+                reference_us = time_term(reference, env, args.reference_iters, args.device)
+                reference_line += f" {reference_us:>15.1f}"
+        print(line)
+        if reference is not None:
+            # speedup at the largest num_envs
+            print(reference_line + f" {reference_us / term_us:>7.1f}x")
+    for label, num_envs, shape in failed:
+        print(f"[bench_region_checks] {label} returned shape {shape} for {num_envs} envs")
+    for label, num_envs in mismatched:
+        print(f"[bench_region_checks] {label} differs from its pre-port reference at {num_envs} envs")
+    if failed or mismatched:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Stand-ins for the benchmark harness (tools/bench_pipeline.py) on machines without the robot SDK or Isaac Lab
+
+install_unitree_sdk_stand_ins() registers minimal unitree_sdk2py modules when the SDK is not installed: the
+IDL message types of the DDS objects (LowState_, LowCmd_, HandState_, HandCmd_, MotorStates_, MotorCmds_,
+String_) with their default factories and the CRC helper. The messages have the fields and sizes of the SDK
+types and serialize with pickle instead of CDR, so they run over the loopback channels of dds/dds_base.py;
+core.channel is not provided, the DDS channel backend still needs the real SDK.
+
+install_isaaclab_buffer_stand_ins() registers isaaclab.utils.buffers.DelayBuffer when Isaac Lab is not
+installed, with the constant time lag of 0 the whole-body action provider uses.
+
+Both return False and change nothing when the real package can be imported.
+"""
+
+import sys
+import types
+import zlib
+import pickle
+import dataclasses
+from dataclasses import dataclass, field
+from typing import List
+
+
+def _zeros(size, value=0):
+    return field(default_factory=lambda: [value] * size)
+
+
+def _items(factory, size):
+    return field(default_factory=lambda: [factory() for _ in range(size)])
+
+
+class _StandInIdl:
+    """pickle serialization with the serialize()/deserialize() interface of the SDK IDL types"""
+
+    def serialize(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def deserialize(cls, data: bytes):
+        return pickle.loads(data)
+
+
+# unitree_hg
+@dataclass
+class HgMotorCmd_(_StandInIdl):
+    mode: int = 0
+    q: float = 0.0
+    dq: float = 0.0
+    tau: float = 0.0
+    kp: float = 0.0
+    kd: float = 0.0
+    reserve: int = 0
+
+
+@dataclass
+class HgMotorState_(_StandInIdl):
+    mode: int = 0
+    q: float = 0.0
+    dq: float = 0.0
+    ddq: float = 0.0
+    tau_est: float = 0.0
+    temperature: List[int] = _zeros(2)
+    vol: float = 0.0
+    sensor: List[int] = _zeros(2)
+    motorstate: int = 0
+    reserve: List[int] = _zeros(4)
+
+
+@dataclass
+class IMUState_(_StandInIdl):
+    quaternion: List[float] = _zeros(4, 0.0)
+    gyroscope: List[float] = _zeros(3, 0.0)
+    accelerometer: List[float] = _zeros(3, 0.0)
+    rpy: List[float] = _zeros(3, 0.0)
+    temperature: int = 0
+
+
+@dataclass
+class PressSensorState_(_StandInIdl):
+    pressure: List[float] = _zeros(12, 0.0)
+    temperature: List[float] = _zeros(12, 0.0)
+    lost: int = 0
+    reserve: int = 0
+
+
+@dataclass
+class LowCmd_(_StandInIdl):
+    mode_pr: int = 0
+    mode_machine: int = 0
+    motor_cmd: List[HgMotorCmd_] = _items(HgMotorCmd_, 35)
+    reserve: List[int] = _zeros(4)
+    crc: int = 0
+
+
+@dataclass
+class LowState_(_StandInIdl):
+    version: List[int] = _zeros(2)
+    mode_pr: int = 0
+    mode_machine: int = 0
+    tick: int = 0
+    imu_state: IMUState_ = field(default_factory=IMUState_)
+    motor_state: List[HgMotorState_] = _items(HgMotorState_, 35)
+    wireless_remote: List[int] = _zeros(40)
+    reserve: List[int] = _zeros(4)
+    crc: int = 0
+
+
+@dataclass
+class HandCmd_(_StandInIdl):
+    motor_cmd: List[HgMotorCmd_] = _items(HgMotorCmd_, 7)
+    reserve: List[int] = _zeros(4)
+
+
+@dataclass
+class HandState_(_StandInIdl):
+    motor_state: List[HgMotorState_] = _items(HgMotorState_, 7)
+    press_sensor_state: List[PressSensorState_] = _items(PressSensorState_, 7)
+    imu_state: IMUState_ = field(default_factory=IMUState_)
+    power_v: float = 0.0
+    power_a: float = 0.0
+    system_v: float = 0.0
+    device_v: float = 0.0
+    error: List[int] = _zeros(2)
+    reserve: List[int] = _zeros(2)
+
+
+# unitree_go
+@dataclass
+class GoMotorCmd_(_StandInIdl):
+    mode: int = 0
+    q: float = 0.0
+    dq: float = 0.0
+    tau: float = 0.0
+    kp: float = 0.0
+    kd: float = 0.0
+    reserve: List[int] = _zeros(3)
+
+
+@dataclass
+class GoMotorState_(_StandInIdl):
+    mode: int = 0
+    q: float = 0.0
+    dq: float = 0.0
+    ddq: float = 0.0
+    tau_est: float = 0.0
+    q_raw: float = 0.0
+    dq_raw: float = 0.0
+    ddq_raw: float = 0.0
+    temperature: int = 0
+    lost: int = 0
+    reserve: List[int] = _zeros(2)
+
+
+@dataclass
+class MotorCmds_(_StandInIdl):
+    cmds: List[GoMotorCmd_] = field(default_factory=list)
+
+
+@dataclass
+class MotorStates_(_StandInIdl):
+    states: List[GoMotorState_] = field(default_factory=list)
+
+
+# std_msgs
+@dataclass
+class String_(_StandInIdl):
+    data: str = ""
+
+
+class CRC:
+    """CRC32 of the message fields before its crc field (the SDK packs them into its wire layout first)"""
+
+    def Crc(self, msg) -> int:
+        fields = dataclasses.astuple(msg)[:-1]
+        return zlib.crc32(pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _register(modules):
+    for name, module in modules.items():
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(modules[parent], child, module)
+    sys.modules.update(modules)
+
+
+def install_unitree_sdk_stand_ins() -> bool:
+    """Register the stand-in unitree_sdk2py IDL modules if the SDK is not installed
+
+    Returns:
+        bool: True if the stand-ins were installed
+    """
+    try:
+        import unitree_sdk2py.idl  # noqa: F401
+        return False
+    except ImportError:
+        pass
+    names = ["unitree_sdk2py", "unitree_sdk2py.idl", "unitree_sdk2py.idl.default", "unitree_sdk2py.utils",
+             "unitree_sdk2py.utils.crc"]
+    for package in ("std_msgs", "unitree_hg", "unitree_go"):
+        names += [f"unitree_sdk2py.idl.{package}", f"unitree_sdk2py.idl.{package}.msg",
+                  f"unitree_sdk2py.idl.{package}.msg.dds_"]
+    modules = {name: types.ModuleType(name) for name in names}
+
+    hg = modules["unitree_sdk2py.idl.unitree_hg.msg.dds_"]
+    for cls in (LowCmd_, LowState_, HandCmd_, HandState_, IMUState_, PressSensorState_):
+        setattr(hg, cls.__name__, cls)
+    hg.MotorCmd_, hg.MotorState_ = HgMotorCmd_, HgMotorState_
+    go = modules["unitree_sdk2py.idl.unitree_go.msg.dds_"]
+    go.MotorCmds_, go.MotorStates_, go.MotorCmd_, go.MotorState_ = MotorCmds_, MotorStates_, GoMotorCmd_, GoMotorState_
+    modules["unitree_sdk2py.idl.std_msgs.msg.dds_"].String_ = String_
+    default = modules["unitree_sdk2py.idl.default"]
+    default.unitree_hg_msg_dds__LowCmd_ = LowCmd_
+    default.unitree_hg_msg_dds__LowState_ = LowState_
+    default.unitree_hg_msg_dds__HandCmd_ = HandCmd_
+    default.unitree_hg_msg_dds__HandState_ = HandState_
+    default.unitree_go_msg_dds__MotorCmd_ = GoMotorCmd_
+    default.unitree_go_msg_dds__MotorState_ = GoMotorState_
+    default.std_msgs_msg_dds__String_ = String_
+    modules["unitree_sdk2py.utils.crc"].CRC = CRC
+    _register(modules)
+    return True
+
+
+class DelayBuffer:
+    """isaaclab.utils.buffers.DelayBuffer with a constant time lag of 0 (the default of the Isaac Lab buffer)
+
+    Keeps the last history_length + 1 pushes in a ring and returns the push of the current time lag.
+    """
+
+    def __init__(self, history_length: int, batch_size: int, device: str):
+        self._history_length = max(0, history_length)
+        self._batch_size = batch_size
+        self._device = device
+        self._buffer = None
+        self._pointer = -1
+
+    @property
+    def history_length(self) -> int:
+        return self._history_length
+
+    def set_time_lag(self, time_lag, batch_ids=None):
+        if int(time_lag) != 0:
+            raise NotImplementedError("the stand-in DelayBuffer only supports a time lag of 0")
+
+    def reset(self, batch_ids=None):
+        self._buffer = None
+        self._pointer = -1
+
+    def compute(self, data):
+        import torch
+        if self._buffer is None:
+            self._buffer = torch.empty((self._history_length + 1, *data.shape), dtype=data.dtype, device=self._device)
+            self._buffer[:] = data
+        self._pointer = (self._pointer + 1) % (self._history_length + 1)
+        self._buffer[self._pointer] = data
+        return self._buffer[self._pointer].clone()
+
+
+def install_isaaclab_buffer_stand_ins() -> bool:
+    """Register a stand-in isaaclab.utils.buffers.DelayBuffer if Isaac Lab is not installed
+
+    Returns:
+        bool: True if the stand-in was installed
+    """
+    try:
+        import isaaclab.utils.buffers  # noqa: F401
+        return False
+    except ImportError:
+        pass
+    modules = {name: sys.modules.get(name) or types.ModuleType(name)
+               for name in ("isaaclab", "isaaclab.utils", "isaaclab.utils.buffers")}
+    modules["isaaclab.utils.buffers"].DelayBuffer = DelayBuffer
+    _register(modules)
+    return True
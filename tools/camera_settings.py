@@ -0,0 +1,138 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Camera stream settings
+The resolution and depth enablement of the streamed cameras (head, left wrist, right wrist), configured in one
+place and followed by the camera configs (CameraPresets), the image shared memory sizing, the image server
+and the episode writer.
+
+Like the sim instance (tools/sim_instance.py) the settings live in environment variables, set by sim_main.py
+from --camera_resolution and --camera_depth before the task configs are imported, so every module and helper
+process sees the same values:
+
+    SIM_CAMERA_RESOLUTION   "640x480" for every camera, per camera overrides after it: "320x240,head=640x480"
+    SIM_CAMERA_DEPTH        "none" (default), "all" or a list of cameras: "head,left"
+
+The streamed images are concatenated horizontally, so all cameras must have the same height.
+Depth is streamed as uint16 in millimetres (DEPTH_SCALE), 0 where there is no valid depth.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+CAMERA_RESOLUTION_ENV = "SIM_CAMERA_RESOLUTION"
+CAMERA_DEPTH_ENV = "SIM_CAMERA_DEPTH"
+
+# streamed cameras in shared memory order, and their scene entity names
+CAMERA_ROLES = ("head", "left", "right")
+SCENE_CAMERAS = {"head": "front_camera", "left": "left_wrist_camera", "right": "right_wrist_camera"}
+
+DEFAULT_RESOLUTION = (640, 480)
+# depth in metres * DEPTH_SCALE = uint16 depth (millimetres)
+DEPTH_SCALE = 1000.0
+DEPTH_MAX = 65535
+
+
+@dataclass(frozen=True)
+class CameraStreamCfg:
+    """resolution and depth enablement of one streamed camera"""
+    width: int
+    height: int
+    depth: bool = False
+
+    @property
+    def color_bytes(self) -> int:
+        return self.width * self.height * 3
+
+    @property
+    def depth_bytes(self) -> int:
+        return self.width * self.height * 2 if self.depth else 0
+
+
+def parse_resolution(text: str) -> Tuple[int, int]:
+    """"640x480" -> (640, 480)"""
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"camera resolution must be WIDTHxHEIGHT, got {text}")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"camera resolution must be positive, got {text}")
+    return width, height
+
+
+def _parse_resolutions(text: str) -> Dict[str, Tuple[int, int]]:
+    resolutions = {role: DEFAULT_RESOLUTION for role in CAMERA_ROLES}
+    for part in filter(None, (part.strip() for part in text.split(","))):
+        role, sep, value = part.partition("=")
+        if not sep:
+            resolutions = {role: parse_resolution(part) for role in CAMERA_ROLES}
+            continue
+        if role not in CAMERA_ROLES:
+            raise ValueError(f"unknown camera {role}, use one of {CAMERA_ROLES}")
+        resolutions[role] = parse_resolution(value)
+    return resolutions
+
+
+def _parse_depth(text: str) -> Tuple[str, ...]:
+    text = text.strip().lower()
+    if text in ("", "none", "off"):
+        return ()
+    if text in ("all", "on"):
+        return CAMERA_ROLES
+    roles = tuple(part.strip() for part in text.split(",") if part.strip())
+    unknown = [role for role in roles if role not in CAMERA_ROLES]
+    if unknown:
+        raise ValueError(f"unknown cameras {unknown}, use all, none or some of {CAMERA_ROLES}")
+    return roles
+
+
+def set_camera_settings(resolution: str = None, depth: str = None):
+    """Select the camera stream settings for this process and its children
+
+    Args:
+        resolution: "WIDTHxHEIGHT" with optional "role=WIDTHxHEIGHT" overrides, None to keep the current value
+        depth: "none", "all" or comma separated camera roles, None to keep the current value
+    """
+    previous = {name: os.environ.get(name) for name in (CAMERA_RESOLUTION_ENV, CAMERA_DEPTH_ENV)}
+    if resolution is not None:
+        os.environ[CAMERA_RESOLUTION_ENV] = resolution
+    if depth is not None:
+        os.environ[CAMERA_DEPTH_ENV] = depth
+    try:
+        get_camera_settings()
+    except ValueError:
+        # keep the previous valid settings
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        raise
+
+
+def get_camera_settings() -> Dict[str, CameraStreamCfg]:
+    """The settings of every streamed camera, in shared memory order"""
+    resolutions = _parse_resolutions(os.environ.get(CAMERA_RESOLUTION_ENV, ""))
+    depth_roles = _parse_depth(os.environ.get(CAMERA_DEPTH_ENV, ""))
+    settings = {role: CameraStreamCfg(*resolutions[role], depth=role in depth_roles) for role in CAMERA_ROLES}
+    heights = {cfg.height for cfg in settings.values()}
+    if len(heights) > 1:
+        raise ValueError(f"streamed cameras are concatenated horizontally and need the same height, got {settings}")
+    return settings
+
+
+def get_camera_stream_cfg(role: str) -> CameraStreamCfg:
+    return get_camera_settings()[role]
+
+
+def image_shm_size(settings: Dict[str, CameraStreamCfg] = None, header_reserve: int = 1024) -> int:
+    """Size of the image shared memory for the settings: color and depth of every camera plus the header"""
+    settings = settings or get_camera_settings()
+    return sum(cfg.color_bytes + cfg.depth_bytes for cfg in settings.values()) + header_reserve
+
+
+def describe_camera_settings() -> str:
+    """One-line summary for startup logs"""
+    return ", ".join(f"{role} {cfg.width}x{cfg.height}{' +depth' if cfg.depth else ''}"
+                     for role, cfg in get_camera_settings().items())
@@ -0,0 +1,212 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+URDF to USD conversion cache
+Converted USDs are stored in a content-addressed directory, keyed by a hash of the URDF file, every mesh it
+references and the importer options. A conversion with the same key is skipped and the cached USD is used.
+
+    <cache_dir>/<key[:2]>/<key>/<name>.usd
+    <cache_dir>/<key[:2]>/<key>/configuration/...
+    <cache_dir>/<key[:2]>/<key>/entry.json        written last, marks the entry as complete
+
+The converter is passed in as a function, so this module does not import Isaac Sim and can be used (and
+tested) without it; tools/convert_urdf.py passes the Isaac Lab UrdfConverter.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional, Tuple
+
+# bump when the layout or the conversion changes in a way that invalidates cached entries
+CACHE_VERSION = 1
+ENTRY_NAME = "entry.json"
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class ImporterOptions:
+    """The URDF importer options that change the converted USD"""
+    merge_joints: bool = False
+    fix_base: bool = False
+    joint_stiffness: float = 100.0
+    joint_damping: float = 1.0
+    joint_target_type: str = "position"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _resolve_mesh(urdf_dir: str, filename: str) -> str:
+    """resolve a mesh filename of a URDF: relative, absolute, file:// or package://<pkg>/..."""
+    if filename.startswith("file://"):
+        filename = filename[len("file://"):]
+    if filename.startswith("package://"):
+        # the package root is not known without ROS, look for the path below the URDF directory and its parents
+        relative = filename[len("package://"):].split("/", 1)[-1]
+        directory = urdf_dir
+        while True:
+            candidate = os.path.join(directory, relative)
+            if os.path.exists(candidate):
+                return candidate
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return os.path.join(urdf_dir, relative)
+            directory = parent
+    if os.path.isabs(filename):
+        return filename
+    return os.path.normpath(os.path.join(urdf_dir, filename))
+
+
+def urdf_mesh_paths(urdf_path: str) -> List[Tuple[str, str]]:
+    """The meshes referenced by a URDF
+
+    Returns:
+        sorted (filename as written in the URDF, resolved path) pairs, without duplicates
+    """
+    urdf_dir = os.path.dirname(os.path.abspath(urdf_path))
+    meshes = {}
+    for _, element in ET.iterparse(urdf_path):
+        if element.tag == "mesh" and element.get("filename"):
+            filename = element.get("filename")
+            meshes[filename] = _resolve_mesh(urdf_dir, filename)
+        element.clear()
+    return sorted(meshes.items())
+
+
+def conversion_key(urdf_path: str, options: ImporterOptions, usd_file_name: str) -> str:
+    """Hash of the URDF, its meshes, the importer options and the output file name"""
+    digest = hashlib.sha256()
+    header = {"version": CACHE_VERSION, "options": options.to_dict(), "usd_file_name": usd_file_name}
+    digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    digest.update(file_digest(urdf_path).encode("utf-8"))
+    for filename, path in urdf_mesh_paths(urdf_path):
+        # a missing mesh is part of the key too, the entry is rebuilt once it appears
+        mesh_digest = file_digest(path) if os.path.isfile(path) else "missing"
+        digest.update(f"{filename}\0{mesh_digest}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def default_usd_file_name(urdf_path: str) -> str:
+    return os.path.splitext(os.path.basename(urdf_path))[0] + ".usd"
+
+
+class ConversionCache:
+    """Content-addressed directory of converted USDs"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = os.path.abspath(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """The cached USD path of a key, None on a miss or an incomplete entry"""
+        entry_path = os.path.join(self.entry_dir(key), ENTRY_NAME)
+        if not os.path.isfile(entry_path):
+            return None
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        usd_path = os.path.join(self.entry_dir(key), entry["usd_file_name"])
+        return usd_path if os.path.isfile(usd_path) else None
+
+    def staging_dir(self) -> str:
+        """A new directory to convert into, on the same file system as the cache"""
+        return tempfile.mkdtemp(prefix=".staging_", dir=self.cache_dir)
+
+    def commit(self, key: str, staging_dir: str, entry: dict) -> str:
+        """Move a finished conversion into the cache
+
+        Args:
+            key: the conversion key
+            staging_dir: the directory the conversion was written to (removed afterwards)
+            entry: metadata of the conversion, must contain "usd_file_name"
+
+        Returns:
+            the cached USD path
+        """
+        with open(os.path.join(staging_dir, ENTRY_NAME), "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        target = self.entry_dir(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.rename(staging_dir, target)
+        except OSError:
+            # another process committed the same key first (or left an incomplete entry behind)
+            if self.lookup(key) is None:
+                shutil.rmtree(target, ignore_errors=True)
+                os.rename(staging_dir, target)
+            else:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+        return os.path.join(target, entry["usd_file_name"])
+
+    def export(self, key: str, output_path: str):
+        """Copy a cached entry next to output_path (the USD and its configuration files)"""
+        entry_dir = self.entry_dir(key)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        shutil.copytree(entry_dir, output_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns(ENTRY_NAME))
+
+
+# convert_fn(urdf_path, usd_dir, usd_file_name, options) -> path of the written USD
+ConvertFn = Callable[[str, str, str, ImporterOptions], str]
+
+
+def convert_cached(urdf_path: str, options: ImporterOptions, cache: ConversionCache, convert_fn: ConvertFn,
+                   usd_file_name: Optional[str] = None, force: bool = False) -> Tuple[str, bool]:
+    """Convert a URDF through the cache
+
+    Args:
+        urdf_path: the URDF file
+        options: the importer options
+        cache: the conversion cache
+        convert_fn: the converter, only called on a miss
+        usd_file_name: name of the USD file, default <urdf name>.usd
+        force: convert even on a hit and replace the entry
+
+    Returns:
+        (cached USD path, True on a cache hit)
+    """
+    urdf_path = os.path.abspath(urdf_path)
+    usd_file_name = usd_file_name or default_usd_file_name(urdf_path)
+    key = conversion_key(urdf_path, options, usd_file_name)
+    if not force:
+        usd_path = cache.lookup(key)
+        if usd_path is not None:
+            return usd_path, True
+    else:
+        shutil.rmtree(cache.entry_dir(key), ignore_errors=True)
+    staging = cache.staging_dir()
+    try:
+        convert_fn(urdf_path, staging, usd_file_name, options)
+        if not os.path.isfile(os.path.join(staging, usd_file_name)):
+            raise RuntimeError(f"the converter did not write {usd_file_name}")
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    entry = {"key": key, "urdf": urdf_path, "usd_file_name": usd_file_name, "options": options.to_dict()}
+    return cache.commit(key, staging, entry), False
+
+
+def find_urdfs(root: str) -> List[str]:
+    """Every .urdf file below a directory"""
+    urdfs = []
+    for directory, _, files in os.walk(root):
+        urdfs.extend(os.path.join(directory, name) for name in files if name.endswith(".urdf"))
+    return sorted(urdfs)
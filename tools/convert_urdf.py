@@ -15,7 +15,7 @@ https://docs.isaacsim.omniverse.nvidia.com/latest/robot_setup/ext_isaacsim_asset
 
 参数说明:
   input               输入URDF文件的路径
-  output              输出USD文件的存储路径
+  --output            输出USD文件的路径(从缓存复制USD及其configuration目录)
 
 可选参数:
   -h, --help          显示帮助信息
@@ -24,18 +24,42 @@ https://docs.isaacsim.omniverse.nvidia.com/latest/robot_setup/ext_isaacsim_asset
   --joint-stiffness   关节驱动的刚度 (默认: 100.0)
   --joint-damping     关节驱动的阻尼 (默认: 1.0)
   --joint-target-type 关节驱动的控制类型 (默认: "position")
+  --cache-dir         转换缓存目录 (默认: $URDF_CACHE_DIR 或 ~/.cache/unitree_sim_isaaclab/urdf_usd)
+  --force             忽略缓存重新转换
+  --batch-dir         批量转换目录下的所有URDF (例如 assets_)，每个URDF在单独的进程中并行转换
+  --workers           批量转换的并行进程数 (默认: 2)
+
+转换结果按URDF文件、引用的mesh和导入参数的哈希缓存(见 tools/conversion_cache.py)，命中缓存时不启动Isaac Sim。
+
+用法:
+  python tools/convert_urdf.py robot.urdf --output ./usd/robot.usd --headless
+  python tools/convert_urdf.py --batch-dir assets_ --workers 4
 """
 
 """首先启动Isaac Sim模拟器"""
 
 import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from isaaclab.app import AppLauncher
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.conversion_cache import (
+    ConversionCache,
+    ImporterOptions,
+    conversion_key,
+    convert_cached,
+    default_usd_file_name,
+    find_urdfs,
+)
+
 # 添加命令行参数解析
 parser = argparse.ArgumentParser(description="URDF转USD格式的工具")
-# parser.add_argument("input", type=str, default="/home/unitree/newDisk/URDF/urdf-to-usd/g1withdex1/g1_29dof_with_dex1_rev_1_0.urdf", help="输入URDF文件的路径")
-# parser.add_argument("output", type=str, default="/home/unitree/Code/isaaclab_demo/usd/g1_body29_hand14.usd", help="输出USD文件的路径")
+parser.add_argument("input", type=str, nargs="?", default=None, help="输入URDF文件的路径")
+parser.add_argument("--output", type=str, default=None, help="输出USD文件的路径")
 parser.add_argument(
     "--merge-joints",
     action="store_true",
@@ -62,12 +86,97 @@ parser.add_argument(
     choices=["position", "velocity", "none"],
     help="关节驱动的控制类型",
 )
+parser.add_argument(
+    "--cache-dir",
+    type=str,
+    default=os.environ.get("URDF_CACHE_DIR", os.path.expanduser("~/.cache/unitree_sim_isaaclab/urdf_usd")),
+    help="转换缓存目录",
+)
+parser.add_argument("--force", action="store_true", default=False, help="忽略缓存重新转换")
+parser.add_argument("--batch-dir", type=str, default=None, help="批量转换目录下的所有URDF")
+parser.add_argument("--workers", type=int, default=2, help="批量转换的并行进程数")
 
 # 添加AppLauncher的命令行参数
 AppLauncher.add_app_launcher_args(parser)
 # 解析命令行参数
 args_cli = parser.parse_args()
 
+
+def importer_options() -> ImporterOptions:
+    return ImporterOptions(
+        merge_joints=args_cli.merge_joints,
+        fix_base=args_cli.fix_base,
+        joint_stiffness=args_cli.joint_stiffness,
+        joint_damping=args_cli.joint_damping,
+        joint_target_type=args_cli.joint_target_type,
+    )
+
+
+def run_batch() -> int:
+    """并行转换目录下所有未命中缓存的URDF，每个URDF一个子进程(每个进程启动自己的Isaac Sim)"""
+    cache = ConversionCache(args_cli.cache_dir)
+    options = importer_options()
+    urdfs = find_urdfs(args_cli.batch_dir)
+    pending = []
+    for urdf_path in urdfs:
+        key = conversion_key(urdf_path, options, default_usd_file_name(urdf_path))
+        usd_path = None if args_cli.force else cache.lookup(key)
+        if usd_path is None:
+            pending.append(urdf_path)
+        else:
+            print(f"[convert_urdf] 缓存命中: {urdf_path} -> {usd_path}")
+    print(f"[convert_urdf] {len(urdfs)} 个URDF, {len(urdfs) - len(pending)} 个命中缓存, {len(pending)} 个需要转换")
+
+    def convert_one(urdf_path):
+        command = [
+            sys.executable, os.path.abspath(__file__), urdf_path,
+            "--cache-dir", args_cli.cache_dir,
+            "--joint-stiffness", str(args_cli.joint_stiffness),
+            "--joint-damping", str(args_cli.joint_damping),
+            "--joint-target-type", args_cli.joint_target_type,
+            "--headless",
+        ]
+        if args_cli.merge_joints:
+            command.append("--merge-joints")
+        if args_cli.fix_base:
+            command.append("--fix-base")
+        if args_cli.force:
+            command.append("--force")
+        return urdf_path, subprocess.run(command).returncode
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args_cli.workers)) as executor:
+        for urdf_path, returncode in executor.map(convert_one, pending):
+            if returncode != 0:
+                failed += 1
+                print(f"[convert_urdf] ❌ 转换失败: {urdf_path} (返回码 {returncode})")
+    return 1 if failed else 0
+
+
+def cached_usd_path():
+    """命中缓存时返回 (USD路径, 缓存key)，不需要启动Isaac Sim"""
+    urdf_path = os.path.abspath(args_cli.input)
+    if not os.path.isfile(urdf_path):
+        raise ValueError(f"无效的文件路径: {urdf_path}")
+    usd_file_name = os.path.basename(args_cli.output) if args_cli.output else default_usd_file_name(urdf_path)
+    key = conversion_key(urdf_path, importer_options(), usd_file_name)
+    if args_cli.force:
+        return None, key
+    return ConversionCache(args_cli.cache_dir).lookup(key), key
+
+
+if args_cli.batch_dir is not None:
+    sys.exit(run_batch())
+if args_cli.input is None:
+    parser.error("需要输入URDF文件或 --batch-dir")
+_cached_usd, _cache_key = cached_usd_path()
+if _cached_usd is not None:
+    print(f"[convert_urdf] 缓存命中: {_cached_usd}")
+    if args_cli.output:
+        ConversionCache(args_cli.cache_dir).export(_cache_key, args_cli.output)
+        print(f"[convert_urdf] 已复制到: {os.path.abspath(args_cli.output)}")
+    sys.exit(0)
+
 # 启动omniverse应用
 app_launcher = AppLauncher(args_cli)
 simulation_app = app_launcher.app
@@ -75,7 +184,6 @@ simulation_app = app_launcher.app
 """以下是主要功能实现"""
 
 import contextlib
-import os
 
 import carb
 import isaacsim.core.utils.stage as stage_utils
@@ -86,34 +194,21 @@ from isaaclab.utils.assets import check_file_path
 from isaaclab.utils.dict import print_dict
 
 
-def main():
-    # 检查输入文件路径是否有效
-    urdf_path = "/home/unitree/newDisk/URDF/urdf-to-usd/g1withinspire_hand/g1_29dof_with_inpire_rev_1_0.urdf" #args_cli.input
-    print(urdf_path)
-    if not os.path.isabs(urdf_path):
-        urdf_path = os.path.abspath(urdf_path)
-    if not check_file_path(urdf_path):
-        raise ValueError(f"无效的文件路径: {urdf_path}")
-    
-    # 创建输出文件路径
-    dest_path = "/home/unitree/newDisk/URDF/wholevody_with_inspire/g1_29dof_with_inspire_rev_1_0.usd"
-    if not os.path.isabs(dest_path):
-        dest_path = os.path.abspath(dest_path)
-
-    # 创建URDF转换器配置
+def isaac_convert(urdf_path, usd_dir, usd_file_name, options):
+    """使用Isaac Lab的URDF转换器将URDF转换到 usd_dir/usd_file_name"""
     urdf_converter_cfg = UrdfConverterCfg(
         asset_path=urdf_path,
-        usd_dir=os.path.dirname(dest_path),
-        usd_file_name=os.path.basename(dest_path),
-        fix_base=args_cli.fix_base,
-        merge_fixed_joints=args_cli.merge_joints,
+        usd_dir=usd_dir,
+        usd_file_name=usd_file_name,
+        fix_base=options.fix_base,
+        merge_fixed_joints=options.merge_joints,
         force_usd_conversion=True,
         joint_drive=UrdfConverterCfg.JointDriveCfg(
             gains=UrdfConverterCfg.JointDriveCfg.PDGainsCfg(
-                stiffness=args_cli.joint_stiffness,
-                damping=args_cli.joint_damping,
+                stiffness=options.joint_stiffness,
+                damping=options.joint_damping,
             ),
-            target_type=args_cli.joint_target_type,
+            target_type=options.joint_target_type,
         ),
     )
 
@@ -128,9 +223,26 @@ def main():
 
     # 创建URDF转换器并导入文件
     urdf_converter = UrdfConverter(urdf_converter_cfg)
+    return urdf_converter.usd_path
+
+
+def main():
+    # 检查输入文件路径是否有效
+    urdf_path = os.path.abspath(args_cli.input)
+    if not check_file_path(urdf_path):
+        raise ValueError(f"无效的文件路径: {urdf_path}")
+    usd_file_name = os.path.basename(args_cli.output) if args_cli.output else None
+
+    cache = ConversionCache(args_cli.cache_dir)
+    usd_path, _ = convert_cached(urdf_path, importer_options(), cache, isaac_convert,
+                                 usd_file_name=usd_file_name, force=args_cli.force)
     # 打印输出信息
     print("URDF导入器输出:")
-    print(f"生成的USD文件: {urdf_converter.usd_path}")
+    print(f"生成的USD文件(缓存): {usd_path}")
+    if args_cli.output:
+        cache.export(os.path.basename(os.path.dirname(usd_path)), args_cli.output)
+        usd_path = os.path.abspath(args_cli.output)
+        print(f"已复制到: {usd_path}")
     print("-" * 80)
     print("-" * 80)
 
@@ -145,7 +257,7 @@ def main():
     # 如果启用了GUI，则运行模拟场景
     if local_gui or livestream_gui:
         # 打开USD场景
-        stage_utils.open_stage(urdf_converter.usd_path)
+        stage_utils.open_stage(usd_path)
         # 重新初始化模拟
         app = omni.kit.app.get_app_interface()
         # 运行模拟
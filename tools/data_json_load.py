@@ -3,6 +3,7 @@ import numpy as np
 import torch
 import re
 from pathlib import Path
+from tools.dataset_manifest import DatasetManifest
 def convert_nested_lists_to_tensor(obj):
     """
     递归遍历 obj，把所有形如 list[list[float]] 的结构转为 torch.tensor。
@@ -176,7 +177,19 @@ def get_data_json_list(file_path):
         else:
             raise ValueError("file is error")
     elif file_path.is_dir():
-        data_json_list = get_file_path(file_path)
+        # 优先读取数据集索引，避免遍历整个目录树
+        # Prefer the dataset manifest over walking the whole tree
+        manifest = DatasetManifest(file_path)
+        if not manifest.exists():
+            try:
+                print(f"dataset manifest not found, indexing {file_path} once")
+                manifest.build()
+            except Exception as e:
+                print(f"failed to write dataset manifest: {e}")
+        if manifest.exists():
+            data_json_list = manifest.json_paths()
+        else:
+            data_json_list = get_file_path(file_path)
 
     # 按照episode_后面的数字排序
     def extract_episode_number(path):
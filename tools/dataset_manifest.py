@@ -0,0 +1,164 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Dataset manifest
+A compact index of the episodes of a dataset directory, stored as "manifest.jsonl" in its root.
+Every line describes one episode (a later line for the same episode replaces the earlier one):
+
+    {"path": "episode_0012", "episode_id": 12, "task_name": "...", "frames": 300, "duration": 10.0, "success": null}
+
+EpisodeWriter appends a line whenever an episode is saved and replay reads the episode list from it,
+so neither has to walk the dataset tree. Datasets recorded without a manifest are indexed once on first use.
+
+Usage:
+    python tools/dataset_manifest.py <dataset_dir> [--details]
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.jsonl"
+EPISODE_JSON = "data.json"
+
+
+def episode_number(path) -> float:
+    """The number after "episode_" in a path, inf if there is none"""
+    match = re.search(r'episode_(\d+)', str(path))
+    return int(match.group(1)) if match else float('inf')
+
+
+def _episode_id(path):
+    number = episode_number(path)
+    return None if number == float('inf') else number
+
+
+class DatasetManifest:
+    """Read and append the manifest of one dataset directory"""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = str(root_dir)
+        self.manifest_path = os.path.join(self.root_dir, MANIFEST_NAME)
+        self.entries = {}
+        if self.exists():
+            self.load()
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.manifest_path)
+
+    def load(self):
+        """Load the manifest, skipping a torn last line"""
+        self.entries = {}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[entry["path"]] = entry
+
+    def add_episode(self, episode_dir: str, task_name: str = None, frames: int = None,
+                    duration: float = None, success: bool = None, **extra):
+        """Append or replace the entry of one episode
+
+        Args:
+            episode_dir: the episode directory, absolute or relative to the dataset root
+            task_name: the task the episode was recorded in
+            frames: the number of items in the episode
+            duration: the episode duration in seconds
+            success: whether the episode reached the task goal, None if unknown
+        """
+        rel_path = os.path.relpath(episode_dir, self.root_dir) if os.path.isabs(episode_dir) else episode_dir
+        entry = {
+            "path": rel_path,
+            "episode_id": _episode_id(rel_path),
+            "task_name": task_name,
+            "frames": frames,
+            "duration": duration,
+            "success": success,
+        }
+        entry.update(extra)
+        with open(self.manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[rel_path] = entry
+        return entry
+
+    def last_episode_id(self) -> int:
+        """The highest episode id in the manifest, -1 if it is empty"""
+        ids = [entry["episode_id"] for entry in self.entries.values() if entry.get("episode_id") is not None]
+        return max(ids) if ids else -1
+
+    def json_paths(self, task_name: str = None):
+        """The data.json paths of the indexed episodes sorted by episode number
+
+        Args:
+            task_name: only return episodes of this task (episodes without a task name are kept)
+        """
+        entries = sorted(self.entries.values(), key=lambda entry: episode_number(entry["path"]))
+        return [os.path.join(self.root_dir, entry["path"], EPISODE_JSON) for entry in entries
+                if task_name is None or entry.get("task_name") in (None, task_name)]
+
+    def build(self, details: bool = False) -> int:
+        """Index an existing dataset by walking its tree once
+
+        Args:
+            details: read every data.json for task name, frame count and duration (slow on large datasets)
+
+        Returns:
+            the number of indexed episodes
+        """
+        json_paths = sorted(Path(self.root_dir).glob(f"**/{EPISODE_JSON}"), key=episode_number)
+        lines = []
+        self.entries = {}
+        for json_path in json_paths:
+            rel_path = os.path.relpath(json_path.parent, self.root_dir)
+            entry = {"path": rel_path,
+                     "episode_id": _episode_id(rel_path),
+                     "task_name": None, "frames": None, "duration": None, "success": None}
+            if details:
+                entry.update(read_episode_summary(str(json_path)))
+            self.entries[rel_path] = entry
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.manifest_path)
+        return len(lines)
+
+
+def read_episode_summary(json_path: str) -> dict:
+    """Read task name, frame count, duration and success of one data.json"""
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except Exception as e:
+        print(f"[DatasetManifest] failed to read {json_path}: {e}")
+        return {}
+    info = content.get("info", {})
+    data = content.get("data", [])
+    task_name = None
+    if data and isinstance(data[0].get("sim_state"), dict):
+        task_name = data[0]["sim_state"].get("task_name")
+    fps = info.get("image", {}).get("fps") or 30
+    return {
+        "task_name": task_name,
+        "frames": len(data),
+        "duration": len(data) / fps,
+        "success": info.get("success"),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Build the manifest of a dataset directory")
+    parser.add_argument("dataset_dir", type=str, help="dataset root directory")
+    parser.add_argument("--details", action="store_true", default=False, help="read every data.json for task name, frames and duration")
+    args = parser.parse_args()
+    manifest = DatasetManifest(args.dataset_dir)
+    count = manifest.build(details=args.details)
+    print(f"[DatasetManifest] indexed {count} episodes into {manifest.manifest_path}")
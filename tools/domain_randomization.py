@@ -0,0 +1,179 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Per-episode domain randomization
+Light, camera and material attributes are sampled once per episode from declared distributions. The stage
+is traversed once when the randomizer is created: the matched prims are resolved, their attributes are
+looked up and the attribute specs on the edit target layer are cached, so an episode only samples the
+values and writes them to the cached specs inside one Sdf.ChangeBlock (one change notification instead of
+one per attribute).
+
+Every episode gets its own seed, derived from the base seed and the episode key (e.g. the source episode
+file), and the seed and the sampled values are returned for the episode metadata, so a regenerated dataset
+can be reproduced with the same base seed.
+
+The distributions are a JSON file:
+
+    {
+        "lights":    [{"match": "light", "attributes": {"intensity": {"uniform": [300.0, 1200.0]},
+                                                        "color": {"uniform": [[0.7, 0.7, 0.7], [1.0, 1.0, 1.0]]}}}],
+        "cameras":   [{"match": "front_cam", "attributes": {"exposure": {"normal": [0.0, 0.3]}}}],
+        "materials": [{"match": "table", "attributes": {"inputs:diffuse_tint": {"choice": [[1, 1, 1], [0.8, 0.7, 0.6]]}}}]
+    }
+
+"match" is a substring of the prim name (lights and cameras) or of the material name (the shaders under the
+material are randomized). Attribute names are USD attribute names; light attributes are also looked up with
+the "inputs:" prefix of newer USD versions. A distribution is {"uniform": [low, high]}, {"normal": [mean, std]},
+{"choice": [values]} or {"constant": value}; low/high/mean/std can be lists for vector attributes.
+"""
+
+import os
+import json
+import random
+import zlib
+from typing import Any, Dict, List, Optional
+
+from pxr import Sdf, UsdGeom, UsdShade
+import omni.usd
+
+
+def _sample(rng: random.Random, dist: Dict[str, Any]):
+    """sample one value of a declared distribution"""
+    if "uniform" in dist:
+        low, high = dist["uniform"]
+        if isinstance(low, (list, tuple)):
+            return [rng.uniform(lo, hi) for lo, hi in zip(low, high)]
+        return rng.uniform(low, high)
+    if "normal" in dist:
+        mean, std = dist["normal"]
+        if isinstance(mean, (list, tuple)):
+            stds = std if isinstance(std, (list, tuple)) else [std] * len(mean)
+            return [rng.gauss(m, s) for m, s in zip(mean, stds)]
+        return rng.gauss(mean, std)
+    if "choice" in dist:
+        return rng.choice(dist["choice"])
+    if "constant" in dist:
+        return dist["constant"]
+    raise ValueError(f"unknown distribution: {dist}")
+
+
+def episode_seed(base_seed: int, key: str) -> int:
+    """the seed of one episode, stable across runs for the same base seed and episode key"""
+    return zlib.crc32(f"{base_seed}:{key}".encode("utf-8"))
+
+
+def load_randomization_config(path: str) -> Dict[str, List[dict]]:
+    """Load the declared distributions from a JSON file"""
+    if not os.path.isfile(path):
+        raise ValueError(f"domain randomization config not found: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    unknown = set(config) - {"lights", "cameras", "materials"}
+    if unknown:
+        raise ValueError(f"unknown domain randomization groups: {sorted(unknown)}")
+    return config
+
+
+def _is_light(prim) -> bool:
+    return prim.GetTypeName().endswith("Light")
+
+
+class _Target:
+    """one cached attribute spec and its distribution"""
+
+    def __init__(self, key: str, spec, value_type, dist: Dict[str, Any]):
+        self.key = key
+        self.spec = spec
+        self.value_type = value_type
+        self.dist = dist
+
+    def convert(self, value):
+        if isinstance(value, (list, tuple)) and self.value_type is not None:
+            return self.value_type(*value)
+        return value
+
+
+class DomainRandomizer:
+    """Sample and apply light, camera and material attributes once per episode"""
+
+    def __init__(self, config: Dict[str, List[dict]], base_seed: int = 0, stage=None):
+        """
+        Args:
+            config: the declared distributions (see load_randomization_config)
+            base_seed: the seed the per-episode seeds are derived from
+            stage: the USD stage, default the stage of the current omni.usd context
+        """
+        self.stage = stage if stage is not None else omni.usd.get_context().get_stage()
+        if self.stage is None:
+            raise RuntimeError("[DomainRandomizer] USD Stage is not initialized")
+        self.base_seed = base_seed
+        self.layer = self.stage.GetEditTarget().GetLayer()
+        self.targets: List[_Target] = []
+        self._resolve(config)
+        print(f"[DomainRandomizer] {len(self.targets)} attributes cached, base seed {base_seed}")
+
+    def _resolve(self, config: Dict[str, List[dict]]):
+        """traverse the stage once and cache the attribute specs of every matched prim"""
+        groups = {
+            "lights": (_is_light, config.get("lights", [])),
+            "cameras": (lambda prim: prim.IsA(UsdGeom.Camera), config.get("cameras", [])),
+            "materials": (lambda prim: prim.IsA(UsdShade.Material), config.get("materials", [])),
+        }
+        matched = {group: [[] for _ in entries] for group, (_, entries) in groups.items()}
+        for prim in self.stage.Traverse():
+            name = prim.GetName()
+            for group, (is_type, entries) in groups.items():
+                for index, entry in enumerate(entries):
+                    if entry["match"] in name and is_type(prim):
+                        matched[group][index].append(prim)
+
+        for group, (_, entries) in groups.items():
+            for entry, prims in zip(entries, matched[group]):
+                if not prims:
+                    print(f"[DomainRandomizer] ⚠️ no {group} match {entry['match']}")
+                    continue
+                if group == "materials":
+                    # the inputs live on the shaders of the material
+                    prims = [child for prim in prims for child in prim.GetDescendants() if child.IsA(UsdShade.Shader)]
+                for prim in prims:
+                    for attr_name, dist in entry["attributes"].items():
+                        self._add_target(prim, attr_name, dist, try_inputs=(group == "lights"))
+
+    def _add_target(self, prim, attr_name: str, dist: Dict[str, Any], try_inputs: bool = False):
+        attr = prim.GetAttribute(attr_name)
+        if not attr.IsValid() and try_inputs:
+            attr = prim.GetAttribute(f"inputs:{attr_name}")
+        if not attr.IsValid():
+            print(f"[DomainRandomizer] ⚠️ {prim.GetPath()} has no attribute {attr_name}, skipped")
+            return
+        # author the current value once so the attribute has a spec on the edit target layer
+        spec_path = self.stage.GetEditTarget().MapToSpecPath(attr.GetPath())
+        spec = self.layer.GetAttributeAtPath(spec_path)
+        if spec is None:
+            current = attr.Get()
+            if current is None:
+                print(f"[DomainRandomizer] ⚠️ {attr.GetPath()} has no value, skipped")
+                return
+            attr.Set(current)
+            spec = self.layer.GetAttributeAtPath(spec_path)
+        value_type = attr.GetTypeName().type.pythonClass
+        self.targets.append(_Target(str(attr.GetPath()), spec, value_type, dist))
+
+    def randomize(self, key: Optional[str] = None, seed: Optional[int] = None) -> Dict[str, Any]:
+        """Sample every declared attribute and write them in one change block
+
+        Args:
+            key: the episode key the seed is derived from, e.g. the source episode file
+            seed: use this seed instead of deriving one
+
+        Returns:
+            {"seed": seed, "values": {attribute path: sampled value}} for the episode metadata
+        """
+        if seed is None:
+            seed = episode_seed(self.base_seed, key if key is not None else "")
+        rng = random.Random(seed)
+        values = {target.key: _sample(rng, target.dist) for target in self.targets}
+        with Sdf.ChangeBlock():
+            for target in self.targets:
+                target.spec.default = target.convert(values[target.key])
+        return {"seed": seed, "base_seed": self.base_seed, "values": values}
@@ -1,37 +1,31 @@
-import re
+import os
+import sys
 
-def modify_instanceable_flag(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.usda_rewriter import InstanceableRule, rewrite_usda
 
-    modified_lines = []
-    inside_visuals_block = False
-    visuals_start_re = re.compile(r'^\s*def\s+Xform\s+"visuals"\s*\(')
-    instanceable_re = re.compile(r'^\s*instanceable\s*=\s*true\s*$')
-    # instanceable_re = re.compile(r'^\s*instanceable\s*=\s*false\s*$')
 
-    for line in lines:
-        if visuals_start_re.match(line):
-            inside_visuals_block = True
-            modified_lines.append(line)
-            continue
+def modify_instanceable_flag(file_path, output_path=None, instanceable=False):
+    """
+    Set instanceable of every visuals Xform, streaming the file line by line.
 
-        if inside_visuals_block:
-            if instanceable_re.match(line):
-                # Replace 'true' with 'false'
-                modified_lines.append('            instanceable = false\n')
-                # modified_lines.append('            instanceable = true\n')
-            else:
-                modified_lines.append(line)
+    Args:
+        file_path: input .usda
+        output_path: output .usda, default <name>_edit.usda next to the input
+        instanceable: the value to write
+    """
+    if output_path is None:
+        stem, ext = os.path.splitext(file_path)
+        output_path = f"{stem}_edit{ext}"
+    changed = rewrite_usda(file_path, output_path, [InstanceableRule("visuals", instanceable)])
+    print(f"[modify_instanceable_flag] {file_path} -> {output_path}: {changed} lines changed")
+    return output_path
 
-            if line.strip().endswith(')'):
-                inside_visuals_block = False
-        else:
-            modified_lines.append(line)
 
-    # 保存修改后的内容
-    with open('/home/unitree/newDisk/URDF/wholevody_with_inspire/demo2.usda', 'w', encoding='utf-8') as f:
-        f.writelines(modified_lines)
-
-# 使用方法
-modify_instanceable_flag('/home/unitree/newDisk/URDF/wholevody_with_inspire/demo.usda')  # 替换为你的实际文件路径
+# 使用方法: python tools/edit_usda.py <input.usda> [output.usda]
+# 批量/并行处理多个文件请使用 tools/usda_rewriter.py
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python tools/edit_usda.py <input.usda> [output.usda]")
+        sys.exit(1)
+    modify_instanceable_flag(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
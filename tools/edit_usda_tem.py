@@ -6,7 +6,9 @@ import sys
 import logging
 from typing import List, Set, Optional
 from pathlib import Path
-import re
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.usda_rewriter import InstanceableRule, rewrite_usda
 
 # 配置日志
 logging.basicConfig(
@@ -17,73 +19,15 @@ logger = logging.getLogger(__name__)
 
 def modify_usda_file(input_file, output_file, target_links):
     """
-    修改usda文件
+    修改usda文件(逐行流式处理，内存占用与文件大小无关)
     - 所有visuals下的instanceable改为false
     - 指定link下的collisions的instanceable改为false
     """
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    modified_lines = []
-    current_link = None
-    inside_visuals_block = False
-    inside_collisions_block = False
-    find_target_link = False
-    
-    # 编译正则表达式
-    visuals_start_re = re.compile(r'^\s*def\s+Xform\s+"visuals"\s*\(')
-    collisions_start_re = re.compile(r'\s*def\s+Xform\s+"collisions"\s*\(')
-    instanceable_re = re.compile(r'^\s*instanceable\s*=\s*true\s*$')
-    collisions_instanceable_re = re.compile(r'^\s*instanceable\s*=\s*true\s*$')
-    
-    for line in lines:
-        # 检查是否是Xform定义行
-        if 'def Xform "' in line:
-            if visuals_start_re.match(line):
-                inside_visuals_block = True
-                modified_lines.append(line)
-                continue
-            elif collisions_start_re.match(line):
-                inside_collisions_block = True
-                modified_lines.append(line)
-                continue
-            else:
-                # 提取link名称
-                current_link = line.split('"')[1]
-                
-                if current_link in target_links:
-                    find_target_link = True
-                    inside_collisions_block = False
-                    inside_visuals_block = False
-                modified_lines.append(line)
-                continue
-        # 处理visuals部分
-        if inside_visuals_block:
-            if instanceable_re.match(line):
-                modified_lines.append('            instanceable = false\n')
-            else:
-                modified_lines.append(line)
-            if line.strip().endswith(')'):
-                inside_visuals_block = False
-            continue
-        # 处理collisions部分
-        if inside_collisions_block and find_target_link:
-            if  instanceable_re.match(line):
-                modified_lines.append('            instanceable = false\n')
-            else:
-                modified_lines.append(line)
-            if line.strip().endswith(')'):
-                inside_collisions_block = False
-                find_target_link = False
-            continue
-        # 其他行直接添加
-        else:
-            modified_lines.append(line)
-            continue
-
-    # 保存修改后的内容
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(modified_lines)
+    rules = [
+        InstanceableRule("visuals", False),
+        InstanceableRule("collisions", False, links=set(target_links)),
+    ]
+    return rewrite_usda(input_file, output_file, rules)
 
 def main():
     """主函数"""
@@ -107,12 +51,20 @@ def main():
         
     ]
     
-    input_file = "/home/unitree/newDisk/URDF/urdf-to-usd/g1withdex3/g1_29dof_with_hand_rev_1_0.usda"
-    output_file = "/home/unitree/newDisk/URDF/urdf-to-usd/g1withdex3/g1_29dof_with_hand_rev_1_0_edit.usda"
+    # 用法: python tools/edit_usda_tem.py <input.usda> [output.usda]
+    if len(sys.argv) < 2:
+        logger.error("usage: python tools/edit_usda_tem.py <input.usda> [output.usda]")
+        sys.exit(1)
+    input_file = sys.argv[1]
+    if len(sys.argv) > 2:
+        output_file = sys.argv[2]
+    else:
+        stem, ext = os.path.splitext(input_file)
+        output_file = f"{stem}_edit{ext}"
     
     try:
-        modify_usda_file(input_file, output_file, target_links)
-        logger.info(f"文件处理完成，已保存到: {output_file}")
+        changed = modify_usda_file(input_file, output_file, target_links)
+        logger.info(f"文件处理完成，修改 {changed} 行，已保存到: {output_file}")
     except Exception as e:
         logger.error(f"程序执行失败: {str(e)}")
         sys.exit(1)
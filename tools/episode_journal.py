@@ -0,0 +1,133 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Append-only episode journal
+While an episode is recorded its items are appended to "data.jsonl" in the episode directory:
+the first line holds {"info": ..., "text": ...}, every following line one item.
+The journal is flushed after every batch and fsynced periodically, so a crash loses at most the last few items.
+
+When the episode is saved (or recovered on the next start) the journal is converted line by line
+into the usual data.json and removed, without loading the episode into memory.
+"""
+
+import os
+import json
+import time
+
+JOURNAL_NAME = "data.jsonl"
+JSON_NAME = "data.json"
+
+
+class EpisodeJournal:
+    """Append items of one episode to its journal file"""
+
+    def __init__(self, journal_path: str, info: dict, text: dict, fsync_interval: float = 1.0):
+        """
+        Args:
+            journal_path: the journal file, created or truncated
+            info: the episode info written to data.json
+            text: the episode text description written to data.json
+            fsync_interval: minimum seconds between two fsync calls, 0 syncs after every flush
+        """
+        self.journal_path = journal_path
+        self.fsync_interval = fsync_interval
+        self.item_count = 0
+        self.file = open(journal_path, "w", encoding="utf-8")
+        self.file.write(json.dumps({"info": info, "text": text}, ensure_ascii=False) + "\n")
+        self._last_fsync = 0.0
+        self.flush(force_sync=True)
+
+    def append(self, item_data: dict):
+        self.file.write(json.dumps(item_data, ensure_ascii=False) + "\n")
+        self.item_count += 1
+
+    def flush(self, force_sync: bool = False):
+        """Flush buffered items to the OS and fsync if the interval elapsed"""
+        self.file.flush()
+        now = time.monotonic()
+        if force_sync or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self.file.fileno())
+            self._last_fsync = now
+
+    def close(self):
+        if self.file is not None:
+            self.flush(force_sync=True)
+            self.file.close()
+            self.file = None
+
+
+def _read_journal(journal_path: str):
+    """Read the journal header and iterate its items, skipping a torn last line
+
+    Returns:
+        (header, items iterator), header is None if the journal is empty or unreadable
+    """
+    f = open(journal_path, "r", encoding="utf-8")
+    first = f.readline()
+    try:
+        header = json.loads(first)
+    except json.JSONDecodeError:
+        f.close()
+        return None, iter(())
+
+    def items():
+        with f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # last write was interrupted
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    break
+    return header, items()
+
+
+def finalize_journal(journal_path: str, json_path: str, recovered: bool = False) -> int:
+    """Convert a journal into data.json and remove the journal
+
+    data.json is written to a temporary file and renamed, so it is either complete or absent.
+
+    Args:
+        journal_path: the journal file
+        json_path: the data.json to write
+        recovered: mark the episode as recovered from an interrupted recording in info
+
+    Returns:
+        the number of items written, -1 if the journal header is unreadable
+    """
+    header, items = _read_journal(journal_path)
+    if header is None:
+        return -1
+    info = header.get("info", {})
+    if recovered:
+        info["recovered"] = True
+
+    tmp_path = json_path + ".tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as jsonf:
+        head = json.dumps({"info": info, "text": header.get("text", {})}, indent=4, ensure_ascii=False)
+        # drop the closing brace of the header object and continue it with the data list
+        jsonf.write(head[:-2] + ',\n    "data": [\n')
+        for item_data in items:
+            if count > 0:
+                jsonf.write(",\n")
+            jsonf.write(json.dumps(item_data, indent=4, ensure_ascii=False))
+            count += 1
+        jsonf.write("\n    ]\n}")
+        jsonf.flush()
+        os.fsync(jsonf.fileno())
+    os.replace(tmp_path, json_path)
+    os.remove(journal_path)
+    return count
+
+
+def recover_episode(episode_dir: str) -> int:
+    """Finalize the journal left in an episode directory by an interrupted recording
+
+    Returns:
+        the number of recovered items, -1 if there was nothing to recover
+    """
+    journal_path = os.path.join(episode_dir, JOURNAL_NAME)
+    if not os.path.exists(journal_path):
+        return -1
+    return finalize_journal(journal_path, os.path.join(episode_dir, JSON_NAME), recovered=True)
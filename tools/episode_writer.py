@@ -5,20 +5,37 @@ import datetime
 import numpy as np
 import time
 from .rerun_visualizer import RerunLogger
+from .video_storage import VideoStreamWriter, make_frame_ref, VIDEO_EXT
+from .episode_journal import EpisodeJournal, finalize_journal, recover_episode, JOURNAL_NAME, JSON_NAME
+from .dataset_manifest import DatasetManifest, read_episode_summary
+from .camera_settings import get_camera_stream_cfg, DEPTH_SCALE
 from queue import Queue, Empty
 from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 import logging_mp
 logger_mp = logging_mp.get_logger(__name__)
 
 class EpisodeWriter():
-    def __init__(self, task_dir, frequency=30, image_size=[640, 480], rerun_log = True):
+    def __init__(self, task_dir, frequency=30, image_size=None, rerun_log = True, queue_size = 60, encode_workers = 4, max_batch_size = 8, image_storage = 'jpeg', fsync_interval = 1.0):
         """
-        image_size: [width, height]
+        image_size: [width, height], default the head camera resolution of the camera settings (tools/camera_settings.py)
+        queue_size: maximum number of frames waiting to be written, add_item blocks when the queue is full
+        encode_workers: number of threads encoding images in parallel
+        max_batch_size: maximum number of queued frames written together in one batch
+        image_storage: 'jpeg' writes one file per frame and camera, 'video' writes one video file per camera stream
+        fsync_interval: minimum seconds between two fsync calls of the episode journal
         """
         logger_mp.info("==> EpisodeWriter initializing...\n")
         self.task_dir = task_dir
         self.frequency = frequency
+        if image_size is None:
+            head = get_camera_stream_cfg("head")
+            image_size = [head.width, head.height]
         self.image_size = image_size
+        if image_storage not in ('jpeg', 'video'):
+            raise ValueError(f"image_storage must be 'jpeg' or 'video', got {image_storage}")
+        self.image_storage = image_storage
+        self.video_streams = {}
 
         self.rerun_log = rerun_log
         if self.rerun_log:
@@ -27,23 +44,44 @@ class EpisodeWriter():
             logger_mp.info("==> RerunLogger initializing ok.\n")
         
         self.data = {}
-        self.episode_data = []
+        self.fsync_interval = fsync_interval
+        self.journal = None
         self.item_id = -1
         self.episode_id = -1
+        self.task_name = None
+        self.episode_success = None
         if os.path.exists(self.task_dir):
-            episode_dirs = [episode_dir for episode_dir in os.listdir(self.task_dir) if 'episode_' in episode_dir]
-            episode_last = sorted(episode_dirs)[-1] if len(episode_dirs) > 0 else None
-            self.episode_id = 0 if episode_last is None else int(episode_last.split('_')[-1])
+            self.manifest = DatasetManifest(self.task_dir)
+            if self.manifest.exists():
+                self.episode_id = max(self.manifest.last_episode_id(), 0)
+                # Episodes created after the last manifest entry were interrupted, finalize their journals
+                while os.path.isdir(self._episode_dir(self.episode_id + 1)):
+                    self.episode_id += 1
+                    self._recover_episode(self._episode_dir(self.episode_id))
+            else:
+                episode_dirs = [episode_dir for episode_dir in os.listdir(self.task_dir) if 'episode_' in episode_dir]
+                episode_last = sorted(episode_dirs)[-1] if len(episode_dirs) > 0 else None
+                self.episode_id = 0 if episode_last is None else int(episode_last.split('_')[-1])
+                # Only the latest episode can have been interrupted, finalize its journal if one was left behind
+                if episode_last is not None:
+                    self._recover_episode(os.path.join(self.task_dir, episode_last))
+                # Index the existing episodes once, later starts read the manifest instead of listing the directory
+                self.manifest.build()
             logger_mp.info(f"==> task_dir directory already exist, now self.episode_id is:{self.episode_id}\n")
         else:
             os.makedirs(self.task_dir)
+            self.manifest = DatasetManifest(self.task_dir)
             logger_mp.info(f"==> episode directory does not exist, now create one.\n")
         self.data_info()
         self.text_desc()
 
         self.is_available = True  # Indicates whether the class is available for new operations
-        # Initialize the queue and worker thread
-        self.item_data_queue = Queue(-1)
+        # Initialize the bounded queue, the image encoding pool and the worker thread
+        self.queue_size = queue_size
+        self.max_batch_size = max(1, max_batch_size)
+        self.item_data_queue = Queue(queue_size)
+        self.encode_pool = ThreadPoolExecutor(max_workers=encode_workers, thread_name_prefix="episode_encode")
+        self._reset_queue_stats()
         self.stop_worker = False
         self.need_save = False  # Flag to indicate when save_episode is triggered
         self.worker_thread = Thread(target=self.process_queue)
@@ -56,8 +94,8 @@ class EpisodeWriter():
                 "version": "1.0.0" if version is None else version, 
                 "date": datetime.date.today().strftime('%Y-%m-%d') if date is None else date,
                 "author": "unitree" if author is None else author,
-                "image": {"width":self.image_size[0], "height":self.image_size[1], "fps":self.frequency},
-                "depth": {"width":self.image_size[0], "height":self.image_size[1], "fps":self.frequency},
+                "image": {"width":self.image_size[0], "height":self.image_size[1], "fps":self.frequency, "storage":self.image_storage},
+                "depth": {"width":self.image_size[0], "height":self.image_size[1], "fps":self.frequency, "format":"png16", "scale":DEPTH_SCALE},
                 "audio": {"sample_rate": 16000, "channels": 1, "format":"PCM", "bits":16},    # PCM_S16
                 "joint_names":{
                     "left_arm":   ['kLeftShoulderPitch' ,'kLeftShoulderRoll', 'kLeftShoulderYaw', 'kLeftElbow', 'kLeftWristRoll', 'kLeftWristPitch', 'kLeftWristyaw'],
@@ -81,9 +119,13 @@ class EpisodeWriter():
         }
 
  
-    def create_episode(self,sim_state=None):
+    def create_episode(self,sim_state=None,task_name=None,domain_randomization=None):
         """
         Create a new episode.
+        Args:
+            sim_state: initial simulation state stored in info
+            task_name: task of the episode, recorded in the dataset manifest
+            domain_randomization: seed and sampled values of the episode (DomainRandomizer.randomize), stored in info
         Returns:
             bool: True if the episode is successfully created, False otherwise.
         Note:
@@ -95,14 +137,18 @@ class EpisodeWriter():
 
         # Reset episode-related data and create necessary directories
         self.item_id = -1
-        self.episode_data = []
+        self._reset_queue_stats()
+        self.video_streams = {}
         self.episode_id = self.episode_id + 1
         
-        self.episode_dir = os.path.join(self.task_dir, f"episode_{str(self.episode_id).zfill(4)}")
+        self.task_name = task_name
+        self.episode_success = None
+        self.episode_dir = self._episode_dir(self.episode_id)
         self.color_dir = os.path.join(self.episode_dir, 'colors')
         self.depth_dir = os.path.join(self.episode_dir, 'depths')
         self.audio_dir = os.path.join(self.episode_dir, 'audios')
-        self.json_path = os.path.join(self.episode_dir, 'data.json')
+        self.json_path = os.path.join(self.episode_dir, JSON_NAME)
+        self.journal_path = os.path.join(self.episode_dir, JOURNAL_NAME)
         os.makedirs(self.episode_dir, exist_ok=True)
         os.makedirs(self.color_dir, exist_ok=True)
         os.makedirs(self.depth_dir, exist_ok=True)
@@ -113,6 +159,11 @@ class EpisodeWriter():
         self.is_available = False  # After the episode is created, the class is marked as unavailable until the episode is successfully saved
         logger_mp.info(f"==> New episode created: {self.episode_dir}")
         self.info['sim_state'] = sim_state
+        if domain_randomization is not None:
+            self.info['domain_randomization'] = domain_randomization
+        else:
+            self.info.pop('domain_randomization', None)
+        self.journal = EpisodeJournal(self.journal_path, self.info, self.text, fsync_interval=self.fsync_interval)
         return True  # Return True if the episode is successfully created
         
     def add_item(self, colors, depths=None, states=None, actions=None, tactiles=None, audios=None,sim_state=None):
@@ -129,29 +180,120 @@ class EpisodeWriter():
             'audios': audios,
             'sim_state': sim_state,
         }
-        # Enqueue the item data
+        # Enqueue the item data, block (backpressure) when the writer falls behind
+        self.queue_stats['enqueued'] += 1
+        if self.item_data_queue.full():
+            self.queue_stats['blocked_puts'] += 1
+        put_start = time.perf_counter()
         self.item_data_queue.put(item_data)
+        self.queue_stats['blocked_time'] += time.perf_counter() - put_start
+        self.queue_stats['max_depth'] = max(self.queue_stats['max_depth'], self.item_data_queue.qsize())
+
+    def _reset_queue_stats(self):
+        self.queue_stats = {
+            'enqueued': 0,         # frames passed to add_item
+            'blocked_puts': 0,     # add_item calls that found the queue full
+            'blocked_time': 0.0,   # total seconds add_item spent waiting for space
+            'max_depth': 0,        # highest number of frames waiting in the queue
+            'batches': 0,          # number of batches written by the worker
+        }
+
+    def get_queue_stats(self):
+        """
+        Return the backpressure metrics of the current episode.
+        """
+        stats = dict(self.queue_stats)
+        stats['depth'] = self.item_data_queue.qsize()
+        stats['capacity'] = self.queue_size
+        return stats
 
     def process_queue(self):
         while not self.stop_worker or not self.item_data_queue.empty():
-            # Process items in the queue
+            # Collect the items waiting in the queue into one batch
+            batch = []
             try:
-                item_data = self.item_data_queue.get(timeout=1)
-                try:
-                    self._process_item_data(item_data)
-                except Exception as e:
-                    logger_mp.info(f"Error processing item_data (idx={item_data['idx']}): {e}")
-                self.item_data_queue.task_done()
+                batch.append(self.item_data_queue.get(timeout=1))
+                while len(batch) < self.max_batch_size:
+                    batch.append(self.item_data_queue.get_nowait())
             except Empty:
                 pass
+
+            if batch:
+                try:
+                    self._process_batch(batch)
+                except Exception as e:
+                    logger_mp.info(f"Error processing item_data (idx={batch[0]['idx']}..{batch[-1]['idx']}): {e}")
+                for _ in batch:
+                    self.item_data_queue.task_done()
         
             # Check if save_episode was triggered
             if self.need_save and self.item_data_queue.empty():
                 self._save_episode()
 
-    def _process_item_data(self, item_data):
+    def _process_batch(self, batch):
+        if self.image_storage == 'video':
+            # Frames of one stream must be appended in order: encode the streams in parallel, each one sequentially
+            # (16-bit depth does not fit into MJPEG, depths are always stored as PNG files)
+            streams = sorted({('colors', key) for item_data in batch for key in (item_data.get('colors') or {})})
+            futures = [self.encode_pool.submit(self._write_video_stream, data_type, key, batch) for data_type, key in streams]
+            for (data_type, key), future in zip(streams, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger_mp.info(f"Error writing video stream {data_type}/{key}: {e}")
+                    self._drop_unwritten_frames(data_type, key, batch)
+        # Encode the images of every frame in the batch in parallel, then append the frames in order
+        futures = [self.encode_pool.submit(self._save_item_files, item_data) for item_data in batch]
+        for item_data, future in zip(batch, futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger_mp.info(f"Error saving files of item_data (idx={item_data['idx']}): {e}")
+            try:
+                self.journal.append(item_data)
+            except Exception as e:
+                logger_mp.info(f"Error journaling item_data (idx={item_data['idx']}): {e}")
+                continue
+
+            # Log data if necessary
+            if self.rerun_log:
+                curent_record_time = time.time()
+                logger_mp.info(f"==> episode_id:{self.episode_id}  item_id:{item_data['idx']}  current_time:{curent_record_time}")
+                self.rerun_logger.log_item_data(item_data)
+        self.journal.flush()
+        self.queue_stats['batches'] += 1
+
+    def _write_video_stream(self, data_type, key, batch):
+        stream = self.video_streams.get((data_type, key))
+        if stream is None:
+            stream_dir = self.color_dir if data_type == 'colors' else self.depth_dir
+            stream = VideoStreamWriter(os.path.join(stream_dir, f'{key}{VIDEO_EXT}'), fps=self.frequency)
+            self.video_streams[(data_type, key)] = stream
+        for item_data in batch:
+            images = item_data.get(data_type) or {}
+            if key in images:
+                frame_id = stream.write(images[key], item_data['idx'])
+                images[key] = make_frame_ref(os.path.join(data_type, f'{key}{VIDEO_EXT}'), frame_id)
+
+    def _drop_unwritten_frames(self, data_type, key, batch):
+        # frames the failed stream did not reference are recorded as missing (null) instead of raw arrays
+        for item_data in batch:
+            images = item_data.get(data_type) or {}
+            if key in images and not isinstance(images[key], str):
+                images[key] = None
+
+    def _close_video_streams(self):
+        for (data_type, key), stream in self.video_streams.items():
+            try:
+                stream.close()
+            except Exception as e:
+                logger_mp.info(f"Error closing video stream {data_type}/{key}: {e}")
+        self.video_streams = {}
+
+    def _save_item_files(self, item_data):
         idx = item_data['idx']
-        colors = item_data.get('colors', {})
+        # in video storage the images were already appended to their streams
+        colors = item_data.get('colors', {}) if self.image_storage == 'jpeg' else {}
         depths = item_data.get('depths', {})
         audios = item_data.get('audios', {})
 
@@ -166,8 +308,9 @@ class EpisodeWriter():
         # Save depths
         if depths:
             for idx_depth, (depth_key, depth) in enumerate(depths.items()):
-                depth_name = f'{str(idx).zfill(6)}_{depth_key}.jpg'
-                if not cv2.imwrite(os.path.join(self.depth_dir, depth_name), depth):
+                # uint16 millimetres, PNG keeps the 16 bits
+                depth_name = f'{str(idx).zfill(6)}_{depth_key}.png'
+                if not cv2.imwrite(os.path.join(self.depth_dir, depth_name), depth, [int(cv2.IMWRITE_PNG_COMPRESSION), 1]):
                     logger_mp.info(f"Failed to save depth image.")
                 item_data['depths'][depth_key] = os.path.join('depths', depth_name)
 
@@ -178,34 +321,48 @@ class EpisodeWriter():
                 np.save(os.path.join(self.audio_dir, audio_name), audio.astype(np.int16))
                 item_data['audios'][mic] = os.path.join('audios', audio_name)
 
-        # Update episode data
-        self.episode_data.append(item_data)
+    def _recover_episode(self, episode_dir):
+        try:
+            recovered = recover_episode(episode_dir)
+        except Exception as e:
+            logger_mp.info(f"==> Failed to recover interrupted episode {episode_dir}: {e}")
+            return
+        if recovered >= 0:
+            logger_mp.info(f"==> Recovered interrupted episode {episode_dir} ({recovered} items).")
+            if self.manifest.exists():
+                self.manifest.add_episode(episode_dir, **read_episode_summary(os.path.join(episode_dir, JSON_NAME)))
 
-        # Log data if necessary
-        if self.rerun_log:
-            curent_record_time = time.time()
-            logger_mp.info(f"==> episode_id:{self.episode_id}  item_id:{idx}  current_time:{curent_record_time}")
-            self.rerun_logger.log_item_data(item_data)
+    def _episode_dir(self, episode_id):
+        return os.path.join(self.task_dir, f"episode_{str(episode_id).zfill(4)}")
 
-    def save_episode(self):
+    def save_episode(self, success=None):
         """
         Trigger the save operation. This sets the save flag, and the process_queue thread will handle it.
+        success: whether the episode reached the task goal, recorded in the dataset manifest
         """
+        self.episode_success = success
         self.need_save = True  # Set the save flag
         logger_mp.info(f"==> Episode saved start...")
 
     def _save_episode(self):
         """
-        Save the episode data to a JSON file.
+        Close the episode journal and convert it into data.json.
         """
-        self.data['info'] = self.info
-        self.data['text'] = self.text
-        self.data['data'] = self.episode_data
-        with open(self.json_path, 'w', encoding='utf-8') as jsonf:
-            jsonf.write(json.dumps(self.data, indent=4, ensure_ascii=False))
+        self._close_video_streams()
+        self.journal.close()
+        saved_item_count = finalize_journal(self.journal_path, self.json_path)
+        self.journal = None
+        try:
+            self.manifest.add_episode(self.episode_dir, task_name=self.task_name, frames=saved_item_count,
+                                      duration=saved_item_count / self.frequency, success=self.episode_success)
+        except Exception as e:
+            logger_mp.info(f"==> Failed to update dataset manifest: {e}")
         self.need_save = False     # Reset the save flag
         self.is_available = True   # Mark the class as available after saving
-        logger_mp.info(f"==> Episode saved successfully to {self.json_path}.")
+        stats = self.queue_stats
+        logger_mp.info(f"==> Episode saved successfully to {self.json_path} ({saved_item_count} items).")
+        logger_mp.info(f"==> Queue stats: max_depth={stats['max_depth']}/{self.queue_size}, blocked_puts={stats['blocked_puts']}, "
+                       f"blocked_time={stats['blocked_time']:.3f}s, batches={stats['batches']}")
 
     def close(self):
         """
@@ -243,5 +400,9 @@ class EpisodeWriter():
             self.worker_thread.join(timeout=5.0)  # 5秒超时
             if self.worker_thread.is_alive():
                 print("==>  Warning: Worker thread did not finish within timeout")
+
+        # 关闭图像编码线程池
+        # Shut down the image encoding pool
+        self.encode_pool.shutdown(wait=True)
         
         print("==> EpisodeWriter shutdown completed")
\ No newline at end of file
@@ -0,0 +1,138 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Generation profiles
+A generation profile declares what runs for each frame while replayed data is regenerated (--generate_data):
+which scene sensors are updated and which observation terms are computed. Everything else is skipped,
+including the joint-state terms that write DDS shared memory and JSON-encode the state, which replay
+does not need (joint positions are read from the robot data directly).
+
+Built-in profiles:
+    images  cameras and the camera_image term only (default)
+    full    every sensor and the full observation_manager.compute(), the previous behavior
+
+A profile can also be a JSON file:
+
+    {"name": "images_depth", "sensors": ["front_camera"], "observation_terms": ["camera_image"], "sensor_dt": 0.02}
+
+"sensors" or "observation_terms" set to null means all of them. With "render": false the frame is not rendered,
+for terms that do not read the cameras.
+"""
+
+import os
+import json
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+
+
+@dataclass
+class GenerationProfile:
+    """What is computed for each regenerated frame"""
+    name: str
+    sensors: Optional[List[str]] = None            # scene sensor names, None for all sensors
+    observation_terms: Optional[List[str]] = None  # observation term names, None for observation_manager.compute()
+    sensor_dt: float = 0.02                         # dt passed to sensor.update
+    render: bool = True                             # call sim.render() before the observation terms
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# observation terms that read the cameras and need a rendered frame
+CAMERA_OBSERVATION_TERMS = ["camera_image"]
+
+GENERATION_PROFILES = {
+    "images": GenerationProfile(
+        name="images",
+        sensors=["front_camera", "left_wrist_camera", "right_wrist_camera"],
+        observation_terms=CAMERA_OBSERVATION_TERMS,
+    ),
+    "full": GenerationProfile(name="full"),
+}
+
+
+def load_generation_profile(name_or_path: str) -> GenerationProfile:
+    """Get a built-in profile by name or load one from a JSON file"""
+    if name_or_path in GENERATION_PROFILES:
+        return GENERATION_PROFILES[name_or_path]
+    if os.path.isfile(name_or_path):
+        with open(name_or_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data.setdefault("name", os.path.splitext(os.path.basename(name_or_path))[0])
+        return GenerationProfile(**data)
+    raise ValueError(f"unknown generation profile: {name_or_path}, "
+                     f"use one of {list(GENERATION_PROFILES.keys())} or a JSON file")
+
+
+def observation_term_names(env) -> List[str]:
+    """Names of every observation term of the env, in group order without duplicates"""
+    active_terms = env.observation_manager.active_terms
+    return list(dict.fromkeys(name for names in active_terms.values() for name in names))
+
+
+def observation_term_cfgs(manager, group_name: str) -> list:
+    """Configs of the active terms of one observation group, in the order of manager.active_terms[group_name]
+
+    The observation manager has no public accessor for the term configs, so they are read from its
+    _group_obs_term_cfgs attribute; this is the only place that touches it.
+    """
+    try:
+        term_cfgs = manager._group_obs_term_cfgs[group_name]
+    except (AttributeError, KeyError) as e:
+        raise RuntimeError(f"cannot read the term configs of observation group {group_name} from "
+                           f"{type(manager).__name__}._group_obs_term_cfgs ({e!r}); the Isaac Lab observation "
+                           f"manager internals changed, update observation_term_cfgs in tools/generation_profile.py") from e
+    if len(term_cfgs) != len(manager.active_terms[group_name]):
+        raise RuntimeError(f"observation group {group_name} has {len(manager.active_terms[group_name])} active terms "
+                           f"but {len(term_cfgs)} term configs; update observation_term_cfgs in tools/generation_profile.py")
+    return term_cfgs
+
+
+class GenerationStep:
+    """Run the sensors and observation terms of a profile for one frame"""
+
+    def __init__(self, env, profile: GenerationProfile):
+        self.env = env
+        self.profile = profile
+        self.sensors = self._resolve_sensors()
+        self.term_cfgs = self._resolve_terms()
+        sensor_names = "all" if profile.sensors is None else [name for name, _ in self.sensors]
+        term_names = "all" if self.term_cfgs is None else [name for name, _ in self.term_cfgs]
+        print(f"[GenerationStep] profile {profile.name}: sensors {sensor_names}, observation terms {term_names}")
+
+    def _resolve_sensors(self):
+        scene_sensors = self.env.scene.sensors
+        if self.profile.sensors is None:
+            return list(scene_sensors.items())
+        sensors = [(name, scene_sensors[name]) for name in self.profile.sensors if name in scene_sensors]
+        missing = [name for name in self.profile.sensors if name not in scene_sensors]
+        if missing:
+            print(f"[GenerationStep] sensors not in the scene, skipped: {missing}")
+        return sensors
+
+    def _resolve_terms(self):
+        if self.profile.observation_terms is None:
+            return None
+        manager = self.env.observation_manager
+        available = {}
+        for group_name, term_names in manager.active_terms.items():
+            for term_name, term_cfg in zip(term_names, observation_term_cfgs(manager, group_name)):
+                available.setdefault(term_name, term_cfg)
+        term_cfgs = [(name, available[name]) for name in self.profile.observation_terms if name in available]
+        missing = [name for name in self.profile.observation_terms if name not in available]
+        if missing:
+            print(f"[GenerationStep] observation terms not in the env, skipped: {missing}")
+        return term_cfgs
+
+    def run(self):
+        """Update the sensors, render and compute the observation terms of the profile"""
+        for _, sensor in self.sensors:
+            sensor.update(self.profile.sensor_dt, force_recompute=False)
+        if self.profile.render:
+            self.env.sim.render()
+        if self.term_cfgs is None:
+            self.env.observation_manager.compute()
+            return
+        # the selected terms are only run for their side effects (e.g. the image shared memory)
+        for _, term_cfg in self.term_cfgs:
+            term_cfg.func(self.env, **term_cfg.params)
@@ -0,0 +1,106 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Kinematic replay
+Replays the recorded scene states of an episode for rendering only. Instead of a full scene.reset_to() per
+frame (root pose, root velocity, joint position and joint velocity of every asset), the states are stacked
+on the sim device when the episode is loaded, the per-frame deltas are precomputed, and every frame writes
+only the joint positions and root poses that changed since the previous frame. Velocities are not written.
+
+Deformable objects are not supported; episodes that contain them are replayed with reset_to.
+"""
+
+import torch
+
+# position changes below this are treated as unchanged
+CHANGE_EPS = 1e-6
+
+
+class _AssetTrack:
+    """stacked per-frame states of one asset and the frames at which they change"""
+
+    def __init__(self, asset, root_poses, joint_positions=None, eps: float = CHANGE_EPS):
+        self.asset = asset
+        # [T, 7]
+        self.root_poses = root_poses
+        root_changed = torch.ones(root_poses.shape[0], dtype=torch.bool, device=root_poses.device)
+        root_changed[1:] = (root_poses[1:] - root_poses[:-1]).abs().amax(dim=-1) > eps
+        self.root_changed = root_changed.tolist()
+        # [T, J] and the indices of the joints that changed at each frame
+        self.joint_positions = joint_positions
+        self.joint_ids = None
+        if joint_positions is not None:
+            joint_changed = torch.ones_like(joint_positions, dtype=torch.bool)
+            joint_changed[1:] = (joint_positions[1:] - joint_positions[:-1]).abs() > eps
+            all_changed = joint_changed.all(dim=-1).tolist()
+            self.joint_ids = []
+            for frame, changed in enumerate(joint_changed):
+                if all_changed[frame]:
+                    self.joint_ids.append(slice(None))
+                else:
+                    ids = changed.nonzero(as_tuple=False).flatten()
+                    self.joint_ids.append(ids if ids.numel() > 0 else None)
+
+
+def _stack(states, group, name, key, device):
+    return torch.cat([state[group][name][key].to(device) for state in states], dim=0)
+
+
+class KinematicReplay:
+    """Write the changed poses of a recorded episode frame by frame"""
+
+    def __init__(self, env, sim_state_list, env_ids=None, is_relative: bool = True):
+        """
+        Args:
+            env: the environment
+            sim_state_list: the per-frame state dicts of the episode (InteractiveScene.get_state() layout)
+            env_ids: the env to replay into, default env 0
+            is_relative: the recorded positions are relative to the env origin
+        """
+        self.env = env
+        self.num_frames = len(sim_state_list)
+        device = env.device
+        self.env_ids = env_ids if env_ids is not None else torch.tensor([0], device=device)
+        self.origin = env.scene.env_origins[self.env_ids] if is_relative else None
+        self.tracks = []
+        self.supported = self.num_frames > 0 and not sim_state_list[0].get("deformable_object")
+        if not self.supported:
+            return
+        first = sim_state_list[0]
+        for name in first.get("articulation", {}):
+            self.tracks.append(_AssetTrack(
+                env.scene[name],
+                self._offset(_stack(sim_state_list, "articulation", name, "root_pose", device)),
+                _stack(sim_state_list, "articulation", name, "joint_position", device),
+            ))
+        for name in first.get("rigid_object", {}):
+            self.tracks.append(_AssetTrack(
+                env.scene[name],
+                self._offset(_stack(sim_state_list, "rigid_object", name, "root_pose", device)),
+            ))
+
+    def _offset(self, root_poses):
+        if self.origin is not None:
+            root_poses = root_poses.clone()
+            root_poses[:, 0:3] += self.origin
+        return root_poses
+
+    def apply(self, frame: int):
+        """Write the poses of one frame, frames have to be applied in order from 0"""
+        for track in self.tracks:
+            if track.root_changed[frame]:
+                track.asset.write_root_pose_to_sim(track.root_poses[frame:frame + 1], env_ids=self.env_ids)
+            if track.joint_positions is None:
+                continue
+            joint_ids = track.joint_ids[frame]
+            if joint_ids is None:
+                continue
+            positions = track.joint_positions[frame:frame + 1, joint_ids]
+            if hasattr(track.asset, "write_joint_position_to_sim"):
+                track.asset.write_joint_position_to_sim(
+                    positions, joint_ids=None if isinstance(joint_ids, slice) else joint_ids, env_ids=self.env_ids)
+            else:
+                # older Isaac Lab without position-only writes
+                track.asset.write_joint_state_to_sim(
+                    positions, torch.zeros_like(positions),
+                    joint_ids=None if isinstance(joint_ids, slice) else joint_ids, env_ids=self.env_ids)
@@ -0,0 +1,97 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Asset prefetch CLI
+Imports the scene config modules (tasks.common_scene and robots.unitree by default), collects the usd_path of
+every scene config class and asset config in them, and mirrors the remote ones (ISAAC_NUCLEUS_DIR, ...) with
+their dependencies into the local asset cache (tools/asset_cache.py). sim_main resolves scene usd_paths
+through the cache, so a node that ran the prefetch starts without remote fetches.
+
+Usage:
+    python tools/prefetch_assets.py --headless
+    python tools/prefetch_assets.py --headless --cache_dir /data/asset_cache --list
+"""
+
+import os
+import sys
+import argparse
+
+from isaaclab.app import AppLauncher
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("PROJECT_ROOT", project_root)
+sys.path.insert(0, project_root)
+
+parser = argparse.ArgumentParser(description="Mirror the remote USDs of the scene configs into the local asset cache")
+parser.add_argument("--modules", nargs="*", default=["tasks.common_scene", "robots.unitree"],
+                    help="modules or packages to scan for scene/asset configs")
+parser.add_argument("--cache_dir", type=str, default=None, help="asset cache directory (default: $SIM_ASSET_CACHE_DIR)")
+parser.add_argument("--force", action="store_true", default=False, help="download again even if cached")
+parser.add_argument("--no_dependencies", action="store_true", default=False, help="do not fetch the dependencies of USD layers")
+parser.add_argument("--list", action="store_true", default=False, help="only list the collected usd paths")
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# the config modules import isaaclab.sim, which needs the app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+import importlib
+import inspect
+import pkgutil
+
+from tools.asset_cache import collect_usd_paths, get_asset_cache_dir, is_remote, prefetch
+
+
+def iter_modules(names):
+    for name in names:
+        module = importlib.import_module(name)
+        yield module
+        if hasattr(module, "__path__"):
+            for info in pkgutil.iter_modules(module.__path__, prefix=f"{name}."):
+                yield importlib.import_module(info.name)
+
+
+def collect_from_module(module):
+    """usd paths of the config classes (instantiated with their defaults) and config objects of a module"""
+    paths = []
+    for _, value in vars(module).items():
+        if inspect.isclass(value):
+            if value.__module__ != module.__name__ or not hasattr(value, "__dataclass_fields__"):
+                continue
+            try:
+                value = value()
+            except Exception as e:
+                print(f"[prefetch_assets] skip {module.__name__}.{value.__name__}: {e}")
+                continue
+        elif inspect.ismodule(value) or callable(value):
+            continue
+        paths.extend(collect_usd_paths(value))
+    return paths
+
+
+def main():
+    paths = []
+    for module in iter_modules(args_cli.modules):
+        paths.extend(collect_from_module(module))
+    paths = list(dict.fromkeys(paths))
+    remote = [path for path in paths if is_remote(path)]
+    print(f"[prefetch_assets] {len(paths)} usd paths, {len(remote)} remote")
+    if args_cli.list:
+        for path in paths:
+            print(f"  {'remote' if is_remote(path) else 'local '}  {path}")
+        return 0
+
+    cache_dir = args_cli.cache_dir or get_asset_cache_dir()
+    report = prefetch(remote, cache_dir, force=args_cli.force, with_dependencies=not args_cli.no_dependencies)
+    print(f"[prefetch_assets] cache {cache_dir}: {len(report['fetched'])} fetched, "
+          f"{len(report['cached'])} already cached, {len(report['failed'])} failed")
+    for url in report["incomplete"]:
+        print(f"[prefetch_assets] incomplete, keeps loading from the remote path: {url}")
+    return 1 if report["failed"] or report["incomplete"] else 0
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    simulation_app.close()
+    sys.exit(exit_code)
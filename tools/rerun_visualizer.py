@@ -5,11 +5,16 @@ import time
 import rerun as rr
 import rerun.blueprint as rrb
 from datetime import datetime
+try:
+    from .video_storage import VideoFrameCache, parse_frame_ref
+except ImportError:  # run as a script from tools/
+    from video_storage import VideoFrameCache, parse_frame_ref
 
 class RerunEpisodeReader:
     def __init__(self, task_dir = ".", json_file="data.json"):
         self.task_dir = task_dir
         self.json_file = json_file
+        self._video_cache = VideoFrameCache()
 
     def return_episode_data(self, episode_idx):
         # Load episode data on-demand
@@ -44,6 +49,7 @@ class RerunEpisodeReader:
                 }
             )
 
+        self._video_cache.close()
         return episode_data
 
     def _process_images(self, item_data, data_type, dir_path):
@@ -51,6 +57,12 @@ class RerunEpisodeReader:
 
         for key, file_name in item_data.get(data_type, {}).items():
             if file_name:
+                if parse_frame_ref(file_name) is not None:
+                    # frame stored in a video stream of the episode
+                    image = self._video_cache.read(dir_path, file_name)
+                    if image is not None:
+                        images[key] = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                    continue
                 file_path = os.path.join(dir_path, file_name)
                 if os.path.exists(file_path):
                     image = cv2.imread(file_path)
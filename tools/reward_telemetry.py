@@ -0,0 +1,166 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Reward telemetry
+Samples the reward and termination terms of the environment at a fixed rate instead of on every loop iteration,
+accumulates them per episode and hands each sample and each episode summary to a publisher
+(the "rt/sim_reward" DDS topic in sim_main.py) instead of printing them.
+
+A sample:
+
+    {"type": "sample", "seq": 12, "episode": 0, "step": 640, "reward": 0.3, "terms": {...},
+     "terminations": ["object_out"], "reward_sum": 2.1, "reward_max": 0.3, "first_success_step": null}
+
+An episode summary is sent when the episode ends (the scene is reset):
+
+    {"type": "episode", "seq": 13, "episode": 0, "reason": "reset_object", "steps": 700, "samples": 14,
+     "reward_sum": 2.1, "reward_max": 0.3, "first_success_step": null, "terminations": {"object_out": 1}}
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class RewardTelemetry:
+    """Sampled reward/termination monitoring with per-episode accumulation"""
+
+    def __init__(self, rate_hz: float = 10.0, success_reward: float = 1.0,
+                 publisher: Optional[Callable[[dict], None]] = None, env_index: int = 0):
+        """
+        Args:
+            rate_hz: sampling rate of the reward terms, 0 disables sampling
+            success_reward: a sampled reward at or above this value counts as success
+            publisher: called with every sample and episode summary dict, None keeps them local
+            env_index: the environment instance that is monitored
+        """
+        self.period = 1.0 / rate_hz if rate_hz > 0 else 0.0
+        self.success_reward = success_reward
+        self.publisher = publisher
+        self.env_index = env_index
+        self.seq = 0
+        self.episode = 0
+        self.last_sample = None
+        self.last_summary = None
+        self._last_sample_time = 0.0
+        self._reset_episode()
+
+    @property
+    def enabled(self) -> bool:
+        return self.period > 0
+
+    def _reset_episode(self):
+        self.episode_start_step = None
+        self.last_step = 0
+        self.samples = 0
+        self.reward_sum = 0.0
+        self.reward_max = None
+        self.first_success_step = None
+        self.termination_counts = {}
+
+    def _publish(self, data: dict):
+        self.seq += 1
+        data["seq"] = self.seq
+        if self.publisher is not None:
+            try:
+                self.publisher(data)
+            except Exception as e:
+                print(f"[RewardTelemetry] failed to publish: {e}")
+
+    def _read_terms(self, env):
+        """Read the reward and termination terms of the monitored env, one host copy per term"""
+        terms = {}
+        reward = 0.0
+        if hasattr(env, "reward_manager"):
+            for name, values in env.reward_manager.get_active_iterable_terms(self.env_index):
+                terms[name] = float(values[0])
+                reward += terms[name]
+        terminations = []
+        if hasattr(env, "termination_manager"):
+            for name, values in env.termination_manager.get_active_iterable_terms(self.env_index):
+                if values[0]:
+                    terminations.append(name)
+        return reward, terms, terminations
+
+    def update(self, env, step: int) -> Optional[dict]:
+        """Sample the terms if the sampling period elapsed
+
+        Args:
+            env: the environment
+            step: the current loop step, used for first-success and episode length
+
+        Returns:
+            the sample dict, None if no sample was taken
+        """
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if now - self._last_sample_time < self.period:
+            return None
+        self._last_sample_time = now
+        try:
+            reward, terms, terminations = self._read_terms(env)
+        except Exception as e:
+            print(f"[RewardTelemetry] failed to read reward terms: {e}")
+            return None
+
+        if self.episode_start_step is None:
+            self.episode_start_step = step
+        self.last_step = step
+        self.samples += 1
+        self.reward_sum += reward
+        self.reward_max = reward if self.reward_max is None else max(self.reward_max, reward)
+        if self.first_success_step is None and reward >= self.success_reward:
+            self.first_success_step = step - self.episode_start_step
+        for name in terminations:
+            self.termination_counts[name] = self.termination_counts.get(name, 0) + 1
+
+        sample = {
+            "type": "sample",
+            "episode": self.episode,
+            "step": step,
+            "reward": reward,
+            "terms": terms,
+            "terminations": terminations,
+            "reward_sum": self.reward_sum,
+            "reward_max": self.reward_max,
+            "first_success_step": self.first_success_step,
+        }
+        self.last_sample = sample
+        self._publish(sample)
+        return sample
+
+    def summary(self, reason: str = "") -> dict:
+        """The accumulated values of the current episode"""
+        steps = 0 if self.episode_start_step is None else self.last_step - self.episode_start_step
+        return {
+            "type": "episode",
+            "episode": self.episode,
+            "reason": reason,
+            "steps": steps,
+            "samples": self.samples,
+            "reward_sum": self.reward_sum,
+            "reward_max": self.reward_max,
+            "first_success_step": self.first_success_step,
+            "terminations": dict(self.termination_counts),
+        }
+
+    def end_episode(self, reason: str = "") -> Optional[dict]:
+        """Publish the summary of the current episode and start a new one
+
+        Args:
+            reason: why the episode ended, e.g. "reset_object" or "reset_all"
+
+        Returns:
+            the episode summary, None if nothing was sampled in the episode
+        """
+        if not self.enabled or self.samples == 0:
+            self._reset_episode()
+            return None
+        summary = self.summary(reason)
+        self.last_summary = summary
+        self._publish(summary)
+        print(f"[RewardTelemetry] episode {self.episode} ({reason}): reward sum {summary['reward_sum']:.3f}, "
+              f"max {summary['reward_max']:.3f}, first success step {summary['first_success_step']}")
+        self.episode += 1
+        self._reset_episode()
+        return summary
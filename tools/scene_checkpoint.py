@@ -0,0 +1,155 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Scene checkpoints
+Snapshots of the scene state (the nested dict of InteractiveScene.get_state(): articulation joint and root
+states, rigid object root states, ...) kept in preallocated device buffers, so a reset is a copy into a slot
+and a scene.reset_to() from it, without going through JSON, lists or host memory.
+
+Checkpoints are named slots; when all slots are used the least recently used checkpoint is overwritten.
+Any object with the same get_state(is_relative) / reset_to(state, env_ids, is_relative) methods can be used
+as the scene.
+
+Usage:
+    checkpoints = SceneCheckpointManager(env.scene, max_checkpoints=8)
+    checkpoints.save("initial")
+    ...
+    checkpoints.restore("initial")
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+import torch
+
+
+def _map_state(state, fn):
+    """apply fn to every tensor of a nested state dict"""
+    if isinstance(state, dict):
+        return {key: _map_state(value, fn) for key, value in state.items()}
+    if isinstance(state, torch.Tensor):
+        return fn(state)
+    return state
+
+
+def _copy_state(dst, src):
+    """copy a nested state dict into buffers of the same structure"""
+    for key, value in dst.items():
+        if isinstance(value, dict):
+            _copy_state(value, src[key])
+        elif isinstance(value, torch.Tensor):
+            value.copy_(src[key], non_blocking=True)
+
+
+def state_to_device(state, device):
+    """move every tensor of a nested state dict to device (one copy per tensor, done once instead of per reset)"""
+    return _map_state(state, lambda tensor: tensor.to(device, non_blocking=True))
+
+
+class SceneCheckpointManager:
+    """Named, LRU-evicted scene state checkpoints in preallocated buffers"""
+
+    def __init__(self, scene, max_checkpoints: int = 8, device=None):
+        """
+        Args:
+            scene: the scene (env.scene) or any object with get_state/reset_to
+            max_checkpoints: number of preallocated slots
+            device: device of the buffers, default the scene device
+        """
+        if max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
+        self.scene = scene
+        self.max_checkpoints = max_checkpoints
+        self.device = device if device is not None else getattr(scene, "device", None)
+        self._slots = []                      # preallocated state buffers, created from the first state
+        self._checkpoints = OrderedDict()     # name -> (slot index, is_relative, whole scene), least recently used first
+        self._free_slots = []
+        self._auto_name = 0
+
+    def _allocate(self, template):
+        device = self.device
+        self._slots = [
+            _map_state(template, lambda tensor: torch.empty_like(tensor, device=device or tensor.device))
+            for _ in range(self.max_checkpoints)
+        ]
+        self._free_slots = list(range(self.max_checkpoints))
+
+    def _acquire_slot(self, name: str) -> int:
+        if name in self._checkpoints:
+            return self._checkpoints.pop(name)[0]
+        if self._free_slots:
+            return self._free_slots.pop(0)
+        _, (slot, _, _) = self._checkpoints.popitem(last=False)
+        return slot
+
+    def save(self, name: Optional[str] = None, state: Optional[dict] = None, is_relative: bool = False) -> str:
+        """Snapshot the scene state into a slot
+
+        Args:
+            name: checkpoint name, an existing checkpoint of the same name is overwritten, None for an automatic name
+            state: a state dict to store instead of the current scene state (e.g. a loaded replay state),
+                holding the rows of the env_ids it will be restored to
+            is_relative: the state positions are relative to the env origins
+
+        Returns:
+            the checkpoint name
+        """
+        whole_scene = state is None
+        if whole_scene:
+            state = self.scene.get_state(is_relative=is_relative)
+        if not self._slots:
+            self._allocate(state)
+        if name is None:
+            name = f"checkpoint_{self._auto_name}"
+            self._auto_name += 1
+        slot = self._acquire_slot(name)
+        _copy_state(self._slots[slot], state)
+        self._checkpoints[name] = (slot, is_relative, whole_scene)
+        return name
+
+    def restore(self, name: str, env_ids: Optional[torch.Tensor] = None) -> bool:
+        """Write a checkpoint back to the scene
+
+        Args:
+            name: the checkpoint name
+            env_ids: the envs to restore, all envs if None (the rows of a whole-scene checkpoint are selected)
+
+        Returns:
+            False if there is no checkpoint of that name
+        """
+        entry = self._checkpoints.get(name)
+        if entry is None:
+            print(f"[SceneCheckpointManager] checkpoint {name} not found")
+            return False
+        slot, is_relative, whole_scene = entry
+        self._checkpoints.move_to_end(name)
+        state = self._slots[slot]
+        if whole_scene and env_ids is not None:
+            # reset_to takes one row per env id
+            state = _map_state(state, lambda tensor: tensor[env_ids])
+        self.scene.reset_to(state, env_ids, is_relative=is_relative)
+        return True
+
+    def get(self, name: str) -> Optional[dict]:
+        """The buffers of a checkpoint (valid until the slot is reused), None if not found"""
+        entry = self._checkpoints.get(name)
+        return None if entry is None else self._slots[entry[0]]
+
+    def delete(self, name: str):
+        entry = self._checkpoints.pop(name, None)
+        if entry is not None:
+            self._free_slots.append(entry[0])
+
+    def clear(self):
+        self._free_slots = list(range(len(self._slots)))
+        self._checkpoints.clear()
+
+    def names(self):
+        """Checkpoint names, least recently used first"""
+        return list(self._checkpoints.keys())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._checkpoints
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
@@ -0,0 +1,78 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Sim clock
+The sim time of this process: the number of control steps and the sim seconds they advanced. The
+RobotController owns the clock and advances it once per step, before the step runs, so everything
+produced during a step (images, robot state) is stamped with the sim time it belongs to.
+
+Stamps derived from the clock (image shared memory header, LowState_.tick, sim_state snapshots) follow sim
+time instead of wall time, so they stay consistent when the sim runs slower or faster than real time
+(--real_time_factor). The controller publishes the clock itself on rt/sim_clock right after every step
+(SimClockDDS.write_clock in dds/sim_clock_dds.py).
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+def parse_real_time_factor(text: str) -> Optional[float]:
+    """Parse a --real_time_factor value
+
+    Returns:
+        None for "step_hz" (pace at the control frequency), 0.0 for "max"/"inf"/0 (unbounded),
+        otherwise the positive factor
+    """
+    text = str(text).strip().lower()
+    if text in ("", "none", "step_hz"):
+        return None
+    if text in ("max", "inf", "unbounded"):
+        return 0.0
+    try:
+        factor = float(text)
+    except ValueError:
+        raise ValueError(f"real time factor must be a number, max or step_hz, got {text}")
+    if factor < 0:
+        raise ValueError(f"real time factor must not be negative, got {text}")
+    return 0.0 if factor == float("inf") else factor
+
+
+class SimClock:
+    """Step index and sim time of this process"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.step = 0
+        self.sim_time = 0.0
+        self._wall_start = time.perf_counter()
+
+    def advance(self, dt: float, steps: int = 1):
+        """Advance by steps control steps of dt sim seconds in total"""
+        with self.lock:
+            self.step += steps
+            self.sim_time += dt
+
+    def reset(self):
+        with self.lock:
+            self.step = 0
+            self.sim_time = 0.0
+            self._wall_start = time.perf_counter()
+
+    def stamp(self) -> dict:
+        """The clock as JSON fields of state messages"""
+        with self.lock:
+            return {"sim_step": self.step, "sim_time": self.sim_time}
+
+    def sim_time_ms(self) -> int:
+        """Sim time in whole milliseconds"""
+        return int(self.sim_time * 1000.0)
+
+    def real_time_factor(self) -> float:
+        """Sim seconds per wall second since the start (or the last reset)"""
+        elapsed = time.perf_counter() - self._wall_start
+        return self.sim_time / elapsed if elapsed > 0 else 0.0
+
+
+# the clock of this process, advanced by the RobotController
+sim_clock = SimClock()
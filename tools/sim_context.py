@@ -0,0 +1,78 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Simulation context
+Owns the process-wide resources the observation terms publish to: the multi-image shared memory writer
+and the DDS objects. Nothing is created when a task config or observation module is imported;
+each resource is created the first time an observation term needs it.
+
+sim_main.py creates the context, installs it with set_sim_context() and closes it on shutdown.
+Without an installed context a default one is created on first use, with the same lazy behavior.
+"""
+
+from typing import Optional
+
+
+class SimContext:
+    """Lazily created publishing resources of one sim process"""
+
+    def __init__(self, enable_image_writer: bool = True, enable_dds: bool = True):
+        """
+        Args:
+            enable_image_writer: allow camera observations to write the image shared memory
+            enable_dds: allow state observations to publish through DDS
+        """
+        self.enable_image_writer = enable_image_writer
+        self.enable_dds = enable_dds
+        self._multi_image_writer = None
+        self._dds_manager = None
+
+    @property
+    def multi_image_writer(self):
+        """The multi-image shared memory writer, created on first access (None if disabled)"""
+        if self._multi_image_writer is None and self.enable_image_writer:
+            from image_server.shared_memory_utils import MultiImageWriter
+            self._multi_image_writer = MultiImageWriter()
+        return self._multi_image_writer
+
+    @property
+    def dds_manager(self):
+        """The DDS manager, imported on first access (None if disabled)"""
+        if self._dds_manager is None and self.enable_dds:
+            from dds.dds_master import dds_manager
+            self._dds_manager = dds_manager
+        return self._dds_manager
+
+    def get_dds_object(self, name: str):
+        """Get a registered DDS object, None if DDS is disabled or the object is not registered"""
+        manager = self.dds_manager
+        if manager is None:
+            return None
+        return manager.get_object(name)
+
+    def close(self, unlink: bool = False):
+        """Release the resources created by this context
+
+        Args:
+            unlink: also remove the image shared memory (benchmarks and tests, nothing reads it afterwards)
+        """
+        if self._multi_image_writer is not None:
+            self._multi_image_writer.close(unlink=unlink)
+            self._multi_image_writer = None
+
+
+_sim_context: Optional[SimContext] = None
+
+
+def set_sim_context(context: Optional[SimContext]):
+    """Install the context used by the observation terms"""
+    global _sim_context
+    _sim_context = context
+
+
+def get_sim_context() -> SimContext:
+    """Get the installed context, creating a default one on first use"""
+    global _sim_context
+    if _sim_context is None:
+        _sim_context = SimContext()
+    return _sim_context
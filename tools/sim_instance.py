@@ -0,0 +1,81 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Simulation instance namespace
+Derive the shared memory names, image server port and DDS domain of one sim instance,
+so that several sim_main.py processes can run on the same host without clobbering each other.
+
+The instance is selected through environment variables (set by sim_main.py from --instance_id),
+so every module and helper process resolves the same names without passing arguments around.
+Instance 0 keeps the historical names (isaac_multi_image_shm, port 5555, DDS domain 1).
+"""
+
+import os
+
+INSTANCE_ID_ENV = "SIM_INSTANCE_ID"
+DDS_DOMAIN_ENV = "SIM_DDS_DOMAIN_ID"
+IMAGE_PORT_ENV = "SIM_IMAGE_PORT"
+
+BASE_DDS_DOMAIN_ID = 1
+BASE_IMAGE_PORT = 5555
+# the 16-bit depth stream is published on image port + DEPTH_PORT_OFFSET
+DEPTH_PORT_OFFSET = 1000
+
+
+def set_instance(instance_id: int = 0, dds_domain_id: int = None, image_port: int = None):
+    """Select the sim instance for this process and its children
+
+    Args:
+        instance_id: the instance index, 0 keeps the default names
+        dds_domain_id: explicit DDS domain, default BASE_DDS_DOMAIN_ID + instance_id
+        image_port: explicit ZMQ image port, default BASE_IMAGE_PORT + instance_id
+    """
+    if instance_id < 0:
+        raise ValueError(f"instance_id must be >= 0, got {instance_id}")
+    os.environ[INSTANCE_ID_ENV] = str(instance_id)
+    if dds_domain_id is not None:
+        os.environ[DDS_DOMAIN_ENV] = str(dds_domain_id)
+    if image_port is not None:
+        os.environ[IMAGE_PORT_ENV] = str(image_port)
+
+
+def get_instance_id() -> int:
+    """Get the current instance index"""
+    return int(os.environ.get(INSTANCE_ID_ENV, "0"))
+
+
+def instance_shm_name(base_name: str) -> str:
+    """Namespace a shared memory segment name with the instance index
+
+    Args:
+        base_name: the shared memory name used by instance 0
+    """
+    instance_id = get_instance_id()
+    if instance_id == 0:
+        return base_name
+    return f"{base_name}_i{instance_id}"
+
+
+def dds_domain_id() -> int:
+    """Get the DDS domain of the current instance"""
+    if DDS_DOMAIN_ENV in os.environ:
+        return int(os.environ[DDS_DOMAIN_ENV])
+    return BASE_DDS_DOMAIN_ID + get_instance_id()
+
+
+def image_port() -> int:
+    """Get the ZMQ image server port of the current instance"""
+    if IMAGE_PORT_ENV in os.environ:
+        return int(os.environ[IMAGE_PORT_ENV])
+    return BASE_IMAGE_PORT + get_instance_id()
+
+
+def depth_image_port() -> int:
+    """Get the ZMQ depth image port of the current instance"""
+    return image_port() + DEPTH_PORT_OFFSET
+
+
+def describe_instance() -> str:
+    """One-line summary of the current instance for startup logs"""
+    return (f"instance {get_instance_id()}: DDS domain {dds_domain_id()}, "
+            f"image port {image_port()}, shm suffix '{instance_shm_name('')}'")
@@ -0,0 +1,277 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Streaming USDA rewriter
+Rewrites .usda files line by line: lines are read from a generator, passed through a list of rules and
+written to a buffered output file, so memory use does not depend on the file size (robot USDAs with inlined
+meshes can be gigabytes). The output is written to a temporary file next to the target and moved into place
+when done, so the input can also be rewritten in place.
+
+The rewriter tracks the prim the current line belongs to (the last "def"/"over"/"class" line), the current
+link (the last Xform that is not "visuals" or "collisions") and whether the line is inside the metadata
+parentheses of a "visuals" or "collisions" Xform. Rules see this context:
+
+    InstanceableRule("visuals", False)                      instanceable = false on every visuals Xform
+    InstanceableRule("collisions", False, links={...})      only on the collisions of the given links
+    AttributeOverrideRule("physics:mass", "0.1", prims={...}) replace single-line attribute values
+
+Usage:
+    python tools/usda_rewriter.py robot.usda --visuals_instanceable false --suffix _edit
+    python tools/usda_rewriter.py a.usda b.usda --collisions_instanceable false --links left_hand_index_0_link \\
+        --set left_hand_index_0_link/physics:mass=0.1 --output_dir ./edited --workers 4
+"""
+
+import os
+import re
+import sys
+import stat
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+# buffer size of the input and output files
+BUFFER_SIZE = 1 << 20
+
+_DEF_RE = re.compile(r'^\s*(?:def|over|class)\s+(?:(\w+)\s+)?"([^"]+)"')
+_INSTANCEABLE_RE = re.compile(r'^(\s*instanceable\s*=\s*)(true|false)(\s*)$')
+_METADATA_BLOCKS = ("visuals", "collisions")
+
+
+class UsdaContext:
+    """Where the current line is in the prim hierarchy"""
+
+    def __init__(self):
+        self.prim: Optional[str] = None    # name of the last defined prim
+        self.link: Optional[str] = None    # name of the last Xform that is not visuals/collisions
+        self.block: Optional[str] = None   # "visuals"/"collisions" while inside the metadata of that Xform
+        self._block_closed = False
+
+    def update(self, line: str):
+        """Update the context for a line, before the rules see it"""
+        if self.block is not None and self._block_closed:
+            self.block = None
+        match = _DEF_RE.match(line) if '"' in line else None
+        if match is None:
+            # the line closing the metadata still belongs to the block
+            if self.block is not None and line.rstrip().endswith(")"):
+                self._block_closed = True
+            return
+        prim_type, name = match.groups()
+        self.prim = name
+        if prim_type != "Xform":
+            return
+        if name in _METADATA_BLOCKS:
+            opened = line.rstrip().endswith("(")
+            self.block = name if opened else None
+            self._block_closed = False
+        else:
+            self.link = name
+            self.block = None
+
+
+class UsdaRule:
+    """A line rewrite rule; apply returns the (possibly changed) line"""
+
+    def apply(self, line: str, context: UsdaContext) -> str:
+        return line
+
+
+class InstanceableRule(UsdaRule):
+    """Set the instanceable flag in the metadata of visuals or collisions Xforms"""
+
+    def __init__(self, block: str, value: bool, links: Optional[Set[str]] = None):
+        """
+        Args:
+            block: "visuals" or "collisions"
+            value: the instanceable value to write
+            links: only under these links, None for every link
+        """
+        if block not in _METADATA_BLOCKS:
+            raise ValueError(f"block must be one of {_METADATA_BLOCKS}, got {block}")
+        self.block = block
+        self.value = "true" if value else "false"
+        self.links = set(links) if links is not None else None
+
+    def apply(self, line: str, context: UsdaContext) -> str:
+        if context.block != self.block:
+            return line
+        if self.links is not None and context.link not in self.links:
+            return line
+        match = _INSTANCEABLE_RE.match(line)
+        if match is None:
+            return line
+        return f"{match.group(1)}{self.value}{match.group(3)}"
+
+
+class AttributeOverrideRule(UsdaRule):
+    """Replace the value of a single-line attribute, e.g. "float physics:mass = 1.0" """
+
+    def __init__(self, attr_name: str, value: str, prims: Optional[Set[str]] = None):
+        """
+        Args:
+            attr_name: the attribute name
+            value: the new value, written as is (USDA syntax)
+            prims: only on these prims, None for every prim
+        """
+        self.value = value
+        self.prims = set(prims) if prims is not None else None
+        self.pattern = re.compile(
+            r'^(\s*(?:custom\s+)?(?:uniform\s+)?[\w\[\]]+\s+' + re.escape(attr_name) + r'\s*=\s*)([^(\n]*?)(\s*(?:\(.*)?\n?)$')
+
+    def apply(self, line: str, context: UsdaContext) -> str:
+        if self.prims is not None and context.prim not in self.prims:
+            return line
+        match = self.pattern.match(line)
+        if match is None or not match.group(2):
+            return line
+        return f"{match.group(1)}{self.value}{match.group(3)}"
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    """Read a file line by line"""
+    with open(path, "r", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        for line in f:
+            yield line
+
+
+def rewrite_lines(lines: Iterable[str], rules: List[UsdaRule]) -> Iterator[Tuple[str, str]]:
+    """Pass every line through the rules
+
+    Yields:
+        (original line, rewritten line)
+    """
+    context = UsdaContext()
+    for original in lines:
+        context.update(original)
+        line = original
+        for rule in rules:
+            line = rule.apply(line, context)
+        yield original, line
+
+
+def rewrite_usda(input_file: str, output_file: str, rules: List[UsdaRule]) -> int:
+    """Rewrite one USDA file
+
+    Args:
+        input_file: the input .usda
+        output_file: the output .usda, can be the input file
+        rules: the rules applied to every line
+
+    Returns:
+        the number of changed lines
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(output_dir, exist_ok=True)
+    changed = 0
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".usda.tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=BUFFER_SIZE) as out:
+            for original, line in rewrite_lines(iter_lines(input_file), rules):
+                if line != original:
+                    changed += 1
+                out.write(line)
+        # mkstemp creates the file with mode 0600, the output keeps the mode of the input
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(input_file).st_mode))
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return changed
+
+
+def _rewrite_job(job):
+    input_file, output_file, rules = job
+    try:
+        return input_file, output_file, rewrite_usda(input_file, output_file, rules), None
+    except Exception as e:
+        return input_file, output_file, 0, str(e)
+
+
+def rewrite_many(jobs, workers: int = 1):
+    """Rewrite several files, in parallel processes when workers > 1
+
+    Args:
+        jobs: (input_file, output_file, rules) tuples
+        workers: number of processes
+
+    Yields:
+        (input_file, output_file, changed lines, error message or None) in the order of the jobs
+    """
+    jobs = list(jobs)
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _rewrite_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        for result in executor.map(_rewrite_job, jobs):
+            yield result
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise ValueError(f"expected true or false, got {value}")
+
+
+def build_rules(visuals_instanceable: Optional[str] = None, collisions_instanceable: Optional[str] = None,
+                links: Optional[List[str]] = None, overrides: Optional[List[str]] = None) -> List[UsdaRule]:
+    """Build the rules of the command line options
+
+    Args:
+        visuals_instanceable: "true"/"false" for the visuals Xforms, None to keep them
+        collisions_instanceable: "true"/"false" for the collisions Xforms, None to keep them
+        links: the links the instanceable rules are limited to, None or empty for every link
+        overrides: "attr=value" (every prim) or "prim/attr=value" attribute overrides
+    """
+    rules: List[UsdaRule] = []
+    link_set = set(links) if links else None
+    if visuals_instanceable is not None:
+        rules.append(InstanceableRule("visuals", _parse_bool(visuals_instanceable), link_set))
+    if collisions_instanceable is not None:
+        rules.append(InstanceableRule("collisions", _parse_bool(collisions_instanceable), link_set))
+    for override in overrides or []:
+        target, _, value = override.partition("=")
+        if not target or not value:
+            raise ValueError(f"override must be [prim/]attr=value, got {override}")
+        prim, _, attr_name = target.rpartition("/")
+        rules.append(AttributeOverrideRule(attr_name, value, {prim} if prim else None))
+    return rules
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Rewrite USDA files line by line in constant memory")
+    parser.add_argument("files", nargs="+", help="input .usda files")
+    parser.add_argument("--output_dir", type=str, default=None, help="output directory (default: next to the input)")
+    parser.add_argument("--suffix", type=str, default="_edit", help="output file name suffix, empty to rewrite in place")
+    parser.add_argument("--visuals_instanceable", type=str, default=None, help="set instanceable of visuals Xforms: true/false")
+    parser.add_argument("--collisions_instanceable", type=str, default=None, help="set instanceable of collisions Xforms: true/false")
+    parser.add_argument("--links", nargs="*", default=None, help="limit the instanceable rules to these links")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], help="attribute override [prim/]attr=value, repeatable")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of parallel processes")
+    args = parser.parse_args(argv)
+
+    rules = build_rules(args.visuals_instanceable, args.collisions_instanceable, args.links, args.overrides)
+    if not rules:
+        parser.error("no rules given")
+    jobs = []
+    for input_file in args.files:
+        stem, ext = os.path.splitext(os.path.basename(input_file))
+        output_dir = args.output_dir or os.path.dirname(os.path.abspath(input_file))
+        jobs.append((input_file, os.path.join(output_dir, f"{stem}{args.suffix}{ext}"), rules))
+
+    failed = 0
+    for input_file, output_file, changed, error in rewrite_many(jobs, args.workers):
+        if error is not None:
+            failed += 1
+            print(f"[usda_rewriter] ❌ {input_file}: {error}")
+        else:
+            print(f"[usda_rewriter] {input_file} -> {output_file}: {changed} lines changed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# Copyright (c) 2025, Unitree Robotics Co., Ltd. All Rights Reserved.
+# License: Apache License, Version 2.0
+"""
+Video container storage for recorded episodes
+Each camera stream of an episode is written into one MJPEG-in-AVI file instead of one JPEG per frame.
+Every MJPEG frame is a key frame, so random frames can be decoded by seeking without decoding their neighbours.
+
+Frames are referenced from data.json as "<stream file>#<frame number>", e.g. "colors/color_0.avi#123",
+and every stream file has an index table "<stream file>.index.json" mapping frame numbers to item idx.
+"""
+
+import os
+import json
+import cv2
+
+VIDEO_EXT = ".avi"
+INDEX_SUFFIX = ".index.json"
+FRAME_REF_SEP = "#"
+
+
+def make_frame_ref(rel_path: str, frame_id: int) -> str:
+    """Build the data.json reference of one frame in a stream file"""
+    return f"{rel_path}{FRAME_REF_SEP}{frame_id}"
+
+
+def parse_frame_ref(ref: str):
+    """Split a data.json image reference into (stream file, frame number)
+
+    Returns:
+        (rel_path, frame_id) for video references, None for plain image files
+    """
+    if not ref or FRAME_REF_SEP not in ref:
+        return None
+    rel_path, frame_id = ref.rsplit(FRAME_REF_SEP, 1)
+    if not frame_id.isdigit():
+        return None
+    return rel_path, int(frame_id)
+
+
+class VideoStreamWriter:
+    """Append frames of one camera stream to a video file and record its frame index table"""
+
+    def __init__(self, file_path: str, fps: float = 30, fourcc: str = "MJPG"):
+        """
+        Args:
+            file_path: the video file to write, the index table is written next to it
+            fps: the nominal frame rate stored in the container
+            fourcc: the codec, MJPG keeps every frame independently decodable
+        """
+        self.file_path = file_path
+        self.fps = fps
+        self.fourcc = fourcc
+        self.writer = None
+        self.frame_size = None
+        self.is_color = True
+        self.frames = []  # item idx of every written frame
+
+    def write(self, frame, item_idx: int) -> int:
+        """Append one frame
+
+        Args:
+            frame: HxWx3 BGR or HxW single channel uint8 image
+            item_idx: the episode item the frame belongs to
+
+        Returns:
+            the frame number inside the stream
+        """
+        if self.writer is None:
+            height, width = frame.shape[:2]
+            self.frame_size = (width, height)
+            self.is_color = frame.ndim == 3
+            self.writer = cv2.VideoWriter(self.file_path, cv2.VideoWriter_fourcc(*self.fourcc),
+                                          self.fps, self.frame_size, self.is_color)
+            if not self.writer.isOpened():
+                raise RuntimeError(f"[VideoStreamWriter] failed to open {self.file_path}")
+        self.writer.write(frame)
+        self.frames.append(item_idx)
+        return len(self.frames) - 1
+
+    def close(self):
+        """Finish the video file and write the index table"""
+        if self.writer is None:
+            return
+        self.writer.release()
+        self.writer = None
+        index = {
+            "fps": self.fps,
+            "fourcc": self.fourcc,
+            "width": self.frame_size[0],
+            "height": self.frame_size[1],
+            "color": self.is_color,
+            "frames": self.frames,
+        }
+        with open(self.file_path + INDEX_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+
+
+class VideoFrameReader:
+    """Decode random frames of one stream file
+
+    Sequential reads continue from the current decoder position, other reads seek first.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.capture = None
+        self.next_frame = 0
+        self.index = None
+        index_path = file_path + INDEX_SUFFIX
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def __len__(self):
+        if self.index is not None:
+            return len(self.index["frames"])
+        self._open()
+        return int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def _open(self):
+        if self.capture is None:
+            self.capture = cv2.VideoCapture(self.file_path)
+            if not self.capture.isOpened():
+                raise RuntimeError(f"[VideoFrameReader] failed to open {self.file_path}")
+            self.next_frame = 0
+
+    def read(self, frame_id: int):
+        """Decode one frame
+
+        Args:
+            frame_id: the frame number inside the stream
+
+        Returns:
+            the BGR image, or None if the frame cannot be decoded
+        """
+        self._open()
+        if frame_id != self.next_frame:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
+        ok, frame = self.capture.read()
+        if not ok:
+            self.next_frame = -1  # force a seek on the next read
+            return None
+        self.next_frame = frame_id + 1
+        return frame
+
+    def close(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+
+class VideoFrameCache:
+    """Keep one VideoFrameReader per stream file of an episode"""
+
+    def __init__(self):
+        self.readers = {}
+
+    def read(self, dir_path: str, ref: str):
+        """Decode the frame behind a data.json reference
+
+        Returns:
+            the BGR image, or None if ref is not a video reference or cannot be decoded
+        """
+        parsed = parse_frame_ref(ref)
+        if parsed is None:
+            return None
+        rel_path, frame_id = parsed
+        file_path = os.path.join(dir_path, rel_path)
+        reader = self.readers.get(file_path)
+        if reader is None:
+            if not os.path.exists(file_path):
+                return None
+            reader = VideoFrameReader(file_path)
+            self.readers[file_path] = reader
+        return reader.read(frame_id)
+
+    def close(self):
+        for reader in self.readers.values():
+            reader.close()
+        self.readers = {}